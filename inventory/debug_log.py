@@ -0,0 +1,83 @@
+"""
+Write-behind appender for the debug-session log files.
+
+Request threads only enqueue already-serialized lines. A single daemon thread drains
+the queue and appends every pending line for a file with one write(), so concurrent
+requests share the open/write cost instead of each paying it on the request path.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# A batch is written once it holds MAX_BATCH lines or FLUSH_INTERVAL seconds have
+# passed since its first line arrived, whichever comes first.
+MAX_BATCH = 256
+FLUSH_INTERVAL = 0.05
+# Lines beyond this many waiting to be written are dropped rather than held in memory
+MAX_PENDING = 10_000
+
+_queue = queue.Queue(maxsize=MAX_PENDING)
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def emit(path, line):
+    """Queue one serialized log line (bytes, without trailing newline) for path."""
+    _ensure_writer()
+    try:
+        _queue.put_nowait((path, line))
+    except queue.Full:
+        pass
+
+
+def flush():
+    """Block until every line queued so far has been written."""
+    _queue.join()
+
+
+def _ensure_writer():
+    # Started lazily (and restarted if missing) so forked worker processes get their own
+    # writer instead of inheriting a dead thread from the parent.
+    global _writer
+    if _writer is not None and _writer.is_alive():
+        return
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_drain, name="debug-log-writer", daemon=True)
+            _writer.start()
+
+
+def _drain():
+    while True:
+        batch = [_queue.get()]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _write(batch)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def _write(batch):
+    lines_by_path = defaultdict(list)
+    for path, line in batch:
+        lines_by_path[path].append(line)
+    for path, lines in lines_by_path.items():
+        try:
+            with open(path, "ab") as f:
+                f.write(b"\n".join(lines) + b"\n")
+        except Exception as e:
+            logger.warning("Failed to write debug log %s: %s", path, e)
@@ -0,0 +1,38 @@
+"""
+DRF exception handling.
+"""
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import exception_handler as drf_exception_handler
+
+
+def format_validation_detail(detail):
+    """Flatten a ValidationError detail into one "field: msg, msg; field: msg" line."""
+    if isinstance(detail, dict):
+        parts = []
+        for field, messages in detail.items():
+            if isinstance(messages, list):
+                parts.append(f"{field}: {', '.join(str(m) for m in messages)}")
+            else:
+                parts.append(f"{field}: {messages}")
+        return "; ".join(parts) or "Validation failed"
+    if isinstance(detail, list):
+        return "; ".join(str(m) for m in detail)
+    return str(detail)
+
+
+def exception_handler(exc, context):
+    """
+    DRF's default handler, plus an {"error": ..., "details": ...} envelope for validation
+    errors raised by the viewset actions listed in `validation_error_envelope_actions`.
+    Every other response keeps DRF's stock shape.
+    """
+    response = drf_exception_handler(exc, context)
+    view = context.get("view")
+    if (
+        response is not None
+        and isinstance(exc, ValidationError)
+        and getattr(view, "action", None) in getattr(view, "validation_error_envelope_actions", ())
+    ):
+        response.data = {"error": format_validation_detail(exc.detail), "details": exc.detail}
+    return response
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory", "0048_unique_product_brand_model_series_product_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="idempotency_fingerprint",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 of the request that created this order under its idempotency key",
+                max_length=64,
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory", "0050_user_email_upper_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reservationrequest",
+            index=models.Index(
+                condition=models.Q(("status", "PE")),
+                fields=["-requested_at"],
+                name="reservation_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="returnrequest",
+            index=models.Index(
+                condition=models.Q(("status", "PE")),
+                fields=["-requested_at"],
+                name="return_request_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="unittransfer",
+            index=models.Index(
+                condition=models.Q(("status", "PE")),
+                fields=["-requested_at"],
+                name="unit_transfer_pending_idx",
+            ),
+        ),
+    ]
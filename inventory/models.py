@@ -8,6 +8,8 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -32,6 +34,12 @@ class User(AbstractUser):
             return True
         return False
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # email__iexact compiles to UPPER(email) = UPPER(%s) on PostgreSQL
+            models.Index(Upper("email"), name="user_email_upper_idx"),
+        ]
+
 
 class AdminRole(models.Model):
     """Model representing admin roles in the system."""
@@ -85,6 +93,9 @@ class Admin(models.Model):
 
     def has_role(self, role_code):
         """Check if admin has a specific role."""
+        if "roles" in getattr(self, "_prefetched_objects_cache", {}):
+            # Roles were prefetched; answer from memory instead of querying again
+            return any(role.name == role_code for role in self.roles.all())
         return self.roles.filter(name=role_code).exists()
 
     @property
@@ -866,6 +877,12 @@ class Order(models.Model):
         db_index=True,
         help_text="Idempotency key to prevent duplicate orders from retries or double-clicks",
     )
+    idempotency_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 of the request that created this order under its idempotency key",
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(
@@ -1328,6 +1345,14 @@ class ReservationRequest(models.Model):
         verbose_name = "Reservation Request"
         verbose_name_plural = "Reservation Requests"
         # Remove unique_together since we now have multiple units per request
+        indexes = [
+            # Pending counts and the approval queue only touch the (few) pending rows
+            models.Index(
+                fields=["-requested_at"],
+                name="reservation_pending_idx",
+                condition=Q(status="PE"),
+            ),
+        ]
 
     def __str__(self):
         unit_count = self.inventory_units.count()
@@ -1350,6 +1375,12 @@ class ReservationRequest(models.Model):
                 self.expires_at = self.approved_at + timedelta(days=2)
             else:
                 self.expires_at = timezone.now() + timedelta(days=2)
+        # Store unit ids as string keys, the form they come back in from the database, so
+        # readers only ever look up str(unit.id)
+        if self.inventory_unit_quantities:
+            self.inventory_unit_quantities = {
+                str(unit_id): qty for unit_id, qty in self.inventory_unit_quantities.items()
+            }
         super().save(*args, **kwargs)
 
 
@@ -1394,6 +1425,13 @@ class ReturnRequest(models.Model):
         ordering = ["-requested_at"]
         verbose_name = "Return Request"
         verbose_name_plural = "Return Requests"
+        indexes = [
+            models.Index(
+                fields=["-requested_at"],
+                name="return_request_pending_idx",
+                condition=Q(status="PE"),
+            ),
+        ]
 
     def __str__(self):
         unit_count = self.inventory_units.count()
@@ -1445,6 +1483,13 @@ class UnitTransfer(models.Model):
         ordering = ["-requested_at"]
         verbose_name = "Unit Transfer"
         verbose_name_plural = "Unit Transfers"
+        indexes = [
+            models.Index(
+                fields=["-requested_at"],
+                name="unit_transfer_pending_idx",
+                condition=Q(status="PE"),
+            ),
+        ]
 
     def __str__(self):
         return f"Transfer #{self.id} - Unit {self.inventory_unit.id} from {self.from_salesperson.user.username} to {self.to_salesperson.user.username} ({self.get_status_display()})"
@@ -1485,6 +1530,10 @@ class Notification(models.Model):
         indexes = [
             models.Index(fields=["recipient", "is_read"]),
             models.Index(fields=["recipient", "-created_at"]),
+            # Unread rows are a small slice of each user's history; counting them stays cheap
+            models.Index(
+                fields=["recipient"], name="notification_unread_idx", condition=Q(is_read=False)
+            ),
         ]
 
     def __str__(self):
@@ -2175,6 +2224,8 @@ class AuditLog(models.Model):
         indexes = [
             models.Index(fields=["-timestamp", "user"]),
             models.Index(fields=["model_name", "-timestamp"]),
+            # ?user_id= filter walked in timestamp order
+            models.Index(fields=["user", "-timestamp"], name="auditlog_user_timestamp_idx"),
         ]
 
     def __str__(self):
@@ -43,7 +43,7 @@ class IsContentCreatorOrInventoryManagerOrReadOnly(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -149,6 +149,38 @@ class IsReviewOwnerOrAdmin(permissions.BasePermission):
 # -------------------------------------------------------------------------
 
 
+_UNSET = object()
+
+
+def get_request_admin(request, prefetch_related=("roles",)):
+    """
+    Admin profile of the requesting user, or None.
+    Resolved at most once per request and memoized on the request itself, so permission
+    classes and views share one lookup; nothing is cached on the User instance.
+    """
+    admin = getattr(request, "_cached_admin", _UNSET)
+    if admin is _UNSET:
+        admin = None
+        user = request.user
+        if user and user.is_authenticated:
+            admin = (
+                Admin.objects.select_related("user")
+                .prefetch_related(*prefetch_related)
+                .filter(user=user)
+                .first()
+            )
+        request._cached_admin = admin
+    return admin
+
+
+def get_admin_from_request(request):
+    """Admin profile of a staff requester (see get_request_admin()); None for everyone else."""
+    user = request.user
+    if not user or not user.is_authenticated or not user.is_staff:
+        return None
+    return get_request_admin(request)
+
+
 def get_admin_from_user(user):
     """Helper function to get Admin instance from User."""
     if not user or not user.is_authenticated or not user.is_staff:
@@ -178,7 +210,7 @@ class HasRole(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -189,174 +221,20 @@ class IsSalesperson(permissions.BasePermission):
     """Permission to check if user has Salesperson role."""
 
     def has_permission(self, request, view):
-        import json
-
-        # Use PESAPAL_LOG_PATH from environment variable, fallback to /tmp/pesapal_debug.log
-        from django.conf import settings
-
-        log_path = getattr(settings, "PESAPAL_LOG_PATH", "/tmp/pesapal_debug.log")
-
-        # region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                            "location": "permissions.py:149",
-                            "message": "IsSalesperson.has_permission() ENTRY",
-                            "data": {
-                                "user_id": request.user.id
-                                if request.user and request.user.is_authenticated
-                                else None,
-                                "username": request.user.username
-                                if request.user and request.user.is_authenticated
-                                else None,
-                                "is_authenticated": request.user.is_authenticated
-                                if request.user
-                                else False,
-                                "is_staff": request.user.is_staff
-                                if request.user and request.user.is_authenticated
-                                else False,
-                                "is_superuser": request.user.is_superuser
-                                if request.user and request.user.is_authenticated
-                                else False,
-                                "view_action": view.action if hasattr(view, "action") else None,
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # endregion
-
         if not request.user or not request.user.is_authenticated:
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "A",
-                                "location": "permissions.py:151",
-                                "message": "IsSalesperson: User not authenticated",
-                                "data": {},
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-            except Exception:
-                pass
-            # endregion
             return False
 
         if request.user.is_superuser:
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "A",
-                                "location": "permissions.py:154",
-                                "message": "IsSalesperson: Superuser granted access",
-                                "data": {"username": request.user.username},
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-            except Exception:
-                pass
-            # endregion
             return True
 
         if not request.user.is_staff:
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "A",
-                                "location": "permissions.py:157",
-                                "message": "IsSalesperson: User is not staff",
-                                "data": {"username": request.user.username},
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-            except Exception:
-                pass
-            # endregion
-            return False
-
-        admin = get_admin_from_user(request.user)
+            return False
+
+        admin = get_admin_from_request(request)
         if not admin:
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "A",
-                                "location": "permissions.py:160",
-                                "message": "IsSalesperson: No admin profile found",
-                                "data": {"username": request.user.username},
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-            except Exception:
-                pass
-            # endregion
-            return False
-
-        is_salesperson = admin.is_salesperson
-
-        # region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                            "location": "permissions.py:163",
-                            "message": "IsSalesperson: Final check result",
-                            "data": {
-                                "admin_id": admin.id,
-                                "admin_code": admin.admin_code,
-                                "is_salesperson": is_salesperson,
-                                "roles": list(admin.roles.values_list("name", flat=True)),
-                                "permission_granted": is_salesperson,
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # endregion
-
-        return is_salesperson
+            return False
+
+        return admin.is_salesperson
 
 
 class IsInventoryManager(permissions.BasePermission):
@@ -372,7 +250,7 @@ class IsInventoryManager(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -392,7 +270,7 @@ class IsContentCreator(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -412,7 +290,7 @@ class IsSalespersonOrInventoryManager(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -432,7 +310,7 @@ class CanReserveUnits(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -455,7 +333,7 @@ class CanApproveRequests(permissions.BasePermission):
             logger.warning(f"CanApproveRequests: User {request.user.username} is not staff")
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             logger.warning(
                 f"CanApproveRequests: No Admin profile found for user {request.user.username}"
@@ -486,7 +364,7 @@ class CanCreateReviews(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -506,7 +384,7 @@ class IsMarketingManager(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -526,7 +404,7 @@ class IsOrderManager(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -552,7 +430,7 @@ class IsInventoryManagerOrMarketingManagerReadOnly(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -581,7 +459,7 @@ class IsBundleManagerOrReadOnly(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -618,7 +496,7 @@ class IsSalespersonOrInventoryManagerOrMarketingManagerReadOnly(permissions.Base
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -648,7 +526,7 @@ class IsContentCreatorOrInventoryManager(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -669,7 +547,7 @@ class IsInventoryManagerOrSuperuser(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -694,7 +572,7 @@ class IsInventoryManagerOrSalespersonReadOnly(permissions.BasePermission):
         if not request.user.is_staff:
             return False
 
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -729,7 +607,7 @@ class IsInventoryManagerOrReadOnly(permissions.BasePermission):
             return True
 
         # Write access only for inventory manager
-        admin = get_admin_from_user(request.user)
+        admin = get_admin_from_request(request)
         if not admin:
             return False
 
@@ -0,0 +1,30 @@
+"""
+Fast JSON rendering for API responses.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Datetimes are passed through to DRF's encoder so their wire format ("...Z", millisecond
+# precision) stays exactly what clients already receive from the stock JSONRenderer.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that serializes compact responses with orjson.
+    Types orjson does not handle natively (Decimal, lazy strings, querysets, ...) fall back
+    to DRF's encoder. Indented output (browsable API / ?indent) still uses the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=_fallback_encoder.default, option=_ORJSON_OPTIONS)
@@ -1119,6 +1119,18 @@ class ProductAccessorySerializer(serializers.ModelSerializer):
             )
         return sum(item.quantity for item in unit.order_items.all())
 
+    def _available_accessory_units(self, obj):
+        """(unit, available_qty) pairs for the accessory, computed once per row."""
+        cached = getattr(obj, "_available_accessory_units", None)
+        if cached is None:
+            cached = []
+            for unit in obj.accessory.inventory_units.all():
+                available_qty = unit.quantity - self._pending_qty_for_unit(unit)
+                if available_qty > 0:
+                    cached.append((unit, available_qty))
+            obj._available_accessory_units = cached
+        return cached
+
     @extend_schema_field(serializers.URLField(allow_null=True))
     def get_accessory_primary_image(self, obj):
         """Get the primary image URL for the accessory product (uses prefetched images when available)."""
@@ -1189,13 +1201,9 @@ class ProductAccessorySerializer(serializers.ModelSerializer):
     @extend_schema_field(serializers.DictField(child=serializers.FloatField(allow_null=True)))
     def get_accessory_price_range(self, obj):
         """Get price range for available accessory units (uses prefetched inventory_units when available)."""
-        available_units = []
-        for unit in obj.accessory.inventory_units.all():
-            pending_orders_qty = self._pending_qty_for_unit(unit)
-            if unit.quantity - pending_orders_qty > 0:
-                available_units.append(unit)
+        available_units = self._available_accessory_units(obj)
         if available_units:
-            prices = [float(u.selling_price) for u in available_units]
+            prices = [float(u.selling_price) for u, _ in available_units]
             return {"min": min(prices), "max": max(prices)}
         return {"min": None, "max": None}
 
@@ -1209,12 +1217,7 @@ class ProductAccessorySerializer(serializers.ModelSerializer):
         """
         from inventory.cloudinary_utils import get_optimized_image_url
 
-        available_units = []
-        for unit in obj.accessory.inventory_units.all():
-            pending_orders_qty = self._pending_qty_for_unit(unit)
-            available_qty = unit.quantity - pending_orders_qty
-            if available_qty > 0:
-                available_units.append((unit, available_qty))
+        available_units = self._available_accessory_units(obj)
 
         color_variants = {}
         accessory_images = (
@@ -2282,16 +2285,16 @@ class InitiatePaymentRequestSerializer(serializers.Serializer):
     def update(self, instance, validated_data):
         """
         Handle order updates. For status-only updates, order_items is not required.
-        The viewset's perform_update will handle the actual save and any special logic.
+        The viewset's perform_update handles side effects (e.g. restoring units on cancel).
         """
-        # Update status if provided (this will be saved by serializer.save() in perform_update)
+        # Update status if provided and persist just that column
         if "status" in validated_data:
             instance.status = validated_data["status"]
+            instance.save(update_fields=["status"])
 
         # If order_items are provided, we could handle updating them here in the future
         # For now, we just update the status
 
-        # Return the instance - serializer.save() will be called by perform_update
         return instance
 
 
@@ -2403,9 +2406,7 @@ class ReservationRequestSerializer(serializers.ModelSerializer):
         unit_quantities = obj.inventory_unit_quantities or {}
         # Use new ManyToMany field
         for unit in obj.inventory_units.all():
-            requested_quantity = (
-                unit_quantities.get(str(unit.id)) or unit_quantities.get(unit.id) or 1
-            )
+            requested_quantity = unit_quantities.get(str(unit.id)) or 1
             units.append(
                 {
                     "id": unit.id,
@@ -2421,11 +2422,7 @@ class ReservationRequestSerializer(serializers.ModelSerializer):
             )
         # Fallback to old single unit field during migration
         if not units and obj.inventory_unit:
-            requested_quantity = (
-                unit_quantities.get(str(obj.inventory_unit.id))
-                or unit_quantities.get(obj.inventory_unit.id)
-                or 1
-            )
+            requested_quantity = unit_quantities.get(str(obj.inventory_unit.id)) or 1
             units.append(
                 {
                     "id": obj.inventory_unit.id,
@@ -2641,68 +2638,46 @@ class ReservationRequestSerializer(serializers.ModelSerializer):
             else:
                 message = f"{unit_count} units requested by {salesperson_name}. Review and approve if needed."
 
-            # Notify all Inventory Managers
-            managers = Admin.objects.filter(
-                roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
-            ).select_related("user")
-
-            manager_count = managers.count()
+            # Notify all Inventory Managers and superusers with one multi-row INSERT
+            manager_user_ids = list(
+                Admin.objects.filter(roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER)
+                .values_list("user_id", flat=True)
+                .distinct()
+            )
             logger.info(
-                f"Creating notifications for reservation request {reservation_request.id}. Found {manager_count} inventory managers."
+                f"Creating notifications for reservation request {reservation_request.id}. Found {len(manager_user_ids)} inventory managers."
             )
 
-            if manager_count == 0:
+            if not manager_user_ids:
                 logger.warning(
                     f"No inventory managers found to notify for reservation request {reservation_request.id}"
                 )
 
-            for manager in managers:
-                try:
-                    Notification.objects.create(
-                        recipient=manager.user,
-                        notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                        title="New Reservation Request",
-                        message=message,
-                        content_type=ContentType.objects.get_for_model(ReservationRequest),
-                        object_id=reservation_request.id,
-                    )
-                    logger.info(
-                        f"Notification created for inventory manager: {manager.user.username}"
-                    )
-                except Exception as e:
-                    # Log error but don't break the request creation
-                    logger.error(
-                        f"Failed to create notification for manager {manager.user.username}: {e}",
-                        exc_info=True,
-                    )
-
-            # Also notify superusers
-            superusers = User.objects.filter(is_superuser=True)
-            superuser_count = superusers.count()
-            logger.info(f"Found {superuser_count} superusers to notify.")
+            superuser_ids = list(
+                User.objects.filter(is_superuser=True).values_list("id", flat=True)
+            )
+            logger.info(f"Found {len(superuser_ids)} superusers to notify.")
 
-            if superuser_count == 0:
+            if not superuser_ids:
                 logger.warning(
                     f"No superusers found to notify for reservation request {reservation_request.id}"
                 )
 
-            for superuser in superusers:
-                try:
-                    Notification.objects.create(
-                        recipient=superuser,
+            ct = ContentType.objects.get_for_model(ReservationRequest)
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        recipient_id=user_id,
                         notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
                         title="New Reservation Request",
                         message=message,
-                        content_type=ContentType.objects.get_for_model(ReservationRequest),
+                        content_type=ct,
                         object_id=reservation_request.id,
                     )
-                    logger.info(f"Notification created for superuser: {superuser.username}")
-                except Exception as e:
-                    # Log error but don't break the request creation
-                    logger.error(
-                        f"Failed to create notification for superuser {superuser.username}: {e}",
-                        exc_info=True,
-                    )
+                    for user_id in manager_user_ids + superuser_ids
+                ],
+                batch_size=500,
+            )
         except Exception as e:
             # Log error but don't break the request creation
             logger.error(
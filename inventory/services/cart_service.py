@@ -349,27 +349,33 @@ class CartService:
 
             from inventory.models import Admin, AdminRole, Notification
 
-            salespersons = (
+            salesperson_user_ids = (
                 Admin.objects.filter(
                     roles__name=AdminRole.RoleChoices.SALESPERSON,
                     brands=cart.brand,  # Only salespersons for this company brand
                 )
+                .values_list("user_id", flat=True)
                 .distinct()
-                .select_related("user")
             )
 
             # Format currency for notification message
             total_value_str = f"KES {total_value:,.2f}"
 
-            for salesperson in salespersons:
-                Notification.objects.create(
-                    recipient=salesperson.user,
-                    notification_type=Notification.NotificationType.NEW_LEAD,
-                    title="New Lead Available",
-                    message=f"New lead {lead.lead_reference} from {customer_name} - Total: {total_value_str}",
-                    content_type=ContentType.objects.get_for_model(Lead),
-                    object_id=lead.id,
-                )
+            lead_ct = ContentType.objects.get_for_model(Lead)
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        recipient_id=user_id,
+                        notification_type=Notification.NotificationType.NEW_LEAD,
+                        title="New Lead Available",
+                        message=f"New lead {lead.lead_reference} from {customer_name} - Total: {total_value_str}",
+                        content_type=lead_ct,
+                        object_id=lead.id,
+                    )
+                    for user_id in salesperson_user_ids
+                ],
+                batch_size=500,
+            )
 
             # Don't auto-assign - let salespersons claim leads
             # LeadService.auto_assign_lead(lead)  # Removed auto-assignment
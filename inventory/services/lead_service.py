@@ -12,7 +12,7 @@ class LeadService:
         """Auto-assign lead to salesperson with least active leads."""
         # Get salespersons for this brand
         salespersons = Admin.objects.filter(
-            roles__name=AdminRole.RoleChoices.SALESPERSON, brands=lead.brand
+            roles__name=AdminRole.RoleChoices.SALESPERSON, brands=lead.brand_id
         ).distinct()
 
         if not salespersons.exists():
@@ -48,7 +48,7 @@ class LeadService:
             order = Order.objects.create(
                 customer=lead.customer,
                 user=lead.customer.user if lead.customer and lead.customer.user else None,
-                brand=lead.brand,
+                brand_id=lead.brand_id,
                 order_source=Order.OrderSourceChoices.ONLINE,
                 status=Order.StatusChoices.PENDING,
                 total_amount=lead.total_value,
@@ -455,41 +455,74 @@ class PesapalPaymentService:
 
                         # Update inventory units: For accessories, decrement quantity and mark as SOLD if quantity reaches 0
                         # For unique items, mark as SOLD
-                        from inventory.models import InventoryUnit, Product
+                        from django.db.models import Prefetch
+
+                        from inventory.models import (
+                            Admin,
+                            InventoryUnit,
+                            Product,
+                            ReservationRequest,
+                        )
+
+                        order_items = list(
+                            payment.order.order_items.select_related(
+                                "inventory_unit__product_template"
+                            )
+                        )
+                        accessory_unit_ids = {
+                            order_item.inventory_unit_id
+                            for order_item in order_items
+                            if order_item.inventory_unit_id
+                            and order_item.inventory_unit.product_template.product_type
+                            == Product.ProductType.ACCESSORY
+                        }
+
+                        # Approved reservations held by the buyer for these accessories,
+                        # loaded once for the whole order instead of once per item
+                        admin = (
+                            Admin.objects.filter(user=payment.order.user).first()
+                            if payment.order.user and accessory_unit_ids
+                            else None
+                        )
+                        reservation_requests = []
+                        if admin:
+                            reservation_requests = list(
+                                ReservationRequest.objects.filter(
+                                    requesting_salesperson=admin,
+                                    status=ReservationRequest.StatusChoices.APPROVED,
+                                    inventory_units__id__in=accessory_unit_ids,
+                                )
+                                .distinct()
+                                .order_by("approved_at", "requested_at")
+                                .only("id", "inventory_unit_quantities", "status", "expires_at")
+                                .prefetch_related(
+                                    Prefetch(
+                                        "inventory_units",
+                                        queryset=InventoryUnit.objects.only("id"),
+                                    )
+                                )
+                            )
+                        reservation_unit_ids = {
+                            req.id: {unit.id for unit in req.inventory_units.all()}
+                            for req in reservation_requests
+                        }
 
                         units_updated = []
-                        for order_item in payment.order.order_items.all():
+                        for order_item in order_items:
                             unit = order_item.inventory_unit
                             if not unit:
                                 continue
 
                             if unit.product_template.product_type == Product.ProductType.ACCESSORY:
                                 # Accessory: consume reserved quantities first (if any), then decrement remaining
-                                from inventory.models import Admin, ReservationRequest
-
                                 reserved_consumed = 0
-                                try:
-                                    admin = (
-                                        Admin.objects.get(user=payment.order.user)
-                                        if payment.order.user
-                                        else None
-                                    )
-                                except Admin.DoesNotExist:
-                                    admin = None
                                 if admin:
                                     remaining_to_consume = order_item.quantity
-                                    reservation_requests = ReservationRequest.objects.filter(
-                                        requesting_salesperson=admin,
-                                        status=ReservationRequest.StatusChoices.APPROVED,
-                                        inventory_units=unit,
-                                    ).order_by("approved_at", "requested_at")
                                     for req in reservation_requests:
+                                        if unit.id not in reservation_unit_ids[req.id]:
+                                            continue
                                         unit_quantities = req.inventory_unit_quantities or {}
-                                        qty = (
-                                            unit_quantities.get(str(unit.id))
-                                            or unit_quantities.get(unit.id)
-                                            or 0
-                                        )
+                                        qty = unit_quantities.get(str(unit.id)) or 0
                                         if qty <= 0:
                                             continue
                                         consume = min(remaining_to_consume, qty)
@@ -550,22 +583,7 @@ class PesapalPaymentService:
                                 "[PESAPAL] ⚠ No units with PENDING_PAYMENT status found - units may already be SOLD"
                             )
 
-                        # Generate and send receipt automatically (email + WhatsApp)
-                        try:
-                            from inventory.services.receipt_service import ReceiptService
-
-                            receipt, email_sent, whatsapp_sent = (
-                                ReceiptService.generate_and_send_receipt(payment.order)
-                            )
-                            print(
-                                f"[PESAPAL] Receipt generated: {receipt.receipt_number}, Email sent: {email_sent}, WhatsApp sent: {whatsapp_sent}"
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to generate receipt for order {payment.order.order_id}: {e}"
-                            )
-                            print(f"[PESAPAL] WARNING: Receipt generation failed: {e}")
-                            # Don't fail payment confirmation if receipt generation fails
+                        # Receipt email + WhatsApp are queued by the Order post_save signal on PAID
             elif status_error:
                 print(f"[PESAPAL] WARNING: Status verification failed: {status_error}")
 
@@ -631,6 +649,9 @@ class PesapalPaymentService:
             print("[PESAPAL] ===========================================\n")
             return {"status": "NO_PAYMENT", "message": "No payment initiated for this order"}
 
+        # Same row as the caller's order; reuse it instead of lazily re-fetching payment.order
+        payment.order = order
+
         print(f"[PESAPAL] Payment found - ID: {payment.id}")
         print(f"[PESAPAL] Payment Status: {payment.status}")
         print(f"[PESAPAL] Order Tracking ID: {payment.pesapal_order_tracking_id}")
@@ -812,21 +833,7 @@ class PesapalPaymentService:
 
                         print("[PESAPAL] ✓ Payment verified as completed - Order marked as PAID")
 
-                        # Generate and send receipt automatically (email + WhatsApp)
-                        try:
-                            from inventory.services.receipt_service import ReceiptService
-
-                            receipt, email_sent, whatsapp_sent = (
-                                ReceiptService.generate_and_send_receipt(payment.order)
-                            )
-                            print(
-                                f"[PESAPAL] Receipt generated: {receipt.receipt_number}, Email sent: {email_sent}, WhatsApp sent: {whatsapp_sent}"
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to generate receipt for order {payment.order.order_id}: {e}"
-                            )
-                            print(f"[PESAPAL] WARNING: Receipt generation failed: {e}")
+                        # Receipt email + WhatsApp are queued by the Order post_save signal on PAID
 
                     payment.save()
                     print("[PESAPAL] Payment status updated in database")
@@ -8,14 +8,35 @@ import logging
 import os
 import time
 from datetime import timedelta
+from datetime import timezone as dt_timezone
 
 import requests
 from django.conf import settings
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, RequestException, Timeout
 
 logger = logging.getLogger(__name__)
 
+# Pesapal access tokens are valid for about five minutes. The cached token is dropped
+# TOKEN_EXPIRY_MARGIN before the expiryDate Pesapal reports, or after TOKEN_TTL when the
+# response has none.
+TOKEN_TTL = timedelta(minutes=4)
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=30)
+
+
+def _token_expires_at(result: dict, now):
+    """When a freshly issued token should stop being reused, from the auth response."""
+    expiry = result.get("expiryDate")
+    parsed = parse_datetime(expiry) if isinstance(expiry, str) else None
+    if parsed is None:
+        return now + TOKEN_TTL
+    if timezone.is_naive(parsed):
+        # Pesapal reports UTC
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    return parsed - TOKEN_EXPIRY_MARGIN
+
 
 def _ensure_log_directory(log_path: str) -> None:
     """Safely create log directory if it doesn't exist. Only creates directories for safe paths like /tmp/."""
@@ -118,6 +139,10 @@ class PesapalService:
 
         self._access_token = None
         self._token_expires_at = None
+
+        # Keep-alive connection pool reused across calls (the service is long-lived per process)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
         print("[PESAPAL] Initializing PesapalService...")
         print(
             f"[PESAPAL] Service initialized - Base URL: {self.base_url}, Environment: {self.environment}"
@@ -256,10 +281,14 @@ class PesapalService:
                     except Exception as e:
                         print(f"[DEBUG] Log write error: {e}")
                     # #endregion
-                    response = requests.post(url, json=data, headers=headers, timeout=self.timeout)
+                    response = self.session.post(
+                        url, json=data, headers=headers, timeout=self.timeout
+                    )
                 elif method.upper() == "GET":
                     print("[PESAPAL] Making GET request...")
-                    response = requests.get(url, params=data, headers=headers, timeout=self.timeout)
+                    response = self.session.get(
+                        url, params=data, headers=headers, timeout=self.timeout
+                    )
                 else:
                     print(f"[PESAPAL] ERROR: Unsupported HTTP method: {method}")
                     return None, f"Unsupported HTTP method: {method}"
@@ -601,7 +630,7 @@ class PesapalService:
                 return None
 
             self._access_token = token
-            self._token_expires_at = timezone.now() + timedelta(hours=1)
+            self._token_expires_at = _token_expires_at(result, timezone.now())
 
             print("[PESAPAL] ========== GET ACCESS TOKEN SUCCESS ==========")
             print(f"[PESAPAL] Token obtained (first 20 chars): {token[:20]}...")
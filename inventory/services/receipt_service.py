@@ -5,11 +5,13 @@ Handles PDF generation, receipt storage, and email delivery.
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.mail import EmailMessage
+from django.db import connection, transaction
 from django.template.loader import render_to_string
 from django.utils import timezone
 from num2words import num2words
@@ -20,6 +22,9 @@ from inventory.models import Order, Receipt
 
 logger = logging.getLogger(__name__)
 
+# Receipt rendering + email/WhatsApp delivery runs here instead of on the request thread
+_receipt_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="receipts")
+
 
 class ReceiptService:
     """Service for generating and managing receipts using custom template."""
@@ -67,10 +72,12 @@ class ReceiptService:
     @staticmethod
     def get_receipt_context(order: Order) -> dict:
         """Prepare context data for receipt template."""
-        # Get order items with all related data
-        order_items = order.order_items.select_related(
-            "inventory_unit__product_template", "inventory_unit__product_color", "bundle"
-        ).all()
+        # Get order items with all related data (evaluated once; reused below)
+        order_items = list(
+            order.order_items.select_related(
+                "inventory_unit__product_template", "inventory_unit__product_color", "bundle"
+            ).order_by("pk")
+        )
 
         # Get customer details
         customer = order.customer
@@ -142,7 +149,7 @@ class ReceiptService:
         bundle_summary = list(bundle_groups.values())
 
         # Get first order item (for single-item receipts)
-        order_item = order_items.first()
+        order_item = order_items[0] if order_items else None
         inventory_unit = order_item.inventory_unit if order_item else None
 
         # Format date for stamp (DD MON YYYY format)
@@ -285,8 +292,8 @@ class ReceiptService:
             # Save PDF file only if requested
             if generate_pdf:
                 pdf_bytes = ReceiptService.generate_receipt_pdf(order, html_content)
-                if not receipt.pdf_file or (
-                    receipt.pdf_file and not os.path.exists(receipt.pdf_file.path)
+                if not receipt.pdf_file or not receipt.pdf_file.storage.exists(
+                    receipt.pdf_file.name
                 ):
                     receipt.pdf_file.save(pdf_path, ContentFile(pdf_bytes), save=True)
 
@@ -451,3 +458,38 @@ Affordable Gadgets Team
                 f"Error in generate_and_send_receipt for order {order.order_id}: {e}", exc_info=True
             )
             raise
+
+    @staticmethod
+    def send_receipt_task(order_pk) -> None:
+        """Load a committed order and generate/send its receipt (runs on the receipts pool)."""
+        try:
+            order = Order.objects.select_related("customer__user", "user").get(pk=order_pk)
+            receipt, email_sent, whatsapp_sent = ReceiptService.generate_and_send_receipt(order)
+            logger.info(
+                "Receipt generated after order paid",
+                extra={
+                    "order_id": str(order.order_id),
+                    "receipt_number": receipt.receipt_number,
+                    "email_sent": email_sent,
+                    "whatsapp_sent": whatsapp_sent,
+                },
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to generate receipt after order paid for order {order_pk}: {e}",
+                exc_info=True,
+            )
+        finally:
+            # Worker threads hold their own DB connection; don't leak it between tasks
+            connection.close()
+
+    @staticmethod
+    def enqueue_receipt(order: Order) -> None:
+        """
+        Schedule receipt generation + delivery for after the current transaction commits,
+        so a rolled-back payment never sends a receipt and the worker sees the PAID row.
+        """
+        order_pk = order.pk
+        transaction.on_commit(
+            lambda: _receipt_executor.submit(ReceiptService.send_receipt_task, order_pk)
+        )
@@ -48,24 +48,9 @@ def send_receipt_on_order_paid(sender, instance, created, **kwargs):
     if previous_status == Order.StatusChoices.PAID or instance.status != Order.StatusChoices.PAID:
         return
 
-    try:
-        from inventory.services.receipt_service import ReceiptService
-
-        receipt, email_sent, whatsapp_sent = ReceiptService.generate_and_send_receipt(instance)
-        logger.info(
-            "Receipt generated after order paid",
-            extra={
-                "order_id": str(instance.order_id),
-                "receipt_number": receipt.receipt_number,
-                "email_sent": email_sent,
-                "whatsapp_sent": whatsapp_sent,
-            },
-        )
-    except Exception as e:
-        logger.error(
-            f"Failed to generate receipt after order paid for order {instance.order_id}: {e}",
-            exc_info=True,
-        )
+    from inventory.services.receipt_service import ReceiptService
+
+    ReceiptService.enqueue_receipt(instance)
 
 
 @receiver(post_save, sender=ReservationRequest)
@@ -101,30 +86,26 @@ def handle_order_creation(sender, instance, created, **kwargs):
         order_id_str = str(instance.order_id)
         item_count = instance.order_items.count()
 
-        # Notify inventory manager and superuser
-        inventory_managers = Admin.objects.filter(roles__name="IM").select_related("user")
-
-        for manager in inventory_managers:
-            Notification.objects.create(
-                recipient=manager.user,
-                notification_type=Notification.NotificationType.ORDER_CREATED,
-                title="New Order Created",
-                message=f"Order #{order_id_str} has been created with {item_count} item(s).",
-                content_type=ContentType.objects.get_for_model(Order),
-                object_id=None,  # Can't store UUID in PositiveIntegerField
-            )
-
-        # Notify superusers
-        superusers = User.objects.filter(is_superuser=True)
-        for superuser in superusers:
-            Notification.objects.create(
-                recipient=superuser,
-                notification_type=Notification.NotificationType.ORDER_CREATED,
-                title="New Order Created",
-                message=f"Order #{order_id_str} has been created with {item_count} item(s).",
-                content_type=ContentType.objects.get_for_model(Order),
-                object_id=None,  # Can't store UUID in PositiveIntegerField
-            )
+        # Notify inventory managers and superusers with one multi-row INSERT
+        manager_user_ids = list(
+            Admin.objects.filter(roles__name="IM").values_list("user_id", flat=True)
+        )
+        superuser_ids = list(User.objects.filter(is_superuser=True).values_list("id", flat=True))
+        order_ct = ContentType.objects.get_for_model(Order)
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient_id=user_id,
+                    notification_type=Notification.NotificationType.ORDER_CREATED,
+                    title="New Order Created",
+                    message=f"Order #{order_id_str} has been created with {item_count} item(s).",
+                    content_type=order_ct,
+                    object_id=None,  # Can't store UUID in PositiveIntegerField
+                )
+                for user_id in manager_user_ids + superuser_ids
+            ],
+            batch_size=500,
+        )
 
 
 # ============================================
@@ -360,54 +341,42 @@ def notify_buyback_return_request_created(sender, instance, created, **kwargs):
         # This is a buyback ReturnRequest (no salesperson)
         # Check if notifications were already sent (to avoid duplicates)
         # We'll send notifications here as a backup
-        inventory_managers = Admin.objects.filter(
-            roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
-        ).select_related("user")
-
         # Get the first unit to get product name
         first_unit = instance.inventory_units.first()
         if first_unit:
             product_name = first_unit.product_template.product_name
             unit_count = instance.inventory_units.count()
-
-            for manager in inventory_managers:
-                # Check if notification already exists to avoid duplicates
-                existing_notification = Notification.objects.filter(
-                    recipient=manager.user,
-                    notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                    content_type=ContentType.objects.get_for_model(ReturnRequest),
-                    object_id=instance.id,
-                    created_at__gte=timezone.now() - timedelta(minutes=1),  # Within last minute
-                ).first()
-
-                if not existing_notification:
-                    Notification.objects.create(
-                        recipient=manager.user,
-                        notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                        title="New Buyback Return Request",
-                        message=f"Buyback return request for {unit_count} unit(s) ({product_name}) requires approval.",
-                        content_type=ContentType.objects.get_for_model(ReturnRequest),
-                        object_id=instance.id,
-                    )
-
-            # Also notify superusers
-            superusers = User.objects.filter(is_superuser=True)
-            for superuser in superusers:
-                # Check if notification already exists to avoid duplicates
-                existing_notification = Notification.objects.filter(
-                    recipient=superuser,
+            return_ct = ContentType.objects.get_for_model(ReturnRequest)
+
+            # Notify inventory managers, then superusers, skipping anyone who already got this
+            # notice within the last minute (one lookup for all recipients) - one INSERT
+            recipient_ids = list(
+                Admin.objects.filter(
+                    roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
+                ).values_list("user_id", flat=True)
+            )
+            recipient_ids += User.objects.filter(is_superuser=True).values_list("id", flat=True)
+            already_notified = set(
+                Notification.objects.filter(
+                    recipient_id__in=recipient_ids,
                     notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                    content_type=ContentType.objects.get_for_model(ReturnRequest),
+                    content_type=return_ct,
                     object_id=instance.id,
                     created_at__gte=timezone.now() - timedelta(minutes=1),  # Within last minute
-                ).first()
-
-                if not existing_notification:
-                    Notification.objects.create(
-                        recipient=superuser,
+                ).values_list("recipient_id", flat=True)
+            )
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        recipient_id=user_id,
                         notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
                         title="New Buyback Return Request",
                         message=f"Buyback return request for {unit_count} unit(s) ({product_name}) requires approval.",
-                        content_type=ContentType.objects.get_for_model(ReturnRequest),
+                        content_type=return_ct,
                         object_id=instance.id,
                     )
+                    for user_id in dict.fromkeys(recipient_ids)
+                    if user_id not in already_notified
+                ],
+                batch_size=500,
+            )
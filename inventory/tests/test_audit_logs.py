@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import AuditLog
+
+
+class AuditLogListTests(APITestCase):
+    def setUp(self):
+        self.superuser = get_user_model().objects.create_superuser(
+            username="root",
+            email="root@example.com",
+            password="test-pass-123",
+        )
+        for object_id in range(3):
+            AuditLog.objects.create(
+                user=self.superuser,
+                action=AuditLog.ActionType.UPDATE,
+                model_name="Product",
+                object_id=object_id,
+            )
+        self.client.force_authenticate(user=self.superuser)
+
+    def test_pages_through_logs_newest_first(self):
+        response = self.client.get(reverse("audit-logs-list"), {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["object_id"] for row in response.data["results"]], [2, 1])
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+
+        self.assertEqual([row["object_id"] for row in response.data["results"]], [0])
+        self.assertIsNone(response.data["next"])
@@ -0,0 +1,54 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from inventory import debug_log
+from inventory.views import _write_agent_log
+
+
+class DebugLogWriterTests(SimpleTestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".log")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_queued_lines_are_appended_in_order(self):
+        for i in range(debug_log.MAX_BATCH + 10):
+            debug_log.emit(self.path, f'{{"n": {i}}}'.encode())
+        debug_log.flush()
+
+        with open(self.path, "rb") as f:
+            lines = f.read().splitlines()
+
+        self.assertEqual(len(lines), debug_log.MAX_BATCH + 10)
+        self.assertEqual(lines[0], b'{"n": 0}')
+        self.assertEqual(lines[-1], f'{{"n": {debug_log.MAX_BATCH + 9}}}'.encode())
+
+    def test_unwritable_path_does_not_stop_the_writer(self):
+        with self.assertLogs("inventory.debug_log", "WARNING"):
+            debug_log.emit(os.path.join(self.path, "missing", "debug.log"), b"lost")
+            debug_log.emit(self.path, b"kept")
+            debug_log.flush()
+
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"kept\n")
+
+
+class AgentLogGateTests(SimpleTestCase):
+    @override_settings(DEBUG=False, AGENT_DEBUG_LOG=False)
+    def test_nothing_is_queued_when_agent_log_is_off(self):
+        with patch.object(debug_log, "emit") as emit:
+            _write_agent_log("/nonexistent/debug.log", "test", "message")
+
+        emit.assert_not_called()
+
+    @override_settings(DEBUG=False, AGENT_DEBUG_LOG=True)
+    def test_entry_is_queued_when_agent_log_is_on(self):
+        with patch.object(debug_log, "emit") as emit:
+            _write_agent_log("/tmp/debug.log", "test", "message", {"n": 1})
+
+        path, line = emit.call_args.args
+        self.assertEqual(path, "/tmp/debug.log")
+        self.assertIn(b'"message":"message"', line)
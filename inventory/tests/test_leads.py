@@ -0,0 +1,374 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    Brand,
+    Customer,
+    InventoryUnit,
+    Lead,
+    LeadItem,
+    Product,
+)
+
+
+class LeadActionTestCase(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        sales_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.SALESPERSON,
+            defaults={
+                "display_name": "Salesperson",
+                "description": "Can view inventory and create orders",
+            },
+        )
+        manager_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.INVENTORY_MANAGER,
+            defaults={
+                "display_name": "Inventory Manager",
+                "description": "Can manage inventory",
+            },
+        )
+
+        self.brand = Brand.objects.create(code="BRAND_A", name="Brand A")
+        self.other_brand = Brand.objects.create(code="BRAND_B", name="Brand B")
+
+        self.sales_user = user_model.objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.sales_admin = Admin.objects.create(user=self.sales_user, admin_code="ADM-SP-001")
+        self.sales_admin.roles.add(sales_role)
+        self.sales_admin.brands.add(self.brand)
+
+        self.other_sales_user = user_model.objects.create_user(
+            username="other_salesperson",
+            email="other@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        other_sales_admin = Admin.objects.create(
+            user=self.other_sales_user, admin_code="ADM-SP-002"
+        )
+        other_sales_admin.roles.add(sales_role)
+        other_sales_admin.brands.add(self.other_brand)
+
+        self.manager_user = user_model.objects.create_user(
+            username="inventory_manager",
+            email="inventory@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        Admin.objects.create(user=self.manager_user, admin_code="ADM-IM-001").roles.add(
+            manager_role
+        )
+
+        self.superuser = user_model.objects.create_superuser(
+            username="root", email="root@example.com", password="test-pass-123"
+        )
+
+        self.lead = Lead.objects.create(
+            customer_name="Walk In",
+            customer_phone="0700000000",
+            brand=self.brand,
+        )
+
+
+class LeadListTests(LeadActionTestCase):
+    def _add_lead(self, n):
+        customer_user = get_user_model().objects.create_user(
+            username=f"customer{n}", password="test-pass-123"
+        )
+        customer = Customer.objects.create(user=customer_user)
+        return Lead.objects.create(
+            customer_name=f"Customer {n}",
+            customer_phone=f"07000000{n:02d}",
+            brand=self.brand,
+            customer=customer,
+            assigned_salesperson=self.sales_admin,
+        )
+
+    def _list_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("lead-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_does_not_grow_with_leads(self):
+        self.client.force_authenticate(user=self.sales_user)
+        self._add_lead(1)
+        baseline, _ = self._list_query_count()
+
+        for n in range(2, 6):
+            self._add_lead(n)
+        query_count, response = self._list_query_count()
+
+        self.assertEqual(response.data["count"], 6)
+        self.assertEqual(query_count, baseline)
+        names = {lead["customer_name_display"] for lead in response.data["results"]}
+        self.assertIn("customer3", names)
+
+
+class LeadAssignTests(LeadActionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("lead-assign", args=[self.lead.pk])
+
+    def test_salesperson_claims_lead_for_their_brand(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.assigned_salesperson, self.sales_admin)
+
+    def test_claim_only_writes_the_assignment(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"assigned_salesperson_id"', updates[0])
+        self.assertNotIn('"customer_name"', updates[0])
+
+    def test_lead_for_another_brand_is_not_visible_to_salesperson(self):
+        self.client.force_authenticate(user=self.other_sales_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.lead.refresh_from_db()
+        self.assertIsNone(self.lead.assigned_salesperson)
+
+    def test_inventory_manager_cannot_claim_lead(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_salesperson_without_brands_cannot_claim_branded_lead(self):
+        self.sales_admin.brands.clear()
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.lead.refresh_from_db()
+        self.assertIsNone(self.lead.assigned_salesperson)
+
+
+class LeadContactTests(LeadActionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("lead-contact", args=[self.lead.pk])
+
+    def test_assigned_salesperson_marks_lead_contacted(self):
+        self.lead.assigned_salesperson = self.sales_admin
+        self.lead.save()
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {"notes": "Called back"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, Lead.StatusChoices.CONTACTED)
+        self.assertEqual(self.lead.salesperson_notes, "Called back")
+        self.assertIsNotNone(self.lead.contacted_at)
+
+    def test_contact_loads_the_lead_once_without_unused_columns(self):
+        self.lead.assigned_salesperson = self.sales_admin
+        self.lead.save()
+        self.client.force_authenticate(user=self.sales_user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lead_selects = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "inventory_lead"' in q["sql"]
+        ]
+        self.assertEqual(len(lead_selects), 1)
+        self.assertNotIn('"customer_name"', lead_selects[0])
+
+    def test_superuser_without_admin_profile_marks_lead_contacted(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        admin_selects = [
+            q["sql"] for q in ctx.captured_queries if 'FROM "inventory_admin"' in q["sql"]
+        ]
+        self.assertEqual(admin_selects, [])
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, Lead.StatusChoices.CONTACTED)
+
+    def test_unassigned_salesperson_cannot_mark_lead_contacted(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, Lead.StatusChoices.NEW)
+
+
+class LeadCloseTests(LeadActionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.lead.assigned_salesperson = self.sales_admin
+        self.lead.save()
+        self.url = reverse("lead-close", args=[self.lead.pk])
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        self.reserved_units = []
+        for serial in ("SN-LEAD-001", "SN-LEAD-002"):
+            unit = InventoryUnit.objects.create(
+                product_template=phone,
+                cost_of_unit=Decimal("100.00"),
+                selling_price=Decimal("150.00"),
+                serial_number=serial,
+            )
+            InventoryUnit.objects.filter(pk=unit.pk).update(
+                sale_status=InventoryUnit.SaleStatusChoices.RESERVED,
+                reserved_by=self.sales_admin,
+                reserved_until=timezone.now() + timedelta(hours=2),
+            )
+            LeadItem.objects.create(
+                lead=self.lead, inventory_unit=unit, unit_price=unit.selling_price
+            )
+            self.reserved_units.append(unit)
+
+        self.sold_unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-LEAD-003",
+        )
+        InventoryUnit.objects.filter(pk=self.sold_unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.SOLD
+        )
+        LeadItem.objects.create(
+            lead=self.lead, inventory_unit=self.sold_unit, unit_price=self.sold_unit.selling_price
+        )
+
+    def test_close_releases_reserved_units_only(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {"notes": "No answer"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["units_freed"], 2)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, Lead.StatusChoices.CLOSED)
+        for unit in self.reserved_units:
+            unit.refresh_from_db()
+            self.assertEqual(unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+            self.assertIsNone(unit.reserved_by)
+            self.assertIsNone(unit.reserved_until)
+        self.sold_unit.refresh_from_db()
+        self.assertEqual(self.sold_unit.sale_status, InventoryUnit.SaleStatusChoices.SOLD)
+
+
+class LeadConvertTests(LeadActionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.lead.customer = Customer.objects.create(name="Walk In", phone="0700000000")
+        self.lead.assigned_salesperson = self.sales_admin
+        self.lead.status = Lead.StatusChoices.CONTACTED
+        self.lead.save()
+        self.url = reverse("lead-convert", args=[self.lead.pk])
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        self.unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-CONVERT-001",
+        )
+        LeadItem.objects.create(
+            lead=self.lead, inventory_unit=self.unit, unit_price=self.unit.selling_price
+        )
+
+    def test_convert_creates_order_for_the_leads_brand(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, Lead.StatusChoices.CONVERTED)
+        self.assertEqual(str(self.lead.order.order_id), response.data["order_id"])
+        self.assertEqual(self.lead.order.brand, self.brand)
+        self.unit.refresh_from_db()
+        self.assertEqual(self.unit.sale_status, InventoryUnit.SaleStatusChoices.PENDING_PAYMENT)
+
+    def test_superuser_without_admin_profile_converts_lead(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, Lead.StatusChoices.CONVERTED)
+
+    def test_convert_requires_contacted_lead(self):
+        Lead.objects.filter(pk=self.lead.pk).update(status=Lead.StatusChoices.NEW)
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_service_validation_error_is_reported_as_bad_request(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        with patch(
+            "inventory.views.LeadService.convert_lead_to_order",
+            side_effect=ValueError("Lead has no items"),
+        ):
+            response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "Lead has no items")
+
+    def test_unexpected_service_error_is_not_reported_as_bad_request(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        with patch(
+            "inventory.views.LeadService.convert_lead_to_order",
+            side_effect=KeyError("brand"),
+        ):
+            with self.assertRaises(KeyError):
+                self.client.post(self.url, {}, format="json")
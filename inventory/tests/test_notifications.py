@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import Admin, Notification
+
+
+class NotificationUnreadCountTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        Admin.objects.create(user=self.user, admin_code="ADM-SP-001")
+        self.notification = Notification.objects.create(
+            recipient=self.user,
+            notification_type=Notification.NotificationType.RESERVATION_APPROVED,
+            title="Reservation Approved",
+            message="Approved.",
+        )
+        self.url = reverse("notification-unread-count")
+        self.client.force_authenticate(user=self.user)
+
+    def test_count_includes_bulk_created_notifications(self):
+        self.assertEqual(self.client.get(self.url).data["unread_count"], 1)
+
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=self.user,
+                    notification_type=Notification.NotificationType.RESERVATION_APPROVED,
+                    title="Reservation Approved",
+                    message="Approved again.",
+                )
+            ]
+        )
+        self.assertEqual(self.client.get(self.url).data["unread_count"], 2)
+
+    def test_mark_read_refreshes_count(self):
+        self.assertEqual(self.client.get(self.url).data["unread_count"], 1)
+
+        response = self.client.post(reverse("notification-mark-read", args=[self.notification.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(self.url).data["unread_count"], 0)
@@ -0,0 +1,177 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    Brand,
+    Cart,
+    Customer,
+    InventoryUnit,
+    Lead,
+    Order,
+    OrderItem,
+    Product,
+    ReservationRequest,
+)
+from inventory.services.receipt_service import ReceiptService
+
+
+@patch("inventory.services.receipt_service.ReceiptService.generate_and_send_receipt")
+class OrderConfirmPaymentTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        self.sales_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.SALESPERSON,
+            defaults={
+                "display_name": "Salesperson",
+                "description": "Can view inventory and create orders",
+            },
+        )
+        self.brand = Brand.objects.create(code="TEST_BRAND", name="Test Brand")
+
+        self.sales_user = user_model.objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.sales_admin = Admin.objects.create(user=self.sales_user, admin_code="ADM-SP-001")
+        self.sales_admin.roles.add(self.sales_role)
+        self.sales_admin.brands.add(self.brand)
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        charger = Product.objects.create(
+            product_name="Test Charger",
+            brand="TestBrand",
+            model_series="Charger",
+            product_type=Product.ProductType.ACCESSORY,
+        )
+        self.phone_unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-CONFIRM-001",
+        )
+        InventoryUnit.objects.filter(pk=self.phone_unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.PENDING_PAYMENT
+        )
+        self.charger_unit = InventoryUnit.objects.create(
+            product_template=charger,
+            cost_of_unit=Decimal("5.00"),
+            selling_price=Decimal("10.00"),
+            quantity=5,
+        )
+
+        self.reservation = ReservationRequest.objects.create(
+            requesting_salesperson=self.sales_admin,
+            status=ReservationRequest.StatusChoices.APPROVED,
+            inventory_unit_quantities={str(self.charger_unit.id): 2},
+        )
+        self.reservation.inventory_units.add(self.charger_unit)
+
+        customer = Customer.objects.create(name="Walk In", phone="0700000000")
+        self.order = Order.objects.create(
+            user=self.sales_user,
+            customer=customer,
+            brand=self.brand,
+            order_source=Order.OrderSourceChoices.WALK_IN,
+            total_amount=Decimal("180.00"),
+        )
+        OrderItem.objects.create(
+            order=self.order,
+            inventory_unit=self.phone_unit,
+            quantity=1,
+            unit_price_at_purchase=Decimal("150.00"),
+        )
+        OrderItem.objects.create(
+            order=self.order,
+            inventory_unit=self.charger_unit,
+            quantity=3,
+            unit_price_at_purchase=Decimal("10.00"),
+        )
+
+    def test_confirm_payment_consumes_reservation_and_marks_units(self, mock_receipt):
+        self.client.force_authenticate(user=self.sales_user)
+
+        url = reverse("order-confirm-payment", args=[self.order.order_id])
+        response = self.client.post(url, {"payment_method": "CASH"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            response.data["units_updated"], [self.phone_unit.id, self.charger_unit.id]
+        )
+
+        self.phone_unit.refresh_from_db()
+        self.assertEqual(self.phone_unit.sale_status, InventoryUnit.SaleStatusChoices.SOLD)
+
+        # Two of the three chargers came from the reservation; one from free stock
+        self.charger_unit.refresh_from_db()
+        self.assertEqual(self.charger_unit.quantity, 4)
+        self.assertEqual(self.charger_unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.status, ReservationRequest.StatusChoices.RETURNED)
+        self.assertEqual(self.reservation.inventory_unit_quantities, {str(self.charger_unit.id): 0})
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, Order.StatusChoices.PAID)
+
+    def test_confirm_payment_rejects_non_cash(self, mock_receipt):
+        self.client.force_authenticate(user=self.sales_user)
+
+        url = reverse("order-confirm-payment", args=[self.order.order_id])
+        response = self.client.post(url, {"payment_method": "MPESA"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, Order.StatusChoices.PENDING)
+
+    def test_confirm_payment_queues_receipt_after_commit(self, mock_receipt):
+        self.client.force_authenticate(user=self.sales_user)
+
+        url = reverse("order-confirm-payment", args=[self.order.order_id])
+        with patch("inventory.services.receipt_service._receipt_executor") as mock_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, {"payment_method": "CASH"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_receipt.assert_not_called()
+        mock_executor.submit.assert_called_once_with(
+            ReceiptService.send_receipt_task, self.order.pk
+        )
+
+    def test_confirm_payment_clears_the_source_lead_cart(self, mock_receipt):
+        lead = Lead.objects.create(
+            customer_name="Walk In",
+            customer_phone="0700000000",
+            brand=self.brand,
+            order=self.order,
+        )
+        cart = Cart.objects.create(
+            brand=self.brand,
+            lead=lead,
+            is_submitted=True,
+            expires_at=timezone.now() + timedelta(hours=24),
+        )
+        self.client.force_authenticate(user=self.sales_user)
+
+        url = reverse("order-confirm-payment", args=[self.order.order_id])
+        response = self.client.post(url, {"payment_method": "CASH"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["cart_cleared"])
+        self.assertFalse(Cart.objects.filter(pk=cart.pk).exists())
@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import Customer, Order
+
+
+class OrderIdempotencyTests(APITestCase):
+    def setUp(self):
+        self.customer = Customer.objects.create(name="Guest", phone="0711111111")
+        self.order = Order.objects.create(
+            customer=self.customer,
+            order_source=Order.OrderSourceChoices.ONLINE,
+            idempotency_key="checkout-abc-123",
+            total_amount=Decimal("100.00"),
+        )
+        self.url = reverse("order-list")
+
+    def test_repeated_key_replays_existing_order(self):
+        response = self.client.post(
+            self.url,
+            {"customer_name": "Guest", "customer_phone": "0711111111", "order_items": []},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="checkout-abc-123",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["order_id"], str(self.order.order_id))
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_legacy_header_name_is_honoured(self):
+        response = self.client.post(
+            self.url,
+            {"customer_name": "Guest", "customer_phone": "0711111111", "order_items": []},
+            format="json",
+            HTTP_X_IDEMPOTENCY_KEY="checkout-abc-123",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["order_id"], str(self.order.order_id))
+
+    def test_key_reused_with_different_body_is_rejected(self):
+        Order.objects.filter(pk=self.order.pk).update(idempotency_fingerprint="0" * 64)
+
+        response = self.client.post(
+            self.url,
+            {"customer_name": "Someone Else", "customer_phone": "0799999999", "order_items": []},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="checkout-abc-123",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(response.data["code"], "FINGERPRINT_MISMATCH")
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_malformed_or_oversized_key_is_rejected(self):
+        for key, code in (("bad key!", "INVALID_KEY"), ("k" * 256, "KEY_TOO_LONG")):
+            response = self.client.post(
+                self.url,
+                {"customer_name": "Guest", "customer_phone": "0711111111", "order_items": []},
+                format="json",
+                HTTP_IDEMPOTENCY_KEY=key,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data["code"], code)
@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import Customer, Order
+
+
+class OrderPaymentStatusTests(APITestCase):
+    def setUp(self):
+        customer = Customer.objects.create(name="Guest", phone="0744444444")
+        self.order = Order.objects.create(
+            customer=customer,
+            order_source=Order.OrderSourceChoices.ONLINE,
+            total_amount=Decimal("99.00"),
+        )
+
+    def test_order_without_payment_reports_no_payment(self):
+        url = reverse("order-payment-status", args=[self.order.order_id])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "NO_PAYMENT")
@@ -0,0 +1,66 @@
+import shutil
+import tempfile
+from decimal import Decimal
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import Customer, Order, Receipt
+
+
+class OrderReceiptViewTests(APITestCase):
+    def setUp(self):
+        customer = Customer.objects.create(
+            name="Guest Buyer", phone="0733333333", email="guest@example.com"
+        )
+        self.order = Order.objects.create(
+            customer=customer,
+            order_source=Order.OrderSourceChoices.ONLINE,
+            total_amount=Decimal("250.00"),
+        )
+        self.url = reverse("order-receipt", args=[self.order.order_id])
+
+    def test_guest_cannot_view_receipt_for_unpaid_order(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_guest_can_view_html_receipt_for_paid_order(self):
+        Order.objects.filter(pk=self.order.pk).update(status=Order.StatusChoices.PAID)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/html")
+        self.assertIn("Guest Buyer", response.content.decode())
+
+    def test_repeat_load_with_matching_etag_returns_not_modified(self):
+        Order.objects.filter(pk=self.order.pk).update(status=Order.StatusChoices.PAID)
+
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", first)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], first["ETag"])
+
+    def test_pdf_receipt_is_generated_once_and_downloaded(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        Order.objects.filter(pk=self.order.pk).update(status=Order.StatusChoices.PAID)
+
+        with override_settings(MEDIA_ROOT=media_root):
+            response = self.client.get(self.url, {"format": "pdf"})
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response["Content-Disposition"].startswith("attachment;"))
+            self.assertTrue(b"".join(response.streaming_content))
+
+            receipt = Receipt.objects.get(order=self.order)
+            self.assertTrue(receipt.receipt_number)
+            self.assertTrue(receipt.pdf_file)
+            self.assertIn(receipt.receipt_number, response["Content-Disposition"])
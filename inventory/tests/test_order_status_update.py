@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    Customer,
+    InventoryUnit,
+    Order,
+    OrderItem,
+    Product,
+)
+
+
+class OrderStatusUpdateTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        self.order_manager_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.ORDER_MANAGER,
+            defaults={
+                "display_name": "Order Manager",
+                "description": "Can manage orders",
+            },
+        )
+        self.manager_user = user_model.objects.create_user(
+            username="order_manager",
+            email="orders@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        manager_admin = Admin.objects.create(user=self.manager_user, admin_code="ADM-OM-001")
+        manager_admin.roles.add(self.order_manager_role)
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        self.unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-CANCEL-001",
+        )
+        InventoryUnit.objects.filter(pk=self.unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.SOLD
+        )
+
+        customer = Customer.objects.create(name="Walk In", phone="0722222222")
+        self.order = Order.objects.create(
+            customer=customer,
+            order_source=Order.OrderSourceChoices.WALK_IN,
+            total_amount=Decimal("150.00"),
+        )
+        OrderItem.objects.create(
+            order=self.order,
+            inventory_unit=self.unit,
+            quantity=1,
+            unit_price_at_purchase=Decimal("150.00"),
+        )
+
+    def test_cancel_walk_in_order_restores_units_to_reserved(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        url = reverse("order-detail", args=[self.order.order_id])
+        response = self.client.patch(url, {"status": Order.StatusChoices.CANCELED}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], Order.StatusChoices.CANCELED)
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, Order.StatusChoices.CANCELED)
+
+        self.unit.refresh_from_db()
+        self.assertEqual(self.unit.sale_status, InventoryUnit.SaleStatusChoices.RESERVED)
+        self.assertIsNone(self.unit.reserved_by)
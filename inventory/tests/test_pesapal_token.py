@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import SimpleTestCase
+
+from inventory.services.pesapal_service import TOKEN_EXPIRY_MARGIN, TOKEN_TTL, _token_expires_at
+
+
+class PesapalTokenExpiryTests(SimpleTestCase):
+    def setUp(self):
+        self.now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_expiry_is_taken_from_the_auth_response(self):
+        result = {"token": "abc", "expiryDate": "2024-05-01T12:05:00.5177702Z"}
+
+        expires_at = _token_expires_at(result, self.now)
+
+        self.assertEqual(
+            expires_at,
+            datetime(2024, 5, 1, 12, 5, 0, 517770, tzinfo=timezone.utc) - TOKEN_EXPIRY_MARGIN,
+        )
+
+    def test_expiry_without_offset_is_read_as_utc(self):
+        result = {"token": "abc", "expiryDate": "2024-05-01T12:05:00"}
+
+        expires_at = _token_expires_at(result, self.now)
+
+        self.assertEqual(expires_at, self.now + timedelta(minutes=5) - TOKEN_EXPIRY_MARGIN)
+
+    def test_missing_or_unparseable_expiry_falls_back_to_short_ttl(self):
+        for result in ({"token": "abc"}, {"token": "abc", "expiryDate": "soon"}):
+            with self.subTest(result=result):
+                self.assertEqual(_token_expires_at(result, self.now), self.now + TOKEN_TTL)
@@ -0,0 +1,265 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import Admin, AdminRole, Brand, Product, Promotion
+
+
+class PromotionTestCase(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        creator_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.CONTENT_CREATOR,
+            defaults={
+                "display_name": "Content Creator",
+                "description": "Can manage content",
+            },
+        )
+        marketing_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.MARKETING_MANAGER,
+            defaults={
+                "display_name": "Marketing Manager",
+                "description": "Can manage promotions",
+            },
+        )
+
+        self.brand = Brand.objects.create(code="AFFORDABLE_GADGETS", name="Affordable Gadgets")
+
+        self.creator_user = user_model.objects.create_user(
+            username="creator",
+            email="creator@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.creator_admin = Admin.objects.create(user=self.creator_user, admin_code="ADM-CC-001")
+        self.creator_admin.roles.add(creator_role)
+        self.creator_admin.brands.add(self.brand)
+
+        self.other_creator_user = user_model.objects.create_user(
+            username="other_creator",
+            email="other_creator@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        other_creator_admin = Admin.objects.create(
+            user=self.other_creator_user, admin_code="ADM-CC-002"
+        )
+        other_creator_admin.roles.add(creator_role)
+        other_creator_admin.brands.add(self.brand)
+
+        self.marketing_user = user_model.objects.create_user(
+            username="marketing",
+            email="marketing@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        marketing_admin = Admin.objects.create(user=self.marketing_user, admin_code="ADM-MM-001")
+        marketing_admin.roles.add(marketing_role)
+        marketing_admin.brands.add(self.brand)
+
+        now = timezone.now()
+        self.promotion = Promotion.objects.create(
+            brand=self.brand,
+            title="Weekend Deal",
+            start_date=now,
+            end_date=now + timedelta(days=2),
+            product_types="PH",
+            created_by=self.creator_admin,
+        )
+
+
+class PromotionListTests(PromotionTestCase):
+    def test_list_is_scoped_to_the_admins_brands(self):
+        other_brand = Brand.objects.create(code="OTHER", name="Other Brand")
+        now = timezone.now()
+        Promotion.objects.create(
+            brand=other_brand,
+            title="Other Deal",
+            start_date=now,
+            end_date=now + timedelta(days=2),
+            product_types="PH",
+        )
+        self.client.force_authenticate(user=self.creator_user)
+
+        response = self.client.get(reverse("promotion-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p["id"] for p in response.data["results"]], [self.promotion.id])
+
+
+class PromotionDestroyTests(PromotionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("promotion-detail", args=[self.promotion.pk])
+
+    def test_creator_deletes_own_promotion(self):
+        self.client.force_authenticate(user=self.creator_user)
+
+        response = self.client.delete(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Promotion.objects.filter(pk=self.promotion.pk).exists())
+
+    def test_creator_cannot_delete_someone_elses_promotion(self):
+        self.client.force_authenticate(user=self.other_creator_user)
+
+        response = self.client.delete(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(Promotion.objects.filter(pk=self.promotion.pk).exists())
+
+    def test_marketing_manager_deletes_any_promotion(self):
+        self.client.force_authenticate(user=self.marketing_user)
+
+        response = self.client.delete(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class PromotionCreateTests(PromotionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("promotion-list")
+        now = timezone.now()
+        self.payload = {
+            "title": "Flash Friday",
+            "start_date": now.isoformat(),
+            "end_date": (now + timedelta(days=1)).isoformat(),
+            "product_types": "PH",
+            "discount_percentage": "10.00",
+            "display_locations": ["special_offers"],
+        }
+
+    def test_creator_creates_promotion_for_assigned_brand(self):
+        self.client.force_authenticate(user=self.creator_user)
+
+        response = self.client.post(
+            self.url, {**self.payload, "brand": self.brand.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        promotion = Promotion.objects.get(pk=response.data["id"])
+        self.assertEqual(promotion.brand, self.brand)
+        self.assertEqual(promotion.created_by, self.creator_admin)
+
+    def test_creator_cannot_create_promotion_for_unassigned_brand(self):
+        other_brand = Brand.objects.create(code="OTHER", name="Other Brand")
+        self.client.force_authenticate(user=self.creator_user)
+
+        response = self.client.post(
+            self.url, {**self.payload, "brand": other_brand.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Promotion.objects.filter(title="Flash Friday").exists())
+
+    def test_unknown_display_location_is_rejected(self):
+        self.client.force_authenticate(user=self.creator_user)
+
+        response = self.client.post(
+            self.url,
+            {**self.payload, "brand": self.brand.id, "display_locations": ["sidebar"]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("sidebar", str(response.data["display_locations"]))
+
+    def test_form_data_display_locations_are_parsed(self):
+        self.client.force_authenticate(user=self.creator_user)
+        payload = {
+            **self.payload,
+            "brand": self.brand.id,
+            "display_locations": '["special_offers", "flash_sales"]',
+        }
+
+        response = self.client.post(self.url, payload, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        promotion = Promotion.objects.get(pk=response.data["id"])
+        self.assertEqual(promotion.display_locations, ["special_offers", "flash_sales"])
+
+    def test_form_data_is_active_string_is_honoured(self):
+        self.client.force_authenticate(user=self.creator_user)
+        payload = {
+            **self.payload,
+            "brand": self.brand.id,
+            "display_locations": '["special_offers"]',
+            "is_active": "false",
+        }
+
+        response = self.client.post(self.url, payload, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(Promotion.objects.get(pk=response.data["id"]).is_active)
+
+    def test_supplied_promotion_code_is_saved_on_insert(self):
+        self.client.force_authenticate(user=self.creator_user)
+        payload = {**self.payload, "brand": self.brand.id, "promotion_code": "FRIDAY10"}
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        promotion = Promotion.objects.get(pk=response.data["id"])
+        self.assertEqual(promotion.promotion_code, "FRIDAY10")
+        promotion_updates = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "inventory_promotion"')
+        ]
+        self.assertEqual(promotion_updates, [])
+
+    def test_duplicate_promotion_code_is_rejected(self):
+        Promotion.objects.filter(pk=self.promotion.pk).update(promotion_code="TAKEN")
+        self.client.force_authenticate(user=self.creator_user)
+        payload = {**self.payload, "brand": self.brand.id, "promotion_code": "TAKEN"}
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("promotion_code", response.data)
+        self.assertFalse(Promotion.objects.filter(title="Flash Friday").exists())
+
+    def test_products_are_attached_from_form_data(self):
+        phones = [
+            Product.objects.create(
+                product_name=f"Phone {n}",
+                brand="TestBrand",
+                model_series=f"Phone {n}",
+                product_type=Product.ProductType.PHONE,
+            )
+            for n in range(2)
+        ]
+        self.client.force_authenticate(user=self.creator_user)
+        payload = {
+            **self.payload,
+            "brand": self.brand.id,
+            "display_locations": '["special_offers"]',
+            "products": [phone.id for phone in phones],
+        }
+        payload.pop("product_types")
+
+        response = self.client.post(self.url, payload, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        promotion = Promotion.objects.get(pk=response.data["id"])
+        self.assertEqual(
+            set(promotion.products.values_list("id", flat=True)), {phone.id for phone in phones}
+        )
+
+    def test_invalid_product_ids_are_rejected_before_saving(self):
+        self.client.force_authenticate(user=self.creator_user)
+        payload = {**self.payload, "brand": self.brand.id, "products": ["not-an-id"]}
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Promotion.objects.filter(title="Flash Friday").exists())
@@ -0,0 +1,256 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    InventoryUnit,
+    Notification,
+    Product,
+    ReservationRequest,
+)
+from inventory.views import ReservationRequestViewSet
+
+
+class ReservationApprovalTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        manager_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.INVENTORY_MANAGER,
+            defaults={
+                "display_name": "Inventory Manager",
+                "description": "Can manage inventory",
+            },
+        )
+        sales_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.SALESPERSON,
+            defaults={
+                "display_name": "Salesperson",
+                "description": "Can view inventory and create orders",
+            },
+        )
+
+        self.manager_user = user_model.objects.create_user(
+            username="inventory_manager",
+            email="inventory@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.manager_admin = Admin.objects.create(user=self.manager_user, admin_code="ADM-IM-001")
+        self.manager_admin.roles.add(manager_role)
+
+        self.sales_user = user_model.objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.sales_admin = Admin.objects.create(user=self.sales_user, admin_code="ADM-SP-001")
+        self.sales_admin.roles.add(sales_role)
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        charger = Product.objects.create(
+            product_name="Test Charger",
+            brand="TestBrand",
+            model_series="Charger",
+            product_type=Product.ProductType.ACCESSORY,
+        )
+        self.phone_unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-RESERVE-001",
+        )
+        self.charger_unit = InventoryUnit.objects.create(
+            product_template=charger,
+            cost_of_unit=Decimal("5.00"),
+            selling_price=Decimal("10.00"),
+            quantity=5,
+        )
+
+        self.reservation = ReservationRequest.objects.create(
+            requesting_salesperson=self.sales_admin,
+            inventory_unit_quantities={
+                str(self.phone_unit.id): 1,
+                str(self.charger_unit.id): 2,
+            },
+        )
+        self.reservation.inventory_units.add(self.phone_unit, self.charger_unit)
+        self.url = reverse("reservation-request-detail", args=[self.reservation.id])
+
+    def test_approval_reserves_units_and_notifies(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                self.url, {"status": ReservationRequest.StatusChoices.APPROVED}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], ReservationRequest.StatusChoices.APPROVED)
+
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.approved_by, self.manager_admin)
+        self.assertIsNotNone(self.reservation.expires_at)
+
+        self.phone_unit.refresh_from_db()
+        self.assertEqual(self.phone_unit.sale_status, InventoryUnit.SaleStatusChoices.RESERVED)
+        self.assertEqual(self.phone_unit.reserved_by, self.sales_admin)
+
+        # Accessories only hand over the requested quantity and stay available
+        self.charger_unit.refresh_from_db()
+        self.assertEqual(self.charger_unit.quantity, 3)
+        self.assertEqual(self.charger_unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+
+        notifications = Notification.objects.filter(object_id=self.reservation.id)
+        self.assertCountEqual(
+            notifications.values_list("recipient", flat=True),
+            [self.sales_user.id, self.manager_user.id],
+        )
+
+    def test_approval_expires_conflicting_approval_and_releases_its_units(self):
+        other_sales_user = get_user_model().objects.create_user(
+            username="other_salesperson",
+            email="other@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        other_sales_admin = Admin.objects.create(user=other_sales_user, admin_code="ADM-SP-002")
+        stale = ReservationRequest.objects.create(
+            requesting_salesperson=other_sales_admin,
+            status=ReservationRequest.StatusChoices.APPROVED,
+        )
+        other_phone_unit = InventoryUnit.objects.create(
+            product_template=self.phone_unit.product_template,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-RESERVE-002",
+        )
+        stale.inventory_units.add(self.phone_unit, other_phone_unit)
+        InventoryUnit.objects.filter(pk__in=[self.phone_unit.pk, other_phone_unit.pk]).update(
+            sale_status=InventoryUnit.SaleStatusChoices.RESERVED,
+            reserved_by=other_sales_admin,
+        )
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.patch(
+            self.url, {"status": ReservationRequest.StatusChoices.APPROVED}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, ReservationRequest.StatusChoices.EXPIRED)
+        self.phone_unit.refresh_from_db()
+        self.assertEqual(self.phone_unit.reserved_by, self.sales_admin)
+        # Units only the expired request held go back on the shelf
+        other_phone_unit.refresh_from_db()
+        self.assertEqual(other_phone_unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+        self.assertIsNone(other_phone_unit.reserved_by)
+
+    def test_rejection_notifies_salesperson(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                self.url, {"status": ReservationRequest.StatusChoices.REJECTED}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], ReservationRequest.StatusChoices.REJECTED)
+        self.phone_unit.refresh_from_db()
+        self.assertEqual(self.phone_unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+        self.assertTrue(
+            Notification.objects.filter(
+                recipient=self.sales_user,
+                notification_type=Notification.NotificationType.RESERVATION_REJECTED,
+            ).exists()
+        )
+
+    def test_approval_of_request_decided_concurrently_is_rejected(self):
+        # Loaded while still PENDING, as a second approver's get_object() would have
+        stale_request = ReservationRequest.objects.get(pk=self.reservation.pk)
+        self.client.force_authenticate(user=self.manager_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                self.url, {"status": ReservationRequest.StatusChoices.APPROVED}, format="json"
+            )
+        notification_count = Notification.objects.count()
+
+        with patch.object(ReservationRequestViewSet, "get_object", return_value=stale_request):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.patch(
+                    self.url, {"status": ReservationRequest.StatusChoices.APPROVED}, format="json"
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.charger_unit.refresh_from_db()
+        self.assertEqual(self.charger_unit.quantity, 3)
+        self.assertEqual(Notification.objects.count(), notification_count)
+
+    def test_salesperson_lists_own_requests(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.get(reverse("reservation-request-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([row["id"] for row in results], [self.reservation.id])
+        self.assertEqual(results[0]["requesting_salesperson_username"], "salesperson")
+        self.assertCountEqual(
+            [unit["product_name"] for unit in results[0]["inventory_units_details"]],
+            ["Test Phone", "Test Charger"],
+        )
+
+    def test_create_validation_error_uses_error_envelope(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(reverse("reservation-request-list"), {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["error"],
+            "non_field_errors: At least one inventory unit must be specified.",
+        )
+        self.assertIn("non_field_errors", response.data["details"])
+
+    def test_quantities_are_stored_with_string_keys(self):
+        reservation = ReservationRequest.objects.create(
+            requesting_salesperson=self.sales_admin,
+            inventory_unit_quantities={self.charger_unit.id: 2},
+        )
+
+        self.assertEqual(reservation.inventory_unit_quantities, {str(self.charger_unit.id): 2})
+
+    def test_create_notifies_inventory_managers(self):
+        other_phone_unit = InventoryUnit.objects.create(
+            product_template=self.phone_unit.product_template,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-RESERVE-003",
+        )
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.post(
+            reverse("reservation-request-list"),
+            {"inventory_unit_ids": [other_phone_unit.id]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        notification = Notification.objects.get(
+            notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
+            object_id=response.data["id"],
+        )
+        self.assertEqual(notification.recipient, self.manager_user)
+        self.assertIn("SN-RESERVE-003", notification.message)
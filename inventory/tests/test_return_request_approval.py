@@ -0,0 +1,178 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    InventoryUnit,
+    Notification,
+    Product,
+    ReservationRequest,
+    ReturnRequest,
+)
+
+
+class ReturnRequestApprovalTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        manager_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.INVENTORY_MANAGER,
+            defaults={
+                "display_name": "Inventory Manager",
+                "description": "Can manage inventory",
+            },
+        )
+        self.manager_user = user_model.objects.create_user(
+            username="inventory_manager",
+            email="inventory@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        manager_admin = Admin.objects.create(user=self.manager_user, admin_code="ADM-IM-001")
+        manager_admin.roles.add(manager_role)
+
+        self.sales_user = user_model.objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.sales_admin = Admin.objects.create(user=self.sales_user, admin_code="ADM-SP-001")
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        self.unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-RETURN-001",
+        )
+        InventoryUnit.objects.filter(pk=self.unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.RESERVED,
+            reserved_by=self.sales_admin,
+        )
+
+        self.reservation = ReservationRequest.objects.create(
+            requesting_salesperson=self.sales_admin,
+            status=ReservationRequest.StatusChoices.APPROVED,
+        )
+        self.reservation.inventory_units.add(self.unit)
+
+        self.return_request = ReturnRequest.objects.create(requesting_salesperson=self.sales_admin)
+        self.return_request.inventory_units.add(self.unit)
+
+    def test_approval_releases_units_and_closes_reservation(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        url = reverse("return-request-detail", args=[self.return_request.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                url, {"status": ReturnRequest.StatusChoices.APPROVED}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.unit.refresh_from_db()
+        self.assertEqual(self.unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+        self.assertIsNone(self.unit.reserved_by)
+
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.status, ReservationRequest.StatusChoices.RETURNED)
+
+        self.assertCountEqual(
+            Notification.objects.filter(
+                notification_type=Notification.NotificationType.RETURN_APPROVED,
+                object_id=self.return_request.id,
+            ).values_list("recipient", flat=True),
+            [self.sales_user.id, self.manager_user.id],
+        )
+
+    def test_bulk_approve_releases_units(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.post(
+            reverse("return-request-bulk-approve"),
+            {"request_ids": [self.return_request.id]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.return_request.refresh_from_db()
+        self.assertEqual(self.return_request.status, ReturnRequest.StatusChoices.APPROVED)
+        self.unit.refresh_from_db()
+        self.assertEqual(self.unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+        self.assertIsNone(self.unit.reserved_by)
+
+    def test_approval_restores_reserved_accessory_quantity(self):
+        charger = Product.objects.create(
+            product_name="Test Charger",
+            brand="TestBrand",
+            model_series="Charger",
+            product_type=Product.ProductType.ACCESSORY,
+        )
+        charger_unit = InventoryUnit.objects.create(
+            product_template=charger,
+            cost_of_unit=Decimal("5.00"),
+            selling_price=Decimal("10.00"),
+            quantity=3,
+        )
+        self.reservation.inventory_units.add(charger_unit)
+        self.reservation.inventory_unit_quantities = {str(charger_unit.id): 2}
+        self.reservation.save(update_fields=["inventory_unit_quantities"])
+        self.return_request.inventory_units.add(charger_unit)
+        self.client.force_authenticate(user=self.manager_user)
+
+        url = reverse("return-request-detail", args=[self.return_request.id])
+        response = self.client.patch(
+            url, {"status": ReturnRequest.StatusChoices.APPROVED}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        charger_unit.refresh_from_db()
+        self.assertEqual(charger_unit.quantity, 5)
+        self.assertEqual(charger_unit.sale_status, InventoryUnit.SaleStatusChoices.AVAILABLE)
+
+    def test_approval_closes_single_unit_reservation(self):
+        legacy = ReservationRequest.objects.create(
+            requesting_salesperson=self.sales_admin,
+            inventory_unit=self.unit,
+            status=ReservationRequest.StatusChoices.APPROVED,
+        )
+        self.client.force_authenticate(user=self.manager_user)
+
+        url = reverse("return-request-detail", args=[self.return_request.id])
+        response = self.client.patch(
+            url, {"status": ReturnRequest.StatusChoices.APPROVED}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.status, ReservationRequest.StatusChoices.RETURNED)
+
+    def test_rejection_notifies_salesperson_after_commit(self):
+        self.client.force_authenticate(user=self.manager_user)
+
+        url = reverse("return-request-detail", args=[self.return_request.id])
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.patch(
+                url, {"status": ReturnRequest.StatusChoices.REJECTED}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(callbacks), 1)
+        notification = Notification.objects.get(
+            notification_type=Notification.NotificationType.RETURN_REJECTED
+        )
+        self.assertEqual(notification.recipient, self.sales_user)
+        self.assertEqual(
+            notification.message, "Your return request for 1 unit(s) has been rejected."
+        )
@@ -0,0 +1,137 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    InventoryUnit,
+    Product,
+    ReservationRequest,
+    ReturnRequest,
+)
+
+
+class StockAlertsTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        manager_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.INVENTORY_MANAGER,
+            defaults={
+                "display_name": "Inventory Manager",
+                "description": "Can manage inventory",
+            },
+        )
+        self.manager_user = user_model.objects.create_user(
+            username="inventory_manager",
+            email="inventory@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        Admin.objects.create(user=self.manager_user, admin_code="ADM-IM-001").roles.add(
+            manager_role
+        )
+
+        self.sales_user = user_model.objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.sales_admin = Admin.objects.create(user=self.sales_user, admin_code="ADM-SP-001")
+
+        self.phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+            min_stock_threshold=2,
+        )
+        self.unit = InventoryUnit.objects.create(
+            product_template=self.phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-ALERT-001",
+        )
+        self.url = reverse("stock-alerts-list")
+
+    def alerts_by_id(self, response):
+        return {alert["id"]: alert for alert in response.data["alerts"]}
+
+    def test_admin_profile_is_looked_up_again_on_each_request(self):
+        user = get_user_model().objects.create_user(
+            username="new_manager", password="test-pass-123", is_staff=True
+        )
+        self.client.force_authenticate(user=user)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+        # Same User instance on the next request: the earlier "no Admin" result must not stick
+        Admin.objects.create(user=user, admin_code="ADM-IM-002").roles.add(
+            AdminRole.objects.get(name=AdminRole.RoleChoices.INVENTORY_MANAGER)
+        )
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_pending_approval_counts(self):
+        ReservationRequest.objects.create(requesting_salesperson=self.sales_admin)
+        ReservationRequest.objects.create(requesting_salesperson=self.sales_admin)
+        ReturnRequest.objects.create(requesting_salesperson=self.sales_admin)
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        alerts = self.alerts_by_id(response)
+        self.assertEqual(alerts["pending-reservations"]["count"], 2)
+        self.assertEqual(alerts["pending-returns"]["count"], 1)
+        self.assertNotIn("pending-transfers", alerts)
+
+    def test_low_and_out_of_stock(self):
+        InventoryUnit.objects.filter(pk=self.unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.SOLD
+        )
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        alerts = self.alerts_by_id(response)
+        self.assertEqual(alerts[f"low-stock-{self.phone.id}"]["current_stock"], 0)
+        self.assertEqual(alerts[f"low-stock-{self.phone.id}"]["severity"], "high")
+        self.assertIn(f"out-of-stock-{self.phone.id}", alerts)
+
+    def test_expiring_reservation(self):
+        InventoryUnit.objects.filter(pk=self.unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.RESERVED,
+            reserved_by=self.sales_admin,
+            reserved_until=timezone.now() + timedelta(hours=3),
+        )
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expiring = self.alerts_by_id(response)[f"expiring-{self.unit.id}"]
+        self.assertEqual(expiring["title"], "Reservation Expiring: Test Phone")
+        self.assertEqual(expiring["reserved_by"], "salesperson")
+        self.assertEqual(expiring["serial_number"], "SN-ALERT-001")
+        self.assertEqual(expiring["severity"], "high")
+
+    def test_discontinued_product_is_not_reported_out_of_stock(self):
+        InventoryUnit.objects.filter(pk=self.unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.SOLD
+        )
+        Product.objects.filter(pk=self.phone.pk).update(is_discontinued=True)
+        self.client.force_authenticate(user=self.manager_user)
+
+        response = self.client.get(self.url)
+
+        alerts = self.alerts_by_id(response)
+        self.assertIn(f"low-stock-{self.phone.id}", alerts)
+        self.assertNotIn(f"out-of-stock-{self.phone.id}", alerts)
@@ -0,0 +1,137 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import (
+    Admin,
+    AdminRole,
+    InventoryUnit,
+    Notification,
+    Product,
+    UnitTransfer,
+)
+
+
+class UnitTransferCreateTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+
+        manager_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.INVENTORY_MANAGER,
+            defaults={
+                "display_name": "Inventory Manager",
+                "description": "Can manage inventory",
+            },
+        )
+        sales_role, _ = AdminRole.objects.get_or_create(
+            name=AdminRole.RoleChoices.SALESPERSON,
+            defaults={
+                "display_name": "Salesperson",
+                "description": "Can view inventory and create orders",
+            },
+        )
+
+        self.manager_user = user_model.objects.create_user(
+            username="inventory_manager",
+            email="inventory@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        Admin.objects.create(user=self.manager_user, admin_code="ADM-IM-001").roles.add(
+            manager_role
+        )
+        self.superuser = user_model.objects.create_superuser(
+            username="root",
+            email="root@example.com",
+            password="test-pass-123",
+        )
+
+        self.sales_user = user_model.objects.create_user(
+            username="salesperson",
+            email="sales@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.sales_admin = Admin.objects.create(user=self.sales_user, admin_code="ADM-SP-001")
+        self.sales_admin.roles.add(sales_role)
+
+        other_sales_user = user_model.objects.create_user(
+            username="other_salesperson",
+            email="other@example.com",
+            password="test-pass-123",
+            is_staff=True,
+        )
+        self.other_sales_admin = Admin.objects.create(
+            user=other_sales_user, admin_code="ADM-SP-002"
+        )
+        self.other_sales_admin.roles.add(sales_role)
+
+        phone = Product.objects.create(
+            product_name="Test Phone",
+            brand="TestBrand",
+            model_series="Phone",
+            product_type=Product.ProductType.PHONE,
+        )
+        self.unit = InventoryUnit.objects.create(
+            product_template=phone,
+            cost_of_unit=Decimal("100.00"),
+            selling_price=Decimal("150.00"),
+            serial_number="SN-TRANSFER-001",
+        )
+        InventoryUnit.objects.filter(pk=self.unit.pk).update(
+            sale_status=InventoryUnit.SaleStatusChoices.RESERVED,
+            reserved_by=self.sales_admin,
+        )
+
+    def test_create_notifies_managers_and_superusers(self):
+        self.client.force_authenticate(user=self.sales_user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("unit-transfer-list"),
+                {
+                    "inventory_unit": self.unit.id,
+                    "inventory_unit_id": self.unit.id,
+                    "to_salesperson": self.other_sales_admin.id,
+                    "to_salesperson_id": self.other_sales_admin.id,
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        transfer = UnitTransfer.objects.get()
+        self.assertEqual(transfer.from_salesperson, self.sales_admin)
+
+        notifications = Notification.objects.filter(
+            notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
+            object_id=transfer.id,
+        )
+        self.assertCountEqual(
+            notifications.values_list("recipient", flat=True),
+            [self.manager_user.id, self.superuser.id],
+        )
+        self.assertTrue(
+            notifications.get(recipient=self.manager_user).message.endswith(
+                "Review and approve if needed."
+            )
+        )
+
+    def test_salesperson_lists_own_transfers(self):
+        transfer = UnitTransfer.objects.create(
+            inventory_unit=self.unit,
+            from_salesperson=self.sales_admin,
+            to_salesperson=self.other_sales_admin,
+        )
+        self.client.force_authenticate(user=self.sales_user)
+
+        response = self.client.get(reverse("unit-transfer-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["results"]], [transfer.id])
+
+        self.client.force_authenticate(user=self.manager_user)
+        response = self.client.get(reverse("unit-transfer-list"))
+        self.assertEqual([row["id"] for row in response.data["results"]], [transfer.id])
@@ -1,4 +1,4 @@
-from django.urls import include, path, re_path
+from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from . import views
@@ -56,11 +56,11 @@ router.register(r"bundle-items", views.BundleItemViewSet, basename="bundle-item"
 # --- 2. Define Custom GenericAPIView Paths ---
 
 # These endpoints handle unique actions or single-object retrieval/update.
-# Create receipt pattern before urlpatterns
-# Use re_path with strict regex to ensure it matches before router patterns
-# Pattern: orders/{uuid}/receipt/ (must match exactly, no trailing variations)
-receipt_pattern = re_path(
-    r"^orders/(?P<order_id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})/receipt/$",
+# Create receipt pattern before urlpatterns so it matches before router patterns
+# Pattern: orders/{uuid}/receipt/ (the uuid converter rejects malformed ids with a 404
+# and hands the view a UUID)
+receipt_pattern = path(
+    "orders/<uuid:order_id>/receipt/",
     views.OrderReceiptView.as_view(),
     name="order-receipt",
 )
@@ -1,18 +1,30 @@
 import base64
 import csv
+import hashlib
 import io
+import json
 import logging
+import os
+import re
+import time
+import traceback
+from collections import defaultdict
 from datetime import timedelta
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
 from urllib.parse import urlencode
 
+import orjson
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.files.base import ContentFile
-from django.db import transaction
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
 from django.db.models import (
     Case,
+    CharField,
     Count,
     Exists,
     ExpressionWrapper,
@@ -29,8 +41,10 @@ from django.db.models import (
     When,
 )  # Added Count, Min, Max, Q for aggregation/filtering
 from django.db.models.functions import Coalesce
-from django.http import FileResponse, HttpResponse
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema, extend_schema_view
 
@@ -39,6 +53,8 @@ from rest_framework import exceptions, filters, generics, permissions, serialize
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -60,6 +76,8 @@ class FixProductVisibilitySerializer(serializers.Serializer):
     secret_key = serializers.CharField(required=False, allow_blank=True)
 
 
+from . import debug_log  # noqa: E402
+
 # Assume these models are imported from your app's models.py
 from .models import (  # noqa: E402
     Admin,
@@ -83,6 +101,7 @@ from .models import (  # noqa: E402
     ProductImage,
     Promotion,
     PromotionType,
+    Receipt,
     ReservationRequest,
     ReturnRequest,
     Review,
@@ -113,7 +132,8 @@ from .permissions import (  # noqa: E402
     IsSalesperson,
     IsSalespersonOrInventoryManagerOrMarketingManagerReadOnly,
     IsSuperuser,
-    get_admin_from_user,
+    get_admin_from_request,
+    get_request_admin,
 )
 from .serializers import (  # noqa: E402
     AdminCreateSerializer,
@@ -148,9 +168,114 @@ from .serializers import (  # noqa: E402
     UnitTransferSerializer,
 )
 from .services.lead_service import LeadService  # noqa: E402
+from .services.pesapal_payment_service import PesapalPaymentService  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Matches Order.idempotency_key max_length
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+_IDEMPOTENCY_KEY_RE = re.compile(rf"[A-Za-z0-9._~:-]{{1,{IDEMPOTENCY_KEY_MAX_LENGTH}}}")
+
+# Issued receipts only change when the order status does
+RECEIPT_CACHE_TTL = 60 * 60
+
+# DiscountCalculatorView: combined price factor per (discount code, customer status)
+_DISCOUNT_FACTORS = {
+    ("SUMMER20", "VIP"): Decimal("0.76"),  # 20% off, then an additional 5% off
+    ("SUMMER20", ""): Decimal("0.80"),
+    ("", "VIP"): Decimal("0.95"),
+    ("", ""): Decimal("1"),
+}
+_CENT = Decimal("0.01")
+
+# Where a promotion can be shown; the tuple keeps the order used in error messages
+PROMOTION_DISPLAY_LOCATIONS = ("stories_carousel", "special_offers", "flash_sales", "homepage_hero")
+_VALID_DISPLAY_LOCATIONS = frozenset(PROMOTION_DISPLAY_LOCATIONS)
+
+
+def _promotion_product_ids(data):
+    """
+    Product ids sent with a promotion write, from JSON (list or single id) or FormData
+    (repeated "products" fields). Returns None when the request does not mention products.
+    """
+    if "products" not in data:
+        return None
+    try:
+        if hasattr(data, "getlist"):
+            # QueryDict format (from FormData) - getlist returns all values
+            return [int(p) for p in data.getlist("products") if p]
+        products = data.get("products")
+        if isinstance(products, list):
+            return [p.id if hasattr(p, "id") else int(p) for p in products if p]
+        return [int(products)] if str(products).isdigit() else []
+    except (TypeError, ValueError):
+        raise ValidationError({"products": ["Products must be a list of product ids."]})
+
+
+@lru_cache(maxsize=1)
+def _pesapal_service():
+    """Process-wide PesapalPaymentService, so its access token and HTTP pool are reused."""
+    return PesapalPaymentService()
+
+
+@lru_cache(maxsize=1)
+def _rr_ct():
+    """ContentType of ReservationRequest, resolved on first use rather than at import time."""
+    return ContentType.objects.get_for_model(ReservationRequest)
+
+
+@lru_cache(maxsize=1)
+def _return_ct():
+    """ContentType of ReturnRequest, resolved on first use rather than at import time."""
+    return ContentType.objects.get_for_model(ReturnRequest)
+
+
+@lru_cache(maxsize=1)
+def _transfer_ct():
+    """ContentType of UnitTransfer, resolved on first use rather than at import time."""
+    return ContentType.objects.get_for_model(UnitTransfer)
+
+
+# Debug-session log written by the local agent tooling, and the keys every entry shares
+_AGENT_LOG_PATH = (
+    "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log"
+)
+_AGENT_LOG_BASE = {"sessionId": "debug-session", "runId": "run1"}
+
+
+def _agent_log_enabled():
+    """Debug-session logs are developer-only: written under DEBUG or when AGENT_DEBUG_LOG is set."""
+    return settings.DEBUG or getattr(settings, "AGENT_DEBUG_LOG", False)
+
+
+def _write_agent_log(log_path, location, message, data=None, *, hypothesis_id="A"):
+    """Queue one debug-session entry for the agent log file. Never raises."""
+    if not _agent_log_enabled():
+        return
+    entry = {
+        **_AGENT_LOG_BASE,
+        "hypothesisId": hypothesis_id,
+        "location": location,
+        "message": message,
+        "data": data or {},
+        "timestamp": time.time_ns() // 1_000_000,
+    }
+    try:
+        debug_log.emit(log_path, orjson.dumps(entry, default=str))
+    except Exception as e:
+        print(f"[DEBUG] Failed to write log: {e}")
+
+
+def _request_fingerprint(request):
+    """SHA-256 of the request method, path and key-sorted payload (stable across retries)."""
+    payload = orjson.dumps(
+        request.data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    digest = hashlib.sha256(f"{request.method} {request.path}\n".encode())
+    digest.update(payload)
+    return digest.hexdigest()
+
+
 # Optional Silk profiling: when SILKY_ENABLED, wrap views so the Silk "Profiling" tab has data
 try:
     if getattr(settings, "SILKY_ENABLED", False):
@@ -183,6 +308,30 @@ class _SilkProfileMixin:
         return super().dispatch(request, *args, **kwargs)
 
 
+class _RequestAdminMixin:
+    """Resolves the requesting user's Admin profile (roles prefetched) at most once per request."""
+
+    admin_prefetch_related = ("roles",)
+
+    def initial(self, request, *args, **kwargs):
+        # Resolve the Admin, with this view's prefetches, before the permission checks run;
+        # they read the same request-scoped memo instead of querying again.
+        # Permission classes let superusers through without one, so theirs stays lazy.
+        if not request.user.is_superuser:
+            self._get_admin()
+        super().initial(request, *args, **kwargs)
+
+    def _get_admin(self):
+        return get_request_admin(self.request, self.admin_prefetch_related)
+
+    def _get_admin_brand_ids(self):
+        """Brand ids of the requesting admin, read from the prefetched brands when available."""
+        admin = self._get_admin()
+        if admin is None:
+            return []
+        return [brand.id for brand in admin.brands.all()]
+
+
 def resolve_staff_brand_or_raise(request, brand_id=None, *, require_brand=False):
     """
     Resolve a brand for staff actions and enforce role-based brand access.
@@ -191,7 +340,7 @@ def resolve_staff_brand_or_raise(request, brand_id=None, *, require_brand=False)
     if not request.user.is_authenticated or not request.user.is_staff:
         return None
 
-    admin = get_admin_from_user(request.user)
+    admin = get_admin_from_request(request)
     if not admin:
         raise exceptions.PermissionDenied("Staff account is missing an admin profile.")
 
@@ -218,8 +367,10 @@ def resolve_staff_brand_or_raise(request, brand_id=None, *, require_brand=False)
             raise exceptions.ValidationError({"brand": "Brand is required."})
         return None
 
-    if admin.brands.count() == 1:
-        return admin.brands.first()
+    # Fetching at most two rows is enough to tell "exactly one brand" from none/many
+    assigned_brands = list(admin.brands.all()[:2])
+    if len(assigned_brands) == 1:
+        return assigned_brands[0]
 
     if require_brand:
         raise exceptions.ValidationError({"brand": "Brand is required for staff actions."})
@@ -721,8 +872,6 @@ class ProductViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             available_units.aggregate(total=Coalesce(Sum("quantity"), Value(0)))["total"] or 0
         )
         if available_units_count > 0:
-            from rest_framework.exceptions import ValidationError
-
             error_message = (
                 f'Unable to delete product "{instance.product_name}" because it still has '
                 f"{available_units_count} available inventory unit(s) associated with it. "
@@ -747,8 +896,6 @@ class ProductViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             logger.error(
                 f"Error cleaning related data for product {instance.id}: {str(e)}", exc_info=True
             )
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError(f"Failed to delete product: {str(e)}")
 
         # Attempt deletion
@@ -758,8 +905,6 @@ class ProductViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             # Log the error for debugging
             logger.error(f"Error deleting product {instance.id}: {str(e)}", exc_info=True)
             # Re-raise with a user-friendly message
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError(f"Failed to delete product: {str(e)}")
 
     def _force_delete_product(self, product):
@@ -1696,7 +1841,7 @@ class ReviewViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         elif self.action in ["update", "partial_update", "destroy"]:
             # Content Creators can edit/delete all reviews
             if self.request.user.is_authenticated and self.request.user.is_staff:
-                admin = get_admin_from_user(self.request.user)
+                admin = get_admin_from_request(self.request)
                 if admin and admin.is_content_creator:
                     return [IsAdminUser()]  # Allow Content Creators to edit any review
         return [IsReviewOwnerOrAdmin()]
@@ -2101,50 +2246,25 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         )
 
         # #region agent log
-        import json
-        import time
-
-        log_path = (
-            "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log"
+        resolver_match = getattr(self.request, "resolver_match", None)
+        _write_agent_log(
+            _AGENT_LOG_PATH,
+            "inventory/views.py:get_object",
+            "get_object() called",
+            {
+                "action": getattr(self, "action", "NOT_SET"),
+                "path": self.request.path,
+                "full_url": self.request.build_absolute_uri()
+                if hasattr(self.request, "build_absolute_uri")
+                else "N/A",
+                "has_receipt_in_path": "receipt" in self.request.path,
+                "lookup_value": str(lookup_value) if lookup_value else None,
+                "resolver_match_route": resolver_match.route if resolver_match else None,
+                "resolver_match_url_name": resolver_match.url_name if resolver_match else None,
+                "resolver_match_kwargs": dict(resolver_match.kwargs) if resolver_match else None,
+            },
+            hypothesis_id="B",
         )
-        try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "B",
-                            "location": "inventory/views.py:get_object",
-                            "message": "get_object() called",
-                            "data": {
-                                "action": getattr(self, "action", "NOT_SET"),
-                                "path": self.request.path,
-                                "full_url": self.request.build_absolute_uri()
-                                if hasattr(self.request, "build_absolute_uri")
-                                else "N/A",
-                                "has_receipt_in_path": "receipt" in self.request.path,
-                                "lookup_value": str(lookup_value) if lookup_value else None,
-                                "resolver_match_route": self.request.resolver_match.route
-                                if hasattr(self.request, "resolver_match")
-                                and self.request.resolver_match
-                                else None,
-                                "resolver_match_url_name": self.request.resolver_match.url_name
-                                if hasattr(self.request, "resolver_match")
-                                and self.request.resolver_match
-                                else None,
-                                "resolver_match_kwargs": dict(self.request.resolver_match.kwargs)
-                                if hasattr(self.request, "resolver_match")
-                                and self.request.resolver_match
-                                else None,
-                            },
-                            "timestamp": int(time.time() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception as e:
-            print(f"[DEBUG] Failed to write log: {e}")
         # #endregion
 
         # Log the lookup attempt
@@ -2242,53 +2362,39 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     f"[GET_OBJECT] Attempting direct lookup for order_id: {lookup_value} (type: {type(lookup_value).__name__})"
                 )
                 # #region agent log
-                try:
-                    order_exists = Order.objects.filter(order_id=lookup_value).exists()
-                    with open(log_path, "a") as f:
-                        f.write(
-                            json.dumps(
-                                {
-                                    "sessionId": "debug-session",
-                                    "runId": "run1",
-                                    "hypothesisId": "B",
-                                    "location": "inventory/views.py:get_object",
-                                    "message": "Before Order.objects.get()",
-                                    "data": {
-                                        "order_id": str(lookup_value),
-                                        "order_exists": order_exists,
-                                    },
-                                    "timestamp": int(time.time() * 1000),
-                                }
-                            )
-                            + "\n"
-                        )
-                except Exception as e:
-                    print(f"[DEBUG] Failed to write log: {e}")
+                if _agent_log_enabled():
+                    _write_agent_log(
+                        _AGENT_LOG_PATH,
+                        "inventory/views.py:get_object",
+                        "Before Order.objects.get()",
+                        {
+                            "order_id": str(lookup_value),
+                            "order_exists": Order.objects.filter(order_id=lookup_value).exists(),
+                        },
+                        hypothesis_id="B",
+                    )
                 # #endregion
-                order = Order.objects.get(order_id=lookup_value)
+                # Direct lookup bypasses get_queryset(); join the relations the payment,
+                # receipt and serializer paths read (customer contact details, creating
+                # staff user, source lead) up front
+                if getattr(self, "action", None) == "payment_status":
+                    # Status polling only needs the key and status; the service loads the
+                    # payment rows itself
+                    order_queryset = Order.objects.only("order_id", "status")
+                else:
+                    order_queryset = Order.objects.select_related(
+                        "customer__user", "user", "source_lead"
+                    )
+                order = order_queryset.get(order_id=lookup_value)
                 print(f"[GET_OBJECT] Order found: {order.order_id}, status: {order.status}")
                 # #region agent log
-                try:
-                    with open(log_path, "a") as f:
-                        f.write(
-                            json.dumps(
-                                {
-                                    "sessionId": "debug-session",
-                                    "runId": "run1",
-                                    "hypothesisId": "B",
-                                    "location": "inventory/views.py:get_object",
-                                    "message": "Order found in get_object()",
-                                    "data": {
-                                        "order_id": str(order.order_id),
-                                        "order_status": order.status,
-                                    },
-                                    "timestamp": int(time.time() * 1000),
-                                }
-                            )
-                            + "\n"
-                        )
-                except Exception as e:
-                    print(f"[DEBUG] Failed to write log: {e}")
+                _write_agent_log(
+                    _AGENT_LOG_PATH,
+                    "inventory/views.py:get_object",
+                    "Order found in get_object()",
+                    {"order_id": str(order.order_id), "order_status": order.status},
+                    hypothesis_id="B",
+                )
                 # #endregion
                 logger.info(
                     "Order found via get_object() direct lookup",
@@ -2302,29 +2408,19 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             except Order.DoesNotExist:
                 print(f"[GET_OBJECT] Order not found: {lookup_value}")
                 # #region agent log
-                try:
+                if _agent_log_enabled():
                     total_orders = Order.objects.count()
-                    with open(log_path, "a") as f:
-                        f.write(
-                            json.dumps(
-                                {
-                                    "sessionId": "debug-session",
-                                    "runId": "run1",
-                                    "hypothesisId": "B",
-                                    "location": "inventory/views.py:get_object",
-                                    "message": "Order.DoesNotExist in get_object()",
-                                    "data": {
-                                        "order_id": str(lookup_value),
-                                        "total_orders_in_db": total_orders,
-                                        "error": "Order.DoesNotExist",
-                                    },
-                                    "timestamp": int(time.time() * 1000),
-                                }
-                            )
-                            + "\n"
-                        )
-                except Exception as e:
-                    print(f"[DEBUG] Failed to write log: {e}")
+                    _write_agent_log(
+                        _AGENT_LOG_PATH,
+                        "inventory/views.py:get_object",
+                        "Order.DoesNotExist in get_object()",
+                        {
+                            "order_id": str(lookup_value),
+                            "total_orders_in_db": total_orders,
+                            "error": "Order.DoesNotExist",
+                        },
+                        hypothesis_id="B",
+                    )
                 # #endregion
                 logger.error(
                     f"Order not found in get_object(): {lookup_value}",
@@ -2425,27 +2521,72 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         # Use parent retrieve method to return the order
         return super().retrieve(request, *args, **kwargs)
 
+    def _get_idempotent_order(self, idempotency_key):
+        """
+        Return the order already created with this idempotency key, or None.
+        The row is locked FOR UPDATE; rows locked by an in-flight request are skipped.
+        """
+        return (
+            Order.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("customer", "user")
+            .prefetch_related("order_items")
+            .filter(idempotency_key=idempotency_key)
+            .first()
+        )
+
+    def _idempotent_replay_response(self, order, fingerprint):
+        """
+        Replay a previously created order as a 200 response.
+        A key reused with a different request body is rejected with 422 instead.
+        """
+        if order.idempotency_fingerprint and order.idempotency_fingerprint != fingerprint:
+            return Response(
+                {
+                    "error": "Idempotency-Key has already been used with a different request.",
+                    "code": "FINGERPRINT_MISMATCH",
+                },
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        response_serializer = self.get_serializer(order)
+        headers = self.get_success_headers(response_serializer.data)
+        return Response(response_serializer.data, status=status.HTTP_200_OK, headers=headers)
+
     @transaction.atomic
     def create(self, request, *args, **kwargs):
         """
         Override create to handle idempotency via Idempotency-Key header.
         If an order with the same idempotency key exists, return it instead of creating a new one.
         """
-        # #region agent log
-        import json
-
-        from django.conf import settings
-        from django.utils import timezone
-
         # Use PESAPAL_LOG_PATH from environment variable, fallback to /tmp/pesapal_debug.log
         log_path = getattr(settings, "PESAPAL_LOG_PATH", "/tmp/pesapal_debug.log")
+        log_location = "inventory/views.py:OrderViewSet.create"
+
+        # Check for idempotency key in header (read once; perform_create reuses it)
+        idempotency_key = request.headers.get("Idempotency-Key") or request.headers.get(
+            "X-Idempotency-Key"
+        )
+        request._idempotency_key = idempotency_key
+        # Reject oversized or malformed keys before any hashing or database work
+        if idempotency_key and not _IDEMPOTENCY_KEY_RE.fullmatch(idempotency_key):
+            too_long = len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH
+            return Response(
+                {
+                    "error": f"Idempotency-Key must be at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters."
+                    if too_long
+                    else "Idempotency-Key may only contain letters, digits and . _ ~ : -",
+                    "code": "KEY_TOO_LONG" if too_long else "INVALID_KEY",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # Fingerprint the request once; stored with the order and compared on replay
+        idempotency_fingerprint = _request_fingerprint(request) if idempotency_key else ""
+        request._idempotency_fingerprint = idempotency_fingerprint
+
+        # #region agent log
         logger.info(
             "Order creation request received",
             extra={
-                "has_idempotency_key_header": bool(
-                    request.headers.get("Idempotency-Key")
-                    or request.headers.get("X-Idempotency-Key")
-                ),
+                "has_idempotency_key_header": bool(idempotency_key),
                 "method": request.method,
                 "user_authenticated": request.user.is_authenticated
                 if hasattr(request, "user")
@@ -2454,11 +2595,6 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         )
         # #endregion
 
-        # Check for idempotency key in header
-        idempotency_key = request.headers.get("Idempotency-Key") or request.headers.get(
-            "X-Idempotency-Key"
-        )
-
         # #region agent log
         logger.info(
             "Idempotency key extracted from header",
@@ -2475,26 +2611,13 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             # Check if order with this key already exists
             try:
                 # #region agent log
-                try:
-                    with open(log_path, "a") as f:
-                        f.write(
-                            json.dumps(
-                                {
-                                    "sessionId": "debug-session",
-                                    "runId": "run1",
-                                    "hypothesisId": "B",
-                                    "location": "inventory/views.py:OrderViewSet.create",
-                                    "message": "Attempting to query existing order by idempotency_key",
-                                    "data": {
-                                        "idempotency_key": idempotency_key[:20] + "...",
-                                    },
-                                    "timestamp": int(timezone.now().timestamp() * 1000),
-                                }
-                            )
-                            + "\n"
-                        )
-                except Exception as e:
-                    print(f"[DEBUG] Failed to write log: {e}")
+                _write_agent_log(
+                    log_path,
+                    log_location,
+                    "Attempting to query existing order by idempotency_key",
+                    {"idempotency_key": idempotency_key[:20] + "..."},
+                    hypothesis_id="B",
+                )
                 # #endregion
 
                 # Check if idempotency_key column exists in database
@@ -2518,30 +2641,18 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                         column_exists = cursor.fetchone() is not None
                 except Exception as db_check_error:
                     # #region agent log
-                    try:
-                        import traceback
+                    import traceback
 
-                        with open(log_path, "a") as f:
-                            f.write(
-                                json.dumps(
-                                    {
-                                        "sessionId": "debug-session",
-                                        "runId": "run1",
-                                        "hypothesisId": "A",
-                                        "location": "inventory/views.py:OrderViewSet.create",
-                                        "message": "ERROR checking if idempotency_key column exists",
-                                        "data": {
-                                            "error_type": type(db_check_error).__name__,
-                                            "error_message": str(db_check_error),
-                                            "traceback": traceback.format_exc(),
-                                        },
-                                        "timestamp": int(timezone.now().timestamp() * 1000),
-                                    }
-                                )
-                                + "\n"
-                            )
-                    except Exception as e:
-                        print(f"[DEBUG] Failed to write log: {e}")
+                    _write_agent_log(
+                        log_path,
+                        log_location,
+                        "ERROR checking if idempotency_key column exists",
+                        {
+                            "error_type": type(db_check_error).__name__,
+                            "error_message": str(db_check_error),
+                            "traceback": traceback.format_exc(),
+                        },
+                    )
                     # #endregion
                     # If we can't check, assume column doesn't exist to be safe
                     column_exists = False
@@ -2550,50 +2661,24 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     )
 
                 # #region agent log
-                try:
-                    with open(log_path, "a") as f:
-                        f.write(
-                            json.dumps(
-                                {
-                                    "sessionId": "debug-session",
-                                    "runId": "run1",
-                                    "hypothesisId": "A",
-                                    "location": "inventory/views.py:OrderViewSet.create",
-                                    "message": "Checked if idempotency_key column exists",
-                                    "data": {
-                                        "column_exists": column_exists,
-                                    },
-                                    "timestamp": int(timezone.now().timestamp() * 1000),
-                                }
-                            )
-                            + "\n"
-                        )
-                except Exception as e:
-                    print(f"[DEBUG] Failed to write log: {e}")
+                _write_agent_log(
+                    log_path,
+                    log_location,
+                    "Checked if idempotency_key column exists",
+                    {"column_exists": column_exists},
+                )
                 # #endregion
 
                 if not column_exists:
                     # #region agent log
-                    try:
-                        with open(log_path, "a") as f:
-                            f.write(
-                                json.dumps(
-                                    {
-                                        "sessionId": "debug-session",
-                                        "runId": "run1",
-                                        "hypothesisId": "A",
-                                        "location": "inventory/views.py:OrderViewSet.create",
-                                        "message": "CONFIRMED: idempotency_key column does not exist - migration not run",
-                                        "data": {
-                                            "error": "Migration 0027_add_idempotency_key_to_order has not been applied",
-                                        },
-                                        "timestamp": int(timezone.now().timestamp() * 1000),
-                                    }
-                                )
-                                + "\n"
-                            )
-                    except Exception as e:
-                        print(f"[DEBUG] Failed to write log: {e}")
+                    _write_agent_log(
+                        log_path,
+                        log_location,
+                        "CONFIRMED: idempotency_key column does not exist - migration not run",
+                        {
+                            "error": "Migration 0027_add_idempotency_key_to_order has not been applied",
+                        },
+                    )
                     # #endregion
                     # Column doesn't exist - skip idempotency check and proceed with normal creation
                     logger.warning(
@@ -2602,94 +2687,56 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 else:
                     # Column exists - proceed with idempotency check
                     try:
-                        existing_order = (
-                            Order.objects.select_related("customer", "user")
-                            .prefetch_related("order_items")
-                            .get(idempotency_key=idempotency_key)
-                        )
+                        # Row-lock the matching order so a concurrent retry with the same key
+                        # cannot re-run side effects while we replay it
+                        existing_order = self._get_idempotent_order(idempotency_key)
+                        if existing_order is None:
+                            raise Order.DoesNotExist
 
                         # #region agent log
-                        try:
-                            with open(log_path, "a") as f:
-                                f.write(
-                                    json.dumps(
-                                        {
-                                            "sessionId": "debug-session",
-                                            "runId": "run1",
-                                            "hypothesisId": "B",
-                                            "location": "inventory/views.py:OrderViewSet.create",
-                                            "message": "Existing order found - returning idempotent response",
-                                            "data": {
-                                                "existing_order_id": str(existing_order.order_id),
-                                            },
-                                            "timestamp": int(timezone.now().timestamp() * 1000),
-                                        }
-                                    )
-                                    + "\n"
-                                )
-                        except Exception as e:
-                            print(f"[DEBUG] Failed to write log: {e}")
+                        _write_agent_log(
+                            log_path,
+                            log_location,
+                            "Existing order found - returning idempotent response",
+                            {"existing_order_id": str(existing_order.order_id)},
+                            hypothesis_id="B",
+                        )
                         # #endregion
 
                         # Order with this idempotency key already exists - return it (idempotent)
                         logger.info(
                             f"Idempotent order request - returning existing order {existing_order.order_id} for key {idempotency_key}"
                         )
-                        response_serializer = self.get_serializer(existing_order)
-                        headers = self.get_success_headers(response_serializer.data)
                         # Return 200 OK with existing order data
-                        return Response(
-                            response_serializer.data, status=status.HTTP_200_OK, headers=headers
+                        return self._idempotent_replay_response(
+                            existing_order, idempotency_fingerprint
                         )
                     except Order.DoesNotExist:
                         # #region agent log
-                        try:
-                            with open(log_path, "a") as f:
-                                f.write(
-                                    json.dumps(
-                                        {
-                                            "sessionId": "debug-session",
-                                            "runId": "run1",
-                                            "hypothesisId": "B",
-                                            "location": "inventory/views.py:OrderViewSet.create",
-                                            "message": "No existing order found - proceeding with creation",
-                                            "data": {},
-                                            "timestamp": int(timezone.now().timestamp() * 1000),
-                                        }
-                                    )
-                                    + "\n"
-                                )
-                        except Exception as e:
-                            print(f"[DEBUG] Failed to write log: {e}")
+                        _write_agent_log(
+                            log_path,
+                            log_location,
+                            "No existing order found - proceeding with creation",
+                            hypothesis_id="B",
+                        )
                         # #endregion
                         # No existing order with this key - proceed with creation
                         pass
                     except Exception as e:
                         # #region agent log
-                        try:
-                            import traceback
-
-                            with open(log_path, "a") as f:
-                                f.write(
-                                    json.dumps(
-                                        {
-                                            "sessionId": "debug-session",
-                                            "runId": "run1",
-                                            "hypothesisId": "B",
-                                            "location": "inventory/views.py:OrderViewSet.create",
-                                            "message": "ERROR checking idempotency key - database query failed",
-                                            "data": {
-                                                "error_type": type(e).__name__,
-                                                "error_message": str(e),
-                                                "traceback": traceback.format_exc(),
-                                            },
-                                            "timestamp": int(timezone.now().timestamp() * 1000),
-                                        }
-                                    )
-                                    + "\n"
-                                )
-                        except Exception as log_err:
-                            print(f"[DEBUG] Failed to write log: {log_err}")
+                        import traceback
+
+                        _write_agent_log(
+                            log_path,
+                            log_location,
+                            "ERROR checking idempotency key - database query failed",
+                            {
+                                "error_type": type(e).__name__,
+                                "error_message": str(e),
+                                "traceback": traceback.format_exc(),
+                            },
+                            hypothesis_id="B",
+                        )
                         # #endregion
                         # Log error but continue with order creation
                         logger.warning(f"Error checking idempotency key: {str(e)}")
@@ -2699,24 +2746,7 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 # Continue with normal order creation
 
         # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                            "location": "inventory/views.py:OrderViewSet.create",
-                            "message": "Proceeding to super().create()",
-                            "data": {},
-                            "timestamp": int(timezone.now().timestamp() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception as e:
-            print(f"[DEBUG] Failed to write log: {e}")
+        _write_agent_log(log_path, log_location, "Proceeding to super().create()")
         # #endregion
 
         # Continue with normal order creation flow
@@ -2730,7 +2760,9 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 },
             )
 
-            result = super().create(request, *args, **kwargs)
+            # Savepoint so a duplicate-key IntegrityError leaves the outer transaction usable
+            with transaction.atomic():
+                result = super().create(request, *args, **kwargs)
 
             logger.info(
                 "super().create() completed successfully",
@@ -2746,6 +2778,21 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 {"error": "Validation failed", "details": e.detail},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        except IntegrityError:
+            if not idempotency_key:
+                raise
+            # A concurrent request with the same key committed first - replay its order
+            existing_order = self._get_idempotent_order(idempotency_key)
+            if existing_order is not None:
+                return self._idempotent_replay_response(existing_order, idempotency_fingerprint)
+            if Order.objects.filter(idempotency_key=idempotency_key).exists():
+                # The original request still holds the row lock; let the client retry shortly
+                return Response(
+                    {"error": "A request with this Idempotency-Key is already in progress."},
+                    status=status.HTTP_409_CONFLICT,
+                    headers={"Retry-After": "1"},
+                )
+            raise
         except Exception as e:
             # Log the full error with traceback - this will show up in Render logs
             logger.error(
@@ -2771,10 +2818,8 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         """
         from inventory.services.customer_service import CustomerService
 
-        # Get idempotency key from header (already checked in create method, but need it here too)
-        idempotency_key = self.request.headers.get("Idempotency-Key") or self.request.headers.get(
-            "X-Idempotency-Key"
-        )
+        # Idempotency key was read from the headers once in create()
+        idempotency_key = getattr(self.request, "_idempotency_key", None)
 
         # Get customer data from request
         customer_name = self.request.data.get("customer_name")
@@ -2783,7 +2828,7 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         delivery_address = self.request.data.get("delivery_address")
 
         admin = (
-            get_admin_from_user(self.request.user)
+            get_admin_from_request(self.request)
             if self.request.user.is_authenticated and self.request.user.is_staff
             else None
         )
@@ -2852,29 +2897,35 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         # Exception: ONLINE orders created by staff don't require brand (they're customer-facing)
         brand_id = self.request.data.get("brand") or self.request.data.get("brand_id")
         brand = None
+        is_staff_request = self.request.user.is_authenticated and self.request.user.is_staff
+        # Load the staff member's brand ids once (single query) and answer every
+        # brand permission question below from this set.
+        admin_brand_ids = set()
+        if is_staff_request:
+            if not admin:
+                raise exceptions.PermissionDenied("Staff account is missing an admin profile.")
+            admin_brand_ids = set(admin.brands.values_list("id", flat=True))
         if brand_id:
+            try:
+                brand_id = int(brand_id)
+            except (TypeError, ValueError):
+                raise exceptions.ValidationError({"brand": "Invalid brand."})
+            if is_staff_request and not (self.request.user.is_superuser or admin.is_global_admin):
+                if not admin_brand_ids:
+                    raise exceptions.PermissionDenied(
+                        "You must be assigned to at least one brand to create orders."
+                    )
+                if brand_id not in admin_brand_ids:
+                    raise exceptions.PermissionDenied("Brand is not assigned to your role.")
             try:
                 brand = Brand.objects.get(id=brand_id, is_active=True)
             except Brand.DoesNotExist:
                 raise exceptions.ValidationError({"brand": "Invalid brand."})
-            if self.request.user.is_authenticated and self.request.user.is_staff:
-                if not admin:
-                    raise exceptions.PermissionDenied("Staff account is missing an admin profile.")
-                if not (self.request.user.is_superuser or admin.is_global_admin):
-                    if admin.brands.exists():
-                        if not admin.brands.filter(id=brand.id).exists():
-                            raise exceptions.PermissionDenied("Brand is not assigned to your role.")
-                    else:
-                        raise exceptions.PermissionDenied(
-                            "You must be assigned to at least one brand to create orders."
-                        )
-        elif self.request.user.is_authenticated and self.request.user.is_staff:
-            if not admin:
-                raise exceptions.PermissionDenied("Staff account is missing an admin profile.")
+        elif is_staff_request:
             # Only require brand for WALK_IN orders; ONLINE orders can proceed without brand
             if order_source == Order.OrderSourceChoices.WALK_IN:
-                if admin.brands.count() == 1:
-                    brand = admin.brands.first()
+                if len(admin_brand_ids) == 1:
+                    brand = Brand.objects.get(pk=next(iter(admin_brand_ids)))
                 else:
                     raise exceptions.ValidationError(
                         {"brand": "Brand is required for walk-in orders created by staff."}
@@ -2882,8 +2933,8 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             # For ONLINE orders, allow proceeding without brand (similar to guest orders)
             # If salesperson has exactly one brand, auto-assign it for convenience
             elif order_source == Order.OrderSourceChoices.ONLINE:
-                if admin.brands.count() == 1:
-                    brand = admin.brands.first()
+                if len(admin_brand_ids) == 1:
+                    brand = Brand.objects.get(pk=next(iter(admin_brand_ids)))
                 # If 0 or 2+ brands, allow order to proceed without brand (ONLINE orders don't require brand)
                 # brand will remain None, which is acceptable for ONLINE orders
 
@@ -2914,6 +2965,9 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 save_kwargs["brand"] = brand
             if idempotency_key:
                 save_kwargs["idempotency_key"] = idempotency_key
+                save_kwargs["idempotency_fingerprint"] = getattr(
+                    self.request, "_idempotency_fingerprint", ""
+                )
                 logger.info(f"Saving order with idempotency_key: {idempotency_key[:20]}...")
             else:
                 logger.info("Saving order without idempotency_key")
@@ -2951,12 +3005,11 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
-        # Refresh from DB to get latest state
-        instance.refresh_from_db()
+        # serializer.instance already holds the saved state (no signal rewrites the row),
+        # so render it directly instead of re-reading it; only drop stale prefetches
         if getattr(instance, "_prefetched_objects_cache", None):
             instance._prefetched_objects_cache = {}
 
-        serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
     def perform_update(self, serializer):
@@ -2977,38 +3030,33 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             and old_status != Order.StatusChoices.CANCELED
         ):
             with transaction.atomic():
-                # Restore all inventory units in this order
-                for order_item in instance.order_items.all():
-                    if order_item.inventory_unit:
-                        unit = order_item.inventory_unit
-                        # Only restore if unit is SOLD or PENDING_PAYMENT
-                        if unit.sale_status in [
+                # Restore all inventory units in this order with a single UPDATE
+                unit_ids = [
+                    order_item.inventory_unit_id
+                    for order_item in instance.order_items.all()
+                    if order_item.inventory_unit_id
+                ]
+                # Clear any reservation timestamps
+                restore_fields = {"reserved_by": None, "reserved_until": None}
+                # Website orders → AVAILABLE
+                if instance.order_source == Order.OrderSourceChoices.ONLINE:
+                    restore_fields["sale_status"] = InventoryUnit.SaleStatusChoices.AVAILABLE
+                # Inventory system orders → RESERVED
+                elif instance.order_source == Order.OrderSourceChoices.WALK_IN:
+                    restore_fields["sale_status"] = InventoryUnit.SaleStatusChoices.RESERVED
+                if unit_ids:
+                    # Only restore units that are SOLD or PENDING_PAYMENT
+                    InventoryUnit.objects.filter(
+                        id__in=unit_ids,
+                        sale_status__in=[
                             InventoryUnit.SaleStatusChoices.SOLD,
                             InventoryUnit.SaleStatusChoices.PENDING_PAYMENT,
-                        ]:
-                            # Website orders → AVAILABLE
-                            if instance.order_source == Order.OrderSourceChoices.ONLINE:
-                                unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                            # Inventory system orders → RESERVED
-                            elif instance.order_source == Order.OrderSourceChoices.WALK_IN:
-                                unit.sale_status = InventoryUnit.SaleStatusChoices.RESERVED
-
-                            # Clear any reservation timestamps
-                            unit.reserved_by = None
-                            unit.reserved_until = None
-                            unit.save(
-                                update_fields=["sale_status", "reserved_by", "reserved_until"]
-                            )
+                        ],
+                    ).update(**restore_fields)
 
-        # Save the order with updated status
-        # The serializer.update() method already set instance.status, so save() will persist it
+        # Save the order with updated status (OrderSerializer.update persists the status column)
         serializer.save()
 
-        # Explicitly ensure status is saved (in case serializer.save() didn't pick it up)
-        if "status" in serializer.validated_data:
-            instance.status = serializer.validated_data["status"]
-            instance.save(update_fields=["status"])
-
     @action(detail=True, methods=["post"])
     def confirm_payment(self, request, pk=None, order_id=None):
         """Confirm payment for an order - transitions units from PENDING_PAYMENT to SOLD and status to PAID."""
@@ -3035,28 +3083,66 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             )
 
         # Salespersons can only confirm orders from their assigned brands
-        try:
-            admin = Admin.objects.get(user=request.user)
-            if admin.is_salesperson and not admin.is_global_admin:
-                # Check if order is from salesperson's brand
-                if order.brand and order.brand not in admin.brands.all():
-                    raise exceptions.PermissionDenied(
-                        "You can only confirm payment for orders from your assigned brands."
-                    )
-        except Admin.DoesNotExist:
-            pass
+        admin = get_admin_from_request(request)
+        if admin and admin.is_salesperson and not admin.is_global_admin:
+            # Check if order is from salesperson's brand
+            if order.brand and order.brand not in admin.brands.all():
+                raise exceptions.PermissionDenied(
+                    "You can only confirm payment for orders from your assigned brands."
+                )
 
         with transaction.atomic():
-            # Get all order items
-            order_items = order.order_items.all()
+            # Get all order items (with their units and templates in the same query)
+            order_items = list(order.order_items.select_related("inventory_unit__product_template"))
 
-            if not order_items.exists():
+            if not order_items:
                 return Response({"error": "Order has no items"}, status=status.HTTP_400_BAD_REQUEST)
 
             # Update inventory units: For accessories, decrement quantity and mark as SOLD if quantity reaches 0
             # For unique items, mark as SOLD
             from inventory.models import Product
 
+            # The same unit may back several order items; work on one in-memory copy per unit
+            units_by_id = {}
+            for order_item in order_items:
+                if order_item.inventory_unit_id:
+                    order_item.inventory_unit = units_by_id.setdefault(
+                        order_item.inventory_unit_id, order_item.inventory_unit
+                    )
+            accessory_unit_ids = [
+                unit.id
+                for unit in units_by_id.values()
+                if unit.product_template.product_type == Product.ProductType.ACCESSORY
+            ]
+
+            # Approved reservations held by the order's salesperson for these accessories,
+            # loaded once for the whole order instead of once per item
+            order_admin = (
+                Admin.objects.filter(user=order.user).first()
+                if order.user and accessory_unit_ids
+                else None
+            )
+            reservation_requests = []
+            if order_admin:
+                reservation_requests = list(
+                    ReservationRequest.objects.filter(
+                        requesting_salesperson=order_admin,
+                        status=ReservationRequest.StatusChoices.APPROVED,
+                        inventory_units__id__in=accessory_unit_ids,
+                    )
+                    .distinct()
+                    .order_by("approved_at", "requested_at")
+                    .prefetch_related(
+                        Prefetch("inventory_units", queryset=InventoryUnit.objects.only("id"))
+                    )
+                )
+            reservation_unit_ids = {
+                req.id: {unit.id for unit in req.inventory_units.all()}
+                for req in reservation_requests
+            }
+
+            units_to_save = {}
+            reservations_to_save = {}
             units_updated = []
             for order_item in order_items:
                 unit = order_item.inventory_unit
@@ -3066,39 +3152,25 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 if unit.product_template.product_type == Product.ProductType.ACCESSORY:
                     # Accessory: consume reserved quantities first (if any), then decrement remaining
                     reserved_consumed = 0
-                    try:
-                        admin = Admin.objects.get(user=order.user) if order.user else None
-                    except Admin.DoesNotExist:
-                        admin = None
-                    if admin:
-                        remaining_to_consume = order_item.quantity
-                        reservation_requests = ReservationRequest.objects.filter(
-                            requesting_salesperson=admin,
-                            status=ReservationRequest.StatusChoices.APPROVED,
-                            inventory_units=unit,
-                        ).order_by("approved_at", "requested_at")
-                        for req in reservation_requests:
-                            unit_quantities = req.inventory_unit_quantities or {}
-                            qty = (
-                                unit_quantities.get(str(unit.id))
-                                or unit_quantities.get(unit.id)
-                                or 0
-                            )
-                            if qty <= 0:
-                                continue
-                            consume = min(remaining_to_consume, qty)
-                            unit_quantities[str(unit.id)] = qty - consume
-                            req.inventory_unit_quantities = unit_quantities
-                            if all(v == 0 for v in unit_quantities.values()):
-                                req.status = ReservationRequest.StatusChoices.RETURNED
-                                req.expires_at = timezone.now()
-                            req.save(
-                                update_fields=["inventory_unit_quantities", "status", "expires_at"]
-                            )
-                            reserved_consumed += consume
-                            remaining_to_consume -= consume
-                            if remaining_to_consume == 0:
-                                break
+                    remaining_to_consume = order_item.quantity
+                    for req in reservation_requests:
+                        if remaining_to_consume == 0:
+                            break
+                        if unit.id not in reservation_unit_ids[req.id]:
+                            continue
+                        unit_quantities = req.inventory_unit_quantities or {}
+                        qty = unit_quantities.get(str(unit.id)) or 0
+                        if qty <= 0:
+                            continue
+                        consume = min(remaining_to_consume, qty)
+                        unit_quantities[str(unit.id)] = qty - consume
+                        req.inventory_unit_quantities = unit_quantities
+                        if all(v == 0 for v in unit_quantities.values()):
+                            req.status = ReservationRequest.StatusChoices.RETURNED
+                            req.expires_at = timezone.now()
+                        reservations_to_save[req.id] = req
+                        reserved_consumed += consume
+                        remaining_to_consume -= consume
 
                     decrement_qty = max(0, order_item.quantity - reserved_consumed)
                     if decrement_qty > 0:
@@ -3107,15 +3179,25 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                         unit.sale_status = InventoryUnit.SaleStatusChoices.SOLD
                     else:
                         unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                    unit.save(update_fields=["quantity", "sale_status"])
+                    units_to_save[unit.id] = unit
                     units_updated.append(unit.id)
                 else:
                     # Unique item (Phone/Laptop/Tablet): Mark as SOLD
                     if unit.sale_status == InventoryUnit.SaleStatusChoices.PENDING_PAYMENT:
                         unit.sale_status = InventoryUnit.SaleStatusChoices.SOLD
-                        unit.save(update_fields=["sale_status"])
+                        units_to_save[unit.id] = unit
                         units_updated.append(unit.id)
 
+            if reservations_to_save:
+                ReservationRequest.objects.bulk_update(
+                    list(reservations_to_save.values()),
+                    ["inventory_unit_quantities", "status", "expires_at"],
+                )
+            if units_to_save:
+                InventoryUnit.objects.bulk_update(
+                    list(units_to_save.values()), ["quantity", "sale_status"]
+                )
+
             if not units_updated:
                 return Response(
                     {
@@ -3128,58 +3210,39 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             order.status = Order.StatusChoices.PAID
             order.save(update_fields=["status"])
 
-            # Generate and send receipt automatically (email + WhatsApp)
-            try:
-                from inventory.services.receipt_service import ReceiptService
-
-                receipt, email_sent, whatsapp_sent = ReceiptService.generate_and_send_receipt(order)
-                logger.info(
-                    "Receipt generated after cash confirmation",
-                    extra={
-                        "order_id": str(order.order_id),
-                        "receipt_number": receipt.receipt_number,
-                        "email_sent": email_sent,
-                        "whatsapp_sent": whatsapp_sent,
-                    },
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate receipt after cash confirmation for order {order.order_id}: {e}",
-                    exc_info=True,
-                )
-                # Don't fail payment confirmation if receipt generation fails
+            # Receipt email + WhatsApp are queued by the Order post_save signal on the PAID
+            # transition and sent after this transaction commits
 
             # Clear the associated cart if it exists (cart is linked to lead, which is linked to order)
             # This ensures the customer's cart is cleared once payment is confirmed
             cart_cleared = False
             try:
-                if hasattr(order, "source_lead") and order.source_lead:
-                    lead = order.source_lead
-                    if hasattr(lead, "cart") and lead.cart:
-                        cart = lead.cart
-                        cart.delete()
-                        cart_cleared = True
-                        print(
-                            f"Cart {cart.id} deleted after payment confirmed for order {order.order_id}"
-                        )
+                # One DELETE by the lead -> order link; no Cart/CartItem rows are loaded.
+                # Savepoint so a failure here can't poison the payment transaction.
+                with transaction.atomic():
+                    deleted_count, _ = Cart.objects.filter(lead__order=order).delete()
+                cart_cleared = deleted_count > 0
+                if cart_cleared:
+                    print(f"Cart deleted after payment confirmed for order {order.order_id}")
             except Exception as e:
                 # Log but don't fail payment confirmation if cart deletion fails
                 print(f"Warning: Could not delete cart after payment confirmation: {e}")
 
-            message = f"Payment confirmed. {len(units_updated)} unit(s) marked as SOLD. Order is now visible to Order Managers."
-            if cart_cleared:
-                message += " Cart has been cleared."
+        # Built after the transaction commits so row locks aren't held while formatting
+        message = f"Payment confirmed. {len(units_updated)} unit(s) marked as SOLD. Order is now visible to Order Managers."
+        if cart_cleared:
+            message += " Cart has been cleared."
 
-            return Response(
-                {
-                    "message": message,
-                    "payment_method": payment_method,
-                    "units_updated": units_updated,
-                    "order_id": str(order.order_id),
-                    "order_status": order.get_status_display(),
-                    "cart_cleared": cart_cleared,
-                }
-            )
+        return Response(
+            {
+                "message": message,
+                "payment_method": payment_method,
+                "units_updated": units_updated,
+                "order_id": str(order.order_id),
+                "order_status": order.get_status_display(),
+                "cart_cleared": cart_cleared,
+            }
+        )
 
     @extend_schema(request=InitiatePaymentRequestSerializer, responses=OpenApiTypes.OBJECT)
     @action(
@@ -3190,39 +3253,18 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
     )
     def initiate_payment(self, request, pk=None, **kwargs):
         """Initiate Pesapal payment for an order."""
-        print("\n[PESAPAL] ========== VIEW: INITIATE PAYMENT START ==========")
-        print(f"[PESAPAL] Order PK: {pk}")
-        print(f"[PESAPAL] Request Method: {request.method}")
-        print(f"[PESAPAL] Additional kwargs: {kwargs}")
-        import json
-
-        print(f"[PESAPAL] Request Data: {json.dumps(request.data, indent=2, default=str)}")
-        print(f"[PESAPAL] User Authenticated: {request.user.is_authenticated}")
-
         try:
-            from inventory.services.pesapal_payment_service import PesapalPaymentService
-
-            print("[PESAPAL] Getting order object...")
             order = self.get_object()
-            print(
-                f"[PESAPAL] Order retrieved - ID: {order.order_id}, Status: {order.status}, Amount: {order.total_amount}"
-            )
 
-            service = PesapalPaymentService()
+            service = _pesapal_service()
 
             if order.status != Order.StatusChoices.PENDING:
-                print("[PESAPAL] ========== VIEW: INITIATE PAYMENT FAILED ==========")
-                print(f"[PESAPAL] ERROR: Order is already {order.status}")
-                print("[PESAPAL] ==================================================\n")
                 return Response(
                     {"error": f"Order is already {order.status}. Cannot initiate payment."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
             if order.total_amount <= 0:
-                print("[PESAPAL] ========== VIEW: INITIATE PAYMENT FAILED ==========")
-                print("[PESAPAL] ERROR: Order total amount must be greater than 0")
-                print("[PESAPAL] ==================================================\n")
                 return Response(
                     {"error": "Order total amount must be greater than 0"},
                     status=status.HTTP_400_BAD_REQUEST,
@@ -3232,9 +3274,6 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             if not callback_url:
                 callback_url = getattr(settings, "PESAPAL_CALLBACK_URL", "")
                 if not callback_url:
-                    print("[PESAPAL] ========== VIEW: INITIATE PAYMENT FAILED ==========")
-                    print("[PESAPAL] ERROR: callback_url is required")
-                    print("[PESAPAL] ==================================================\n")
                     return Response(
                         {"error": "callback_url is required"}, status=status.HTTP_400_BAD_REQUEST
                     )
@@ -3271,7 +3310,6 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             if not billing_address and order.customer and order.customer.delivery_address:
                 billing_address = {"line_1": order.customer.delivery_address}
 
-            print("[PESAPAL] Calling service.initiate_payment...")
             result = service.initiate_payment(
                 order=order,
                 callback_url=callback_url,
@@ -3280,32 +3318,23 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 billing_address=billing_address,
             )
 
-            print(f"[PESAPAL] Service result: {json.dumps(result, indent=2, default=str)}")
+            success = bool(result.get("success"))
+            logger.info(
+                "pesapal.initiate",
+                extra={
+                    "order_id": str(order.order_id),
+                    "success": success,
+                    "has_redirect_url": bool(result.get("redirect_url")),
+                },
+            )
 
-            if not result.get("success"):
-                print("[PESAPAL] ========== VIEW: INITIATE PAYMENT FAILED ==========")
-                print("[PESAPAL] Service returned failure")
-                print("[PESAPAL] ==================================================\n")
+            if not success:
                 return Response(result, status=status.HTTP_400_BAD_REQUEST)
 
-            print("[PESAPAL] ========== VIEW: INITIATE PAYMENT SUCCESS ==========")
-            print("[PESAPAL] Returning success response to client")
-            print(
-                f"[PESAPAL] Response includes redirect_url: {result.get('redirect_url', 'NOT PROVIDED')}"
-            )
-            print("[PESAPAL] ⚠️  FRONTEND MUST REDIRECT USER TO redirect_url IMMEDIATELY")
-            print("[PESAPAL] ===================================================\n")
             return Response(result, status=status.HTTP_200_OK)
 
         except Exception as e:
-            import traceback
-
-            error_msg = f"Error initiating payment for order {pk}: {str(e)}"
-            print("[PESAPAL] ========== VIEW: INITIATE PAYMENT EXCEPTION ==========")
-            print(f"[PESAPAL] ERROR: {error_msg}")
-            print(f"[PESAPAL] Traceback:\n{traceback.format_exc()}")
-            print("[PESAPAL] =====================================================\n")
-            logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            logger.error(f"Error initiating payment for order {pk}: {e}", exc_info=True)
             return Response(
                 {
                     "error": "Failed to initiate payment",
@@ -3324,66 +3353,20 @@ class OrderViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
     )
     def payment_status(self, request, pk=None, **kwargs):
         """Get payment status for an order."""
-        # #region agent log
-        import json
-        import time
-
-        log_path = (
-            "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log"
-        )
         try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                            "location": "inventory/views.py:payment_status",
-                            "message": "payment_status called",
-                            "data": {
-                                "pk": str(pk) if pk else None,
-                                "kwargs": dict(kwargs),
-                                "request_method": request.method,
-                                "lookup_field": getattr(self, "lookup_field", None),
-                            },
-                            "timestamp": int(time.time() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # #endregion
-        print("\n[PESAPAL] ========== VIEW: PAYMENT STATUS START ==========")
-        print(f"[PESAPAL] Order PK: {pk}")
-        print(f"[PESAPAL] Additional kwargs: {kwargs}")
-        print(f"[PESAPAL] Request Method: {request.method}")
+            order = self.get_object()
 
-        try:
-            import json
-
-            from inventory.services.pesapal_payment_service import PesapalPaymentService
-
-            order = self.get_object()
-            print(f"[PESAPAL] Order retrieved - ID: {order.order_id}")
-
-            service = PesapalPaymentService()
-
-            print("[PESAPAL] Calling service.get_payment_status...")
+            service = _pesapal_service()
             result = service.get_payment_status(order)
 
-            print(f"[PESAPAL] Service result: {json.dumps(result, indent=2, default=str)}")
-            print("[PESAPAL] ========== VIEW: PAYMENT STATUS SUCCESS ==========\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "pesapal.payment_status",
+                    extra={"order_id": str(order.order_id), "result": result},
+                )
             return Response(result, status=status.HTTP_200_OK)
 
         except Exception as e:
-            print("[PESAPAL] ========== VIEW: PAYMENT STATUS EXCEPTION ==========")
-            print(f"[PESAPAL] ERROR: {str(e)}")
-            import traceback
-
-            print(f"[PESAPAL] Traceback:\n{traceback.format_exc()}")
-            print("[PESAPAL] ===================================================\n")
             logger.error(f"Error getting payment status: {str(e)}", exc_info=True)
             return Response(
                 {"error": "Failed to get payment status"},
@@ -3398,7 +3381,19 @@ class OrderItemViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
     Uses IsAdminUser.
     """
 
-    queryset = OrderItem.objects.all().select_related("order", "inventory_unit")
+    # The serializer reads only product_name / bundle title from the joined rows, and nothing
+    # from the order, so keep the long product copy and bundle description out of the SELECT
+    queryset = (
+        OrderItem.objects.all()
+        .select_related("inventory_unit__product_template", "bundle")
+        .defer(
+            "inventory_unit__product_template__product_description",
+            "inventory_unit__product_template__meta_description",
+            "inventory_unit__product_template__product_highlights",
+            "inventory_unit__product_template__long_description",
+            "bundle__description",
+        )
+    )
     serializer_class = OrderItemSerializer
     permission_classes = [IsAdminUser]
 
@@ -3469,6 +3464,8 @@ class ProductAccessoryViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
     Link model between products and accessories. Admin-only write, public read.
     Uses IsAdminOrReadOnly.
     Allows all product types to have accessories (including accessories having accessories).
+    An accessory's own accessories are separate ProductAccessory rows; the serializer is flat,
+    so only one level of the accessory graph is prefetched.
     """
 
     queryset = _product_accessory_queryset()
@@ -3537,11 +3534,12 @@ class AdminTokenLoginView(ObtainAuthToken):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Update last_login
+        # Update last_login with a single UPDATE (no read-modify-write of the user row)
         user.last_login = timezone.now()
-        user.save(update_fields=["last_login"])
+        User.objects.filter(pk=user.pk).update(last_login=user.last_login)
 
-        # Get or create token
+        # Get or create token. Token.user is the primary key, so concurrent first logins
+        # collide on insert and get_or_create falls back to fetching the winner's token.
         token, created = Token.objects.get_or_create(user=user)
 
         profile_data = AdminSerializer(admin_profile).data
@@ -3763,9 +3761,10 @@ class OrderReceiptView(APIView):
         Override to skip DRF's content negotiation.
         This view handles format (html/pdf) directly in get(), so we don't need DRF's negotiation.
         """
-        # Return None to skip content negotiation
-        # DRF will use default renderers, but we handle format ourselves in get()
-        return (None, None)
+        # Receipts are returned as HttpResponse/FileResponse; only the JSON error
+        # responses go through a renderer, so always pick the default one
+        renderer = self.renderer_classes[0]()
+        return (renderer, renderer.media_type)
 
     @extend_schema(responses=OpenApiTypes.BINARY)
     def get(self, request, order_id):
@@ -3777,87 +3776,100 @@ class OrderReceiptView(APIView):
         2. For unauthenticated users: Order must be PAID
         3. For authenticated users: Must be their own order (unless staff)
         """
-        import os
-        from uuid import UUID
-
-        from django.utils import timezone
-        from rest_framework import status
-        from rest_framework.response import Response
-
-        from inventory.models import Order, Receipt
+        # Imported here: receipt_service pulls in weasyprint, whose native libraries
+        # (pango) are not installed in every image, and views must import without them
         from inventory.services.receipt_service import ReceiptService
 
-        # 1. Validate and get order
+        # 1-2. Get the order with the access rules applied in SQL, so a request that may not
+        # see the receipt gets nothing back (and learns nothing about the order's existence)
+        orders = Order.objects.filter(order_id=order_id)
+        if request.user.is_staff:
+            # Staff can view any receipt
+            denied = ("Order not found.", status.HTTP_404_NOT_FOUND)
+        elif request.user.is_authenticated:
+            # Authenticated users can only view their own receipts
+            orders = orders.filter(customer__user=request.user)
+            denied = ("You do not have permission to view this receipt.", status.HTTP_403_FORBIDDEN)
+        else:
+            # Unauthenticated users: only for PAID orders (guest checkout)
+            orders = orders.filter(status=Order.StatusChoices.PAID)
+            denied = ("Receipt is only available for paid orders.", status.HTTP_403_FORBIDDEN)
+
         try:
-            if isinstance(order_id, str):
-                order_id = UUID(order_id)
-            order = Order.objects.get(order_id=order_id)
-        except Order.DoesNotExist:
-            return Response({"error": "Order not found."}, status=status.HTTP_404_NOT_FOUND)
-        except (ValueError, TypeError):
-            logger.error(f"Invalid order ID format: {order_id}")
-            return Response(
-                {"error": "Invalid order ID format."}, status=status.HTTP_400_BAD_REQUEST
-            )
+            order = orders.only("order_id", "status").first()
         except Exception as e:
             logger.error(f"Error retrieving order: {e}", exc_info=True)
             return Response(
                 {"error": "Failed to retrieve order."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        # 2. Security: Check permissions
-        if request.user.is_staff:
-            # Staff can view any receipt
-            pass
-        elif request.user.is_authenticated:
-            # Authenticated users can only view their own receipts
-            if order.customer.user != request.user:
-                return Response(
-                    {"error": "You do not have permission to view this receipt."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-        else:
-            # Unauthenticated users: only for PAID orders (guest checkout)
-            if order.status != Order.StatusChoices.PAID:
-                return Response(
-                    {"error": "Receipt is only available for paid orders."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        if order is None:
+            error, error_status = denied
+            return Response({"error": error}, status=error_status)
 
         # 3. Generate receipt
         format_type = request.query_params.get("format", "html")
 
+        # Repeat loads (customer refreshing the page) revalidate without re-rendering
+        etag = f'"receipt-{order.order_id.hex}-{order.status.lower()}-{format_type}"'
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            return response
+
         try:
             if format_type == "pdf":
-                # Get or create receipt record
-                receipt, created = Receipt.objects.get_or_create(order=order)
+                # Get or create receipt record; the number is only generated on insert
+                receipt, created = Receipt.objects.get_or_create(
+                    order=order,
+                    defaults={
+                        "receipt_number": lambda: ReceiptService.generate_receipt_number(order)
+                    },
+                )
+                update_fields = []
                 if not receipt.receipt_number:
                     receipt.receipt_number = ReceiptService.generate_receipt_number(order)
-                    receipt.save(update_fields=["receipt_number"])
+                    update_fields.append("receipt_number")
 
                 # Generate PDF if not exists or file is missing
-                if not receipt.pdf_file or (
-                    receipt.pdf_file and not os.path.exists(receipt.pdf_file.path)
+                # Ask the storage backend rather than stat-ing a local path (remote
+                # storages have no .path)
+                if not receipt.pdf_file or not receipt.pdf_file.storage.exists(
+                    receipt.pdf_file.name
                 ):
+                    # Full row + the relations the receipt template reads
+                    order = Order.objects.select_related("customer__user", "user").get(pk=order.pk)
                     pdf_bytes = ReceiptService.generate_receipt_pdf(order)
                     pdf_filename = f"receipt_{order.order_id}_{receipt.receipt_number}.pdf"
                     pdf_path = os.path.join(
                         "receipts", timezone.now().strftime("%Y/%m"), pdf_filename
                     )
-                    receipt.pdf_file.save(pdf_path, ContentFile(pdf_bytes), save=True)
+                    receipt.pdf_file.save(pdf_path, ContentFile(pdf_bytes), save=False)
+                    update_fields.append("pdf_file")
+
+                if update_fields:
+                    receipt.save(update_fields=update_fields)
 
                 # Return PDF
                 response = FileResponse(
-                    open(receipt.pdf_file.path, "rb"), content_type="application/pdf"
-                )
-                response["Content-Disposition"] = (
-                    f'attachment; filename="receipt_{receipt.receipt_number}.pdf"'
+                    receipt.pdf_file.open("rb"),
+                    as_attachment=True,
+                    filename=f"receipt_{receipt.receipt_number}.pdf",
+                    content_type="application/pdf",
                 )
-                return response
+                response["Cache-Control"] = f"private, max-age={RECEIPT_CACHE_TTL}"
             else:
                 # Return HTML
-                html_content = ReceiptService.generate_receipt_html(order)
-                return HttpResponse(html_content, content_type="text/html")
+                cache_key = f"receipt:html:{order.order_id}:{order.status}"
+                html_content = cache.get(cache_key)
+                if html_content is None:
+                    order = Order.objects.select_related("customer__user", "user").get(pk=order.pk)
+                    html_content = ReceiptService.generate_receipt_html(order)
+                    cache.set(cache_key, html_content, RECEIPT_CACHE_TTL)
+                response = HttpResponse(html_content, content_type="text/html")
+
+            response["ETag"] = etag
+            return response
 
         except Exception as e:
             logger.error(f"Error generating receipt for order {order.order_id}: {e}", exc_info=True)
@@ -3890,19 +3902,15 @@ class DiscountCalculatorView(generics.GenericAPIView):
         discount_code = request.data.get("discount_code", "")
         customer_status = request.data.get("customer_status", "")
 
-        final_price = base_price
-
         # --- Example Discount Logic (Placeholder) ---
-        if discount_code.upper() == "SUMMER20":
-            final_price *= Decimal("0.80")  # 20% off
-
-        if customer_status.upper() == "VIP":
-            final_price *= Decimal("0.95")  # Additional 5% off
+        code = "SUMMER20" if str(discount_code).upper() == "SUMMER20" else ""
+        tier = "VIP" if str(customer_status).upper() == "VIP" else ""
+        final_price = (base_price * _DISCOUNT_FACTORS[(code, tier)]).quantize(_CENT)
 
         return Response(
             {
                 "original_price": base_price,
-                "final_price": round(final_price, 2),
+                "final_price": final_price,
                 "currency": "KES",
                 "details": f"Applied discount code '{discount_code or 'None'}' and status '{customer_status or 'None'}'.",
             }
@@ -3917,7 +3925,7 @@ class DiscountCalculatorView(generics.GenericAPIView):
 # -------------------------------------------------------------------------
 
 
-class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
+class ReservationRequestViewSet(_RequestAdminMixin, _SilkProfileMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing reservation requests.
     - Salespersons can create requests and view their own
@@ -3926,6 +3934,35 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
 
     serializer_class = ReservationRequestSerializer
     permission_classes = [IsAdminUser]
+    validation_error_envelope_actions = ("create",)
+
+    # Every ReservationRequest column, but only the columns of the joined rows that the
+    # serializer and the approval flow read (no password hashes, product descriptions, ...)
+    queryset_only_fields = (
+        "id",
+        "requesting_salesperson",
+        "inventory_unit",
+        "status",
+        "requested_at",
+        "approved_at",
+        "expires_at",
+        "approved_by",
+        "notes",
+        "inventory_unit_quantities",
+        "requesting_salesperson__user",
+        "requesting_salesperson__user__username",
+        "inventory_unit__serial_number",
+        "inventory_unit__condition",
+        "inventory_unit__grade",
+        "inventory_unit__selling_price",
+        "inventory_unit__sale_status",
+        "inventory_unit__quantity",
+        "inventory_unit__product_template",
+        "inventory_unit__product_template__product_name",
+        "inventory_unit__product_template__product_type",
+        "approved_by__user",
+        "approved_by__user__username",
+    )
 
     def get_queryset(self):
         """Filter queryset based on user role."""
@@ -3933,6 +3970,23 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         if not user.is_authenticated:
             return ReservationRequest.objects.none()
 
+        # Units are prefetched with just the columns the serializer renders
+        unit_prefetch = Prefetch(
+            "inventory_units",
+            queryset=InventoryUnit.objects.select_related("product_template").only(
+                "id",
+                "serial_number",
+                "condition",
+                "grade",
+                "selling_price",
+                "quantity",
+                "sale_status",
+                "reserved_by_id",
+                "product_template__product_name",
+                "product_template__product_type",
+            ),
+        )
+
         # Superuser sees all
         if user.is_superuser:
             return (
@@ -3942,12 +3996,12 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     "inventory_unit__product_template",
                     "approved_by__user",
                 )
-                .prefetch_related("inventory_units__product_template")
+                .prefetch_related(unit_prefetch)
+                .only(*self.queryset_only_fields)
             )
 
-        try:
-            admin = Admin.objects.get(user=user)
-        except Admin.DoesNotExist:
+        admin = self._get_admin()
+        if admin is None:
             return ReservationRequest.objects.none()
 
         # Inventory Manager sees all requests (pending, approved, rejected, expired)
@@ -3960,7 +4014,8 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     "inventory_unit__product_template",
                     "approved_by__user",
                 )
-                .prefetch_related("inventory_units__product_template")
+                .prefetch_related(unit_prefetch)
+                .only(*self.queryset_only_fields)
             )
 
         # Salesperson sees only their own requests
@@ -3972,7 +4027,8 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     "inventory_unit__product_template",
                     "approved_by__user",
                 )
-                .prefetch_related("inventory_units__product_template")
+                .prefetch_related(unit_prefetch)
+                .only(*self.queryset_only_fields)
             )
 
         return ReservationRequest.objects.none()
@@ -3985,57 +4041,39 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             # Allow salespersons to edit their own PENDING requests
             # Allow inventory managers to approve/reject
             # Get object directly from DB to avoid recursion (don't use get_object() which triggers permission checks)
-            request_obj = None
+            # Only the status and owner are needed here, so skip the JSON/text columns
+            request_obj = getattr(self, "_perm_request_obj", None)
             pk = self.kwargs.get("pk")
-            if pk:
+            if request_obj is None and pk:
                 try:
-                    request_obj = ReservationRequest.objects.get(pk=pk)
+                    request_obj = ReservationRequest.objects.only(
+                        "status", "requesting_salesperson_id"
+                    ).get(pk=pk)
                 except ReservationRequest.DoesNotExist:
                     pass
+                self._perm_request_obj = request_obj
 
             if request_obj and request_obj.status == ReservationRequest.StatusChoices.PENDING:
-                try:
-                    admin = Admin.objects.get(user=self.request.user)
-                    # Salesperson can edit their own pending requests
-                    if admin.is_salesperson and request_obj.requesting_salesperson == admin:
-                        return [IsAdminUser()]  # Allow edit
-                except Admin.DoesNotExist:
-                    pass
+                admin = self._get_admin()
+                # Salesperson can edit their own pending requests
+                if (
+                    admin
+                    and admin.is_salesperson
+                    and request_obj.requesting_salesperson_id == admin.pk
+                ):
+                    return [IsAdminUser()]  # Allow edit
             # For approval/rejection, require CanApproveRequests
             return [CanApproveRequests()]
         return [IsAdminUser()]
 
     def create(self, request, *args, **kwargs):
-        """Override create to provide clearer validation errors."""
-        from rest_framework import serializers as drf_serializers
-
+        """Override create to turn unexpected errors into a clear 400 response."""
+        # Validation errors are rendered as {"error", "details"} by the project exception
+        # handler (see validation_error_envelope_actions)
         try:
-            serializer = self.get_serializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
-            headers = self.get_success_headers(serializer.data)
-            return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
-        except drf_serializers.ValidationError as e:
-            logger.error(f"Reservation request creation validation error: {e.detail}")
-            error_message = "Validation failed"
-            if isinstance(e.detail, dict):
-                error_parts = []
-                for field, messages in e.detail.items():
-                    if isinstance(messages, list):
-                        error_parts.append(f"{field}: {', '.join(str(m) for m in messages)}")
-                    else:
-                        error_parts.append(f"{field}: {messages}")
-                if error_parts:
-                    error_message = "; ".join(error_parts)
-            elif isinstance(e.detail, list):
-                error_message = "; ".join(str(m) for m in e.detail)
-            else:
-                error_message = str(e.detail)
-
-            return Response(
-                {"error": error_message, "details": e.detail},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            return super().create(request, *args, **kwargs)
+        except exceptions.ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Reservation request creation error: {str(e)}", exc_info=True)
             return Response(
@@ -4054,16 +4092,11 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         # Pass the instance to ensure we're working with the same object
         self.perform_update(serializer, instance=instance)
 
-        # Refresh the instance from database to ensure we have the latest state
-        instance.refresh_from_db()
-
-        # Return the updated object
-        if getattr(instance, "_prefetched_objects_cache", None):
-            # If 'prefetch_related' has been applied to a queryset, we need to
-            # forcibly invalidate the prefetch cache on the instance.
-            instance._prefetched_objects_cache = {}
+        # perform_update saves onto this same instance, so its fields are already current;
+        # only the prefetched relations (e.g. inventory_units after .set()) can be stale
+        instance._prefetched_objects_cache = {}
 
-        # Re-serialize the refreshed instance
+        # Re-serialize the updated instance
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -4095,342 +4128,380 @@ class ReservationRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                         )
                         return
                     except Exception as e:
-                        import traceback
-
+                        # The traceback, if any, is logged once by the handler below
                         logger.error(
-                            f"Error saving edit to reservation request {request_obj.id}: {str(e)}\n{traceback.format_exc()}"
+                            f"Error saving edit to reservation request {request_obj.id}: {str(e)}"
                         )
                         raise
 
-            # Status change operation (approval/rejection)
-            if new_status == ReservationRequest.StatusChoices.APPROVED:
-                # Get approving admin
-                try:
-                    approving_admin = Admin.objects.get(user=self.request.user)
-                    if not approving_admin.is_inventory_manager:
-                        logger.warning(
-                            f"User {self.request.user.username} attempted to approve but is not an inventory manager"
-                        )
-                        raise exceptions.PermissionDenied(
-                            "Only Inventory Managers can approve reservation requests."
-                        )
-                except Admin.DoesNotExist:
-                    logger.error(f"Admin profile not found for user {self.request.user.username}")
-                    raise exceptions.PermissionDenied("Admin profile required.")
-
-                approved_at = timezone.now()
-                expires_at = approved_at + timedelta(days=2)
-
-                # Expire any other active approvals for units in this request (regardless of salesperson)
-                units_to_reserve = request_obj.inventory_units.all()
-                if not units_to_reserve.exists() and request_obj.inventory_unit:
-                    units_to_reserve = [request_obj.inventory_unit]
+            # Status change operation (approval/rejection): dispatch to the matching handler
+            status_handlers = {
+                ReservationRequest.StatusChoices.APPROVED: self._approve,
+                ReservationRequest.StatusChoices.REJECTED: self._reject,
+            }
+            handler = status_handlers.get(new_status)
+            if handler is None:
+                serializer.save()
+            else:
+                handler(request_obj, serializer, self._resolve_approver(new_status))
 
-                unit_ids = [unit.id for unit in units_to_reserve]
+        except Exception as e:
+            error_msg = f"Error updating reservation request {request_obj.id if 'request_obj' in locals() else 'unknown'}: {str(e)}"
+            # Permission/validation failures are ordinary 4xx outcomes; only format a
+            # traceback for them when debugging
+            if isinstance(e, (exceptions.PermissionDenied, exceptions.ValidationError)):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception(error_msg)
+                else:
+                    logger.error(error_msg)
+                raise
+            logger.exception(error_msg)
+            # Re-raise with more context
+            raise exceptions.ValidationError(f"Failed to update reservation request: {str(e)}")
 
-                # Find other approved requests that include any of these units
-                other_active_approvals = (
-                    ReservationRequest.objects.filter(
-                        inventory_units__id__in=unit_ids,
-                        status=ReservationRequest.StatusChoices.APPROVED,
-                    )
-                    .exclude(pk=request_obj.pk)
-                    .distinct()
-                )
+    def _resolve_approver(self, new_status):
+        """Return the requesting Admin, who must be an Inventory Manager to approve/reject."""
+        verb = "approve" if new_status == ReservationRequest.StatusChoices.APPROVED else "reject"
+        approving_admin = self._get_admin()
+        if approving_admin is None:
+            logger.error(f"Admin profile not found for user {self.request.user.username}")
+            raise exceptions.PermissionDenied("Admin profile required.")
+        if not approving_admin.is_inventory_manager:
+            logger.warning(
+                f"User {self.request.user.username} attempted to {verb} but is not an inventory manager"
+            )
+            raise exceptions.PermissionDenied(
+                f"Only Inventory Managers can {verb} reservation requests."
+            )
+        return approving_admin
 
-                # Also check old single unit field
-                if request_obj.inventory_unit:
-                    other_active_approvals_old = (
-                        ReservationRequest.objects.filter(
-                            inventory_unit=request_obj.inventory_unit,
-                            status=ReservationRequest.StatusChoices.APPROVED,
-                        )
-                        .exclude(pk=request_obj.pk)
-                        .distinct()
-                    )
-                    # Combine both querysets - both must have distinct() before combining
-                    other_active_approvals = (
-                        other_active_approvals | other_active_approvals_old
-                    ).distinct()
+    @staticmethod
+    def _lock_request(request_obj):
+        """
+        Lock the request row and re-read its status under the lock, so of two concurrent
+        approvers only the first acts; the second sees the decision and is turned away.
+        """
+        current_status = (
+            ReservationRequest.objects.select_for_update()
+            .filter(pk=request_obj.pk)
+            .values_list("status", flat=True)
+            .first()
+        )
+        if current_status != ReservationRequest.StatusChoices.PENDING:
+            raise exceptions.ValidationError(
+                "Only pending reservation requests can be approved or rejected."
+            )
 
-                if other_active_approvals.exists():
-                    logger.info(
-                        "Expiring other approved reservations for unit before approval",
-                        extra={
-                            "current_request_id": request_obj.id,
-                            "unit_id": request_obj.inventory_unit_id,
-                            "other_request_ids": list(
-                                other_active_approvals.values_list("id", flat=True)
-                            ),
-                        },
-                    )
-                    other_active_approvals.update(
-                        status=ReservationRequest.StatusChoices.EXPIRED,
-                        expires_at=timezone.now(),
-                    )
+    @transaction.atomic
+    def _approve(self, request_obj, serializer, approving_admin):
+        """Approve the request: expire conflicting approvals, reserve its units, notify."""
+        self._lock_request(request_obj)
+
+        # One timestamp for the whole approval: the request, the approvals it expires
+        # and the units it reserves all carry the same instants
+        approved_at = timezone.now()
+        expires_at = approved_at + timedelta(days=2)
+
+        # Load the request's units once, with their product templates, and lock them
+        # so two approvals cannot both claim them; the same list is reused below
+        units_list = list(
+            request_obj.inventory_units.select_related("product_template").select_for_update(
+                of=("self",)
+            )
+        )
+        units_from_legacy_field = False
+        if not units_list and request_obj.inventory_unit_id:
+            # Fallback to old single unit during migration
+            units_from_legacy_field = True
+            units_list = list(
+                InventoryUnit.objects.select_related("product_template")
+                .select_for_update(of=("self",))
+                .filter(pk=request_obj.inventory_unit_id)
+            )
 
-                    # Release unit associations from previously approved requests
-                    for expired_req in other_active_approvals:
-                        # Handle new ManyToMany field
-                        expired_units = expired_req.inventory_units.all()
-                        if not expired_units.exists() and expired_req.inventory_unit:
-                            expired_units = [expired_req.inventory_unit]
-
-                        for unit in expired_units:
-                            if unit.reserved_by == expired_req.requesting_salesperson:
-                                unit.reserved_by = None
-                                unit.reserved_until = None
-                                unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                                unit.save(
-                                    update_fields=["reserved_by", "reserved_until", "sale_status"]
-                                )
-
-                # Save the approval - explicitly set all fields on the instance
-                # This ensures the status is actually saved to the database
-                request_obj.approved_by = approving_admin
-                request_obj.approved_at = approved_at
-                request_obj.expires_at = expires_at
-                request_obj.status = new_status
-
-                # Save the instance directly to ensure status is persisted
-                request_obj.save(
-                    update_fields=["approved_by", "approved_at", "expires_at", "status"]
+        # Expire any other active approvals for units in this request (regardless of salesperson)
+        unit_ids = [unit.id for unit in units_list]
+        unit_ids_set = set(unit_ids)
+        if request_obj.inventory_unit_id:
+            unit_ids_set.add(request_obj.inventory_unit_id)
+
+        # A request without units cannot conflict with anything: skip the lock and
+        # the lookup entirely
+        expired_rows = []
+        if unit_ids_set:
+            # Find other approved requests that include any of these units, through
+            # either the ManyToMany field or the old single unit field, in one query
+            other_active_approvals = (
+                ReservationRequest.objects.filter(
+                    Q(inventory_units__id__in=unit_ids_set) | Q(inventory_unit_id__in=unit_ids_set),
+                    status=ReservationRequest.StatusChoices.APPROVED,
                 )
+                .exclude(pk=request_obj.pk)
+                .only("id", "inventory_unit_id", "requesting_salesperson_id")
+                .distinct()
+            )
 
-                # Also update the serializer's instance to keep it in sync
-                serializer.instance = request_obj
+            # Read the conflicting approvals before expiring them; the queryset filters
+            # on APPROVED, so it is empty once the update below has run
+            expired_rows = list(
+                other_active_approvals.values_list(
+                    "id", "requesting_salesperson_id", "inventory_unit_id"
+                )
+            )
+        if expired_rows:
+            expired_ids = [row[0] for row in expired_rows]
+            logger.info(
+                "Expiring other approved reservations for unit before approval",
+                extra={
+                    "current_request_id": request_obj.id,
+                    "unit_id": request_obj.inventory_unit_id,
+                    "other_request_ids": expired_ids,
+                },
+            )
+            ReservationRequest.objects.filter(pk__in=expired_ids).update(
+                status=ReservationRequest.StatusChoices.EXPIRED,
+                expires_at=approved_at,
+            )
 
-                # Log the saved status to verify it was saved correctly
-                logger.info(
-                    f"Reservation request {request_obj.id} approved. Status after save: {request_obj.status}, "
-                    f"Approved by: {approving_admin.user.username}, Approved at: {request_obj.approved_at}"
+            # Release unit associations from previously approved requests: group each
+            # expired request's units (ManyToMany, else the old single unit) by its
+            # salesperson and clear only the reservations that salesperson still holds
+            through_rows = ReservationRequest.inventory_units.through.objects.filter(
+                reservationrequest_id__in=expired_ids
+            ).values_list("reservationrequest_id", "inventoryunit_id")
+            units_by_request = {}
+            for req_id, unit_id in through_rows:
+                units_by_request.setdefault(req_id, set()).add(unit_id)
+
+            units_by_salesperson = {}
+            for req_id, salesperson_id, old_unit_id in expired_rows:
+                request_unit_ids = units_by_request.get(req_id)
+                if not request_unit_ids and old_unit_id:
+                    request_unit_ids = {old_unit_id}
+                if salesperson_id and request_unit_ids:
+                    units_by_salesperson.setdefault(salesperson_id, set()).update(request_unit_ids)
+
+            for salesperson_id, released_unit_ids in units_by_salesperson.items():
+                InventoryUnit.objects.filter(
+                    id__in=released_unit_ids, reserved_by_id=salesperson_id
+                ).update(
+                    reserved_by=None,
+                    reserved_until=None,
+                    sale_status=InventoryUnit.SaleStatusChoices.AVAILABLE,
                 )
 
-                # Refresh the object from database to ensure we have the latest state
-                request_obj.refresh_from_db()
+        # Log if no units found
+        if not units_list:
+            logger.warning(
+                f"Reservation request {request_obj.id} approved but has no inventory units associated."
+            )
 
-                # Double-check the status was saved
-                if request_obj.status != ReservationRequest.StatusChoices.APPROVED:
-                    logger.error(
-                        f"CRITICAL: Reservation request {request_obj.id} status is {request_obj.status} "
-                        f"after save, expected {ReservationRequest.StatusChoices.APPROVED}"
-                    )
+        unit_names = []
+        updated_units = []
+        updated_quantities = {}
+        # JSON round-trips turn the unit-id keys into strings; normalize them once
+        unit_quantities = {}
+        for key, qty in (request_obj.inventory_unit_quantities or {}).items():
+            try:
+                unit_quantities[int(key)] = qty
+            except (TypeError, ValueError):
+                pass
+        # Update all inventory units in the request
+        for unit in units_list:
+            requested_qty = unit_quantities.get(unit.id) or 1
+            if requested_qty > unit.quantity:
+                requested_qty = unit.quantity
+
+            if unit.product_template.product_type == Product.ProductType.ACCESSORY:
+                # Accessories: reserve only the requested quantity.
+                # Decrement available quantity and keep the same inventory unit.
+                unit.quantity = max(0, unit.quantity - requested_qty)
+                if unit.quantity == 0:
+                    unit.sale_status = InventoryUnit.SaleStatusChoices.RESERVED
+                    unit.reserved_by = request_obj.requesting_salesperson
+                    unit.reserved_until = expires_at
+                else:
+                    unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
+                    unit.reserved_by = None
+                    unit.reserved_until = None
+                updated_units.append(unit)
+                updated_quantities[unit.id] = requested_qty
+                unit_names.append(unit.product_template.product_name)
+            else:
+                unit.sale_status = InventoryUnit.SaleStatusChoices.RESERVED
+                unit.reserved_by = request_obj.requesting_salesperson
+                unit.reserved_until = expires_at
+                updated_units.append(unit)
+                updated_quantities[unit.id] = 1
+                unit_names.append(unit.product_template.product_name)
+
+        if updated_units:
+            # One UPDATE for every unit in the request instead of a save() per unit
+            InventoryUnit.objects.bulk_update(
+                updated_units,
+                ["quantity", "sale_status", "reserved_by", "reserved_until"],
+                batch_size=500,
+            )
+            # Every unit in units_list ends up in updated_units, so the ManyToMany
+            # membership only changes when the units came from the old single field
+            if units_from_legacy_field:
+                request_obj.inventory_units.add(*updated_units)
+            request_obj.inventory_unit_quantities = updated_quantities
+
+        # Save the approval - explicitly set all fields on the instance
+        # This ensures the status is actually saved to the database
+        request_obj.approved_by = approving_admin
+        request_obj.approved_at = approved_at
+        request_obj.expires_at = expires_at
+        request_obj.status = ReservationRequest.StatusChoices.APPROVED
+
+        # Save the instance directly to ensure status is persisted, together with the
+        # per-unit quantities computed above, in a single UPDATE
+        request_obj.save(
+            update_fields=[
+                "approved_by",
+                "approved_at",
+                "expires_at",
+                "status",
+                "inventory_unit_quantities",
+            ]
+        )
 
-                # Update all inventory units in the request
-                units = request_obj.inventory_units.all()
-                if not units.exists() and request_obj.inventory_unit:
-                    # Fallback to old single unit during migration
-                    units = [request_obj.inventory_unit]
+        # Also update the serializer's instance to keep it in sync
+        serializer.instance = request_obj
 
-                # Log if no units found
-                if not units.exists() and not request_obj.inventory_unit:
-                    logger.warning(
-                        f"Reservation request {request_obj.id} approved but has no inventory units associated. "
-                        f"inventory_units.count()={request_obj.inventory_units.count()}, "
-                        f"inventory_unit={request_obj.inventory_unit}"
-                    )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Reservation request {request_obj.id} approved. Status after save: {request_obj.status}, "
+                f"Approved by: {approving_admin.user.username}, Approved at: {request_obj.approved_at}"
+            )
 
-                unit_names = []
-                updated_units = []
-                updated_quantities = {}
-                unit_quantities = request_obj.inventory_unit_quantities or {}
-                for unit in units:
-                    requested_qty = (
-                        unit_quantities.get(str(unit.id)) or unit_quantities.get(unit.id) or 1
-                    )
-                    if requested_qty > unit.quantity:
-                        requested_qty = unit.quantity
-
-                    if unit.product_template.product_type == Product.ProductType.ACCESSORY:
-                        # Accessories: reserve only the requested quantity.
-                        # Decrement available quantity and keep the same inventory unit.
-                        unit.quantity = max(0, unit.quantity - requested_qty)
-                        if unit.quantity == 0:
-                            unit.sale_status = InventoryUnit.SaleStatusChoices.RESERVED
-                            unit.reserved_by = request_obj.requesting_salesperson
-                            unit.reserved_until = timezone.now() + timedelta(days=2)
-                        else:
-                            unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                            unit.reserved_by = None
-                            unit.reserved_until = None
-                        unit.save(
-                            update_fields=[
-                                "quantity",
-                                "sale_status",
-                                "reserved_by",
-                                "reserved_until",
-                            ]
-                        )
-                        updated_units.append(unit)
-                        updated_quantities[unit.id] = requested_qty
-                        unit_names.append(unit.product_template.product_name)
-                    else:
-                        unit.sale_status = InventoryUnit.SaleStatusChoices.RESERVED
-                        unit.reserved_by = request_obj.requesting_salesperson
-                        unit.reserved_until = timezone.now() + timedelta(days=2)
-                        unit.save()
-                        updated_units.append(unit)
-                        updated_quantities[unit.id] = 1
-                        unit_names.append(unit.product_template.product_name)
-
-                if updated_units:
-                    request_obj.inventory_units.set(updated_units)
-                    request_obj.inventory_unit_quantities = updated_quantities
-                    request_obj.save(update_fields=["inventory_unit_quantities"])
-
-                # Create notification message
-                if len(unit_names) == 1:
-                    message = f"Your reservation request for {unit_names[0]} has been approved."
-                else:
-                    message = (
-                        f"Your reservation request for {len(unit_names)} units has been approved."
-                    )
+        # Create notification message
+        if len(unit_names) == 1:
+            message = f"Your reservation request for {unit_names[0]} has been approved."
+        else:
+            message = f"Your reservation request for {len(unit_names)} units has been approved."
 
-                # Create notifications - wrap in try-except to prevent notification errors from breaking approval
-                try:
-                    Notification.objects.create(
-                        recipient=request_obj.requesting_salesperson.user,
+        # Notify inventory managers and superusers
+        approval_message = (
+            f"Reservation for {len(unit_names)} unit(s) has been approved."
+            if len(unit_names) > 1
+            else f"Reservation for {unit_names[0]} has been approved."
+        )
+
+        # Create all notifications in one INSERT once the approval has committed -
+        # wrap in try-except so notification errors never roll back the approval
+        def create_approval_notifications():
+            try:
+                ct = _rr_ct()
+                notifs = [
+                    Notification(
+                        recipient_id=request_obj.requesting_salesperson.user_id,
                         notification_type=Notification.NotificationType.RESERVATION_APPROVED,
                         title="Reservation Approved",
                         message=message,
-                        content_type=ContentType.objects.get_for_model(ReservationRequest),
+                        content_type=ct,
                         object_id=request_obj.id,
                     )
-                    logger.info(
-                        f"Created approval notification for salesperson {request_obj.requesting_salesperson.user.username} for request {request_obj.id}"
+                ]
+                # Only the recipients' ids are needed; no Admin/User rows are built
+                manager_user_ids = Admin.objects.filter(
+                    roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
+                ).values_list("user_id", flat=True)
+                notifs.extend(
+                    Notification(
+                        recipient_id=user_id,
+                        notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
+                        title="New Reservation Approved",
+                        message=approval_message,
+                        content_type=ct,
+                        object_id=request_obj.id,
                     )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create approval notification for salesperson {request_obj.requesting_salesperson.user.username} for request {request_obj.id}: {str(e)}"
+                    for user_id in manager_user_ids
+                )
+                superuser_ids = User.objects.filter(is_superuser=True).values_list("id", flat=True)
+                notifs.extend(
+                    Notification(
+                        recipient_id=user_id,
+                        notification_type=Notification.NotificationType.RESERVATION_APPROVED,
+                        title="Reservation Approved",
+                        message=approval_message,
+                        content_type=ct,
+                        object_id=request_obj.id,
                     )
-                    # Don't raise - notification failure shouldn't break approval
-
-                # Notify inventory managers and superusers
-                approval_message = (
-                    f"Reservation for {len(unit_names)} unit(s) has been approved."
-                    if len(unit_names) > 1
-                    else f"Reservation for {unit_names[0]} has been approved."
+                    for user_id in superuser_ids
                 )
+                Notification.objects.bulk_create(notifs, batch_size=500)
+                logger.info(
+                    f"Created {len(notifs)} approval notification(s) for request {request_obj.id}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to create approval notifications for request {request_obj.id}: {str(e)}"
+                )
+                # Don't raise - notification failure shouldn't break approval
 
-                try:
-                    managers = Admin.objects.filter(
-                        roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
-                    ).select_related("user")
-                    for manager in managers:
-                        try:
-                            Notification.objects.create(
-                                recipient=manager.user,
-                                notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                                title="New Reservation Approved",
-                                message=approval_message,
-                                content_type=ContentType.objects.get_for_model(ReservationRequest),
-                                object_id=request_obj.id,
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to create notification for manager {manager.user.username}: {str(e)}"
-                            )
-
-                    superusers = User.objects.filter(is_superuser=True)
-                    for superuser in superusers:
-                        try:
-                            Notification.objects.create(
-                                recipient=superuser,
-                                notification_type=Notification.NotificationType.RESERVATION_APPROVED,
-                                title="Reservation Approved",
-                                message=approval_message,
-                                content_type=ContentType.objects.get_for_model(ReservationRequest),
-                                object_id=request_obj.id,
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to create notification for superuser {superuser.username}: {str(e)}"
-                            )
-                except Exception as e:
-                    logger.error(
-                        f"Error creating manager/superuser notifications for request {request_obj.id}: {str(e)}"
-                    )
-                    # Don't raise - notification failure shouldn't break approval
+        transaction.on_commit(create_approval_notifications)
 
-            elif new_status == ReservationRequest.StatusChoices.REJECTED:
-                try:
-                    approving_admin = Admin.objects.get(user=self.request.user)
-                    if not approving_admin.is_inventory_manager:
-                        logger.warning(
-                            f"User {self.request.user.username} attempted to reject but is not an inventory manager"
-                        )
-                        raise exceptions.PermissionDenied(
-                            "Only Inventory Managers can reject reservation requests."
-                        )
-                except Admin.DoesNotExist:
-                    logger.error(f"Admin profile not found for user {self.request.user.username}")
-                    raise exceptions.PermissionDenied("Admin profile required.")
+    @transaction.atomic
+    def _reject(self, request_obj, serializer, approving_admin):
+        """Reject the request and notify the salesperson."""
+        self._lock_request(request_obj)
 
-                # Save the rejection - explicitly set all fields on the instance
-                request_obj.approved_by = approving_admin
-                request_obj.approved_at = timezone.now()
-                request_obj.status = new_status
+        # Save the rejection - explicitly set all fields on the instance
+        request_obj.approved_by = approving_admin
+        request_obj.approved_at = timezone.now()
+        request_obj.status = ReservationRequest.StatusChoices.REJECTED
 
-                # Save the instance directly to ensure status is persisted
-                request_obj.save(update_fields=["approved_by", "approved_at", "status"])
+        # Save the instance directly to ensure status is persisted
+        request_obj.save(update_fields=["approved_by", "approved_at", "status"])
 
-                # Also update the serializer's instance to keep it in sync
-                serializer.instance = request_obj
+        # Also update the serializer's instance to keep it in sync
+        serializer.instance = request_obj
 
-                # Log the saved status
-                logger.info(
-                    f"Reservation request {request_obj.id} rejected. Status after save: {request_obj.status}, "
-                    f"Rejected by: {approving_admin.user.username}"
-                )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Reservation request {request_obj.id} rejected. Status after save: {request_obj.status}, "
+                f"Rejected by: {approving_admin.user.username}"
+            )
 
-                # Refresh to verify
-                request_obj.refresh_from_db()
+        # Get unit names for notification
+        units_list = list(request_obj.inventory_units.select_related("product_template").all())
+        if not units_list and request_obj.inventory_unit:
+            units_list = [request_obj.inventory_unit]
 
-                # Get unit names for notification
-                units = request_obj.inventory_units.all()
-                if not units.exists() and request_obj.inventory_unit:
-                    units = [request_obj.inventory_unit]
+        unit_names = [unit.product_template.product_name for unit in units_list]
+        rejection_message = (
+            f"Your reservation request for {len(unit_names)} unit(s) has been rejected."
+            if len(unit_names) > 1
+            else f"Your reservation request for {unit_names[0]} has been rejected."
+        )
 
-                unit_names = [unit.product_template.product_name for unit in units]
-                rejection_message = (
-                    f"Your reservation request for {len(unit_names)} unit(s) has been rejected."
-                    if len(unit_names) > 1
-                    else f"Your reservation request for {unit_names[0]} has been rejected."
+        # Create notification once the rejection has committed - wrap in try-except
+        # so notification errors never roll back the rejection
+        def create_rejection_notification():
+            try:
+                Notification.objects.create(
+                    recipient=request_obj.requesting_salesperson.user,
+                    notification_type=Notification.NotificationType.RESERVATION_REJECTED,
+                    title="Reservation Rejected",
+                    message=rejection_message,
+                    content_type=_rr_ct(),
+                    object_id=request_obj.id,
                 )
+                logger.info(
+                    f"Created rejection notification for salesperson {request_obj.requesting_salesperson.user.username} for request {request_obj.id}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to create rejection notification for salesperson {request_obj.requesting_salesperson.user.username} for request {request_obj.id}: {str(e)}"
+                )
+                # Don't raise - notification failure shouldn't break rejection
 
-                # Create notification - wrap in try-except to prevent notification errors from breaking rejection
-                try:
-                    Notification.objects.create(
-                        recipient=request_obj.requesting_salesperson.user,
-                        notification_type=Notification.NotificationType.RESERVATION_REJECTED,
-                        title="Reservation Rejected",
-                        message=rejection_message,
-                        content_type=ContentType.objects.get_for_model(ReservationRequest),
-                        object_id=request_obj.id,
-                    )
-                    logger.info(
-                        f"Created rejection notification for salesperson {request_obj.requesting_salesperson.user.username} for request {request_obj.id}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create rejection notification for salesperson {request_obj.requesting_salesperson.user.username} for request {request_obj.id}: {str(e)}"
-                    )
-                    # Don't raise - notification failure shouldn't break rejection
-            else:
-                serializer.save()
-
-        except Exception as e:
-            import traceback
-
-            error_msg = f"Error updating reservation request {request_obj.id if 'request_obj' in locals() else 'unknown'}: {str(e)}"
-            logger.error(f"{error_msg}\n{traceback.format_exc()}")
-            # Re-raise with more context
-            if isinstance(e, (exceptions.PermissionDenied, exceptions.ValidationError)):
-                raise
-            raise exceptions.ValidationError(f"Failed to update reservation request: {str(e)}")
+        transaction.on_commit(create_rejection_notification)
 
 
-class ReturnRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
+class ReturnRequestViewSet(_RequestAdminMixin, _SilkProfileMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing return requests (bulk returns of reserved units).
     - Salespersons can create return requests for their reserved units
@@ -4439,6 +4510,7 @@ class ReturnRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
 
     serializer_class = ReturnRequestSerializer
     permission_classes = [IsAdminUser]
+    validation_error_envelope_actions = ("create",)
 
     def get_queryset(self):
         """Filter queryset based on user role."""
@@ -4451,9 +4523,8 @@ class ReturnRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         if user.is_superuser:
             queryset = ReturnRequest.objects.all()
         else:
-            try:
-                admin = Admin.objects.get(user=user)
-            except Admin.DoesNotExist:
+            admin = self._get_admin()
+            if admin is None:
                 return ReturnRequest.objects.none()
 
             if admin.is_inventory_manager:
@@ -4563,55 +4634,30 @@ class ReturnRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         return [IsAdminUser()]
 
     def create(self, request, *args, **kwargs):
-        """Override create to provide better error handling."""
-        from rest_framework import serializers as drf_serializers
-
+        """Override create to turn unexpected errors into a clear 400 response."""
+        # Validation errors are rendered as {"error", "details"} by the project exception
+        # handler (see validation_error_envelope_actions)
         try:
-            serializer = self.get_serializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
-            headers = self.get_success_headers(serializer.data)
-            return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
-        except drf_serializers.ValidationError as e:
-            # Return validation errors in a clear format
-            logger.error(f"Return request creation validation error: {e.detail}")
-            error_message = "Validation failed"
-            if isinstance(e.detail, dict):
-                # Format field-specific errors
-                error_parts = []
-                for field, messages in e.detail.items():
-                    if isinstance(messages, list):
-                        error_parts.append(f"{field}: {', '.join(str(m) for m in messages)}")
-                    else:
-                        error_parts.append(f"{field}: {messages}")
-                if error_parts:
-                    error_message = "; ".join(error_parts)
-            elif isinstance(e.detail, list):
-                error_message = "; ".join(str(m) for m in e.detail)
-            else:
-                error_message = str(e.detail)
-
-            return Response(
-                {"error": error_message, "details": e.detail},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            return super().create(request, *args, **kwargs)
+        except exceptions.ValidationError:
+            raise
         except Exception as e:
-            # Catch any other exceptions and return a proper error message
             logger.error(f"Return request creation error: {str(e)}", exc_info=True)
             return Response(
                 {"error": f"Failed to create return request: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    @transaction.atomic
     def perform_update(self, serializer):
         """Handle approval/rejection of return requests."""
-        request_obj = self.get_object()
+        # update() already loaded the request with its units prefetched; reuse it
+        request_obj = serializer.instance
         new_status = serializer.validated_data.get("status")
 
         if new_status == ReturnRequest.StatusChoices.APPROVED:
-            try:
-                approving_admin = Admin.objects.get(user=self.request.user)
-            except Admin.DoesNotExist:
+            approving_admin = self._get_admin()
+            if approving_admin is None:
                 raise exceptions.PermissionDenied("Admin profile required.")
 
             serializer.save(
@@ -4620,102 +4666,143 @@ class ReturnRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
 
             # Update all inventory units based on current status
             # Handle both salesperson returns (RESERVED → AVAILABLE) and buyback approvals (RETURNED → AVAILABLE)
-            units = request_obj.inventory_units.all()
-            for unit in units:
-                if unit.product_template.product_type == Product.ProductType.ACCESSORY:
-                    # Restore reserved quantities for accessories based on approved reservation requests
-                    reservation_requests = ReservationRequest.objects.filter(
+            # Served from the get_queryset prefetch (units come with their product_template)
+            units = list(request_obj.inventory_units.all())
+
+            # Restore reserved quantities for accessories based on approved reservation requests;
+            # read every such request once and total the quantities per unit id
+            accessory_ids = {
+                unit.id
+                for unit in units
+                if unit.product_template.product_type == Product.ProductType.ACCESSORY
+            }
+            restore_map = defaultdict(int)
+            if accessory_ids:
+                reservation_requests = (
+                    ReservationRequest.objects.filter(
                         requesting_salesperson=request_obj.requesting_salesperson,
                         status=ReservationRequest.StatusChoices.APPROVED,
-                        inventory_units=unit,
+                        inventory_units__in=accessory_ids,
                     )
-                    restore_qty = 0
-                    for req in reservation_requests:
-                        unit_quantities = req.inventory_unit_quantities or {}
-                        qty = unit_quantities.get(str(unit.id)) or unit_quantities.get(unit.id) or 0
-                        restore_qty += qty
+                    .distinct()
+                    .only("id", "inventory_unit_quantities")
+                )
+                for req in reservation_requests:
+                    for key, qty in (req.inventory_unit_quantities or {}).items():
+                        try:
+                            unit_id = int(key)
+                        except (TypeError, ValueError):
+                            continue
+                        if unit_id in accessory_ids:
+                            restore_map[unit_id] += qty or 0
+
+            for unit in units:
+                if unit.id in accessory_ids:
+                    restore_qty = restore_map.get(unit.id, 0)
                     if restore_qty > 0:
                         unit.quantity += restore_qty
                     unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
                     unit.reserved_by = None
                     unit.reserved_until = None
-                    unit.save(
-                        update_fields=["quantity", "sale_status", "reserved_by", "reserved_until"]
-                    )
-                else:
-                    if unit.sale_status == InventoryUnit.SaleStatusChoices.RESERVED:
-                        # Salesperson return: clear reservation and make available
-                        unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                        unit.reserved_by = None
-                        unit.reserved_until = None
-                    elif unit.sale_status == InventoryUnit.SaleStatusChoices.RETURNED:
-                        # Buyback approval: just change status to available
-                        unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                    unit.save()
-
-            # Mark any related approved reservation requests as returned
-            ReservationRequest.objects.filter(
-                requesting_salesperson=request_obj.requesting_salesperson,
-                status=ReservationRequest.StatusChoices.APPROVED,
-            ).filter(Q(inventory_units__in=units) | Q(inventory_unit__in=units)).update(
-                status=ReservationRequest.StatusChoices.RETURNED, expires_at=timezone.now()
+                elif unit.sale_status == InventoryUnit.SaleStatusChoices.RESERVED:
+                    # Salesperson return: clear reservation and make available
+                    unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
+                    unit.reserved_by = None
+                    unit.reserved_until = None
+                elif unit.sale_status == InventoryUnit.SaleStatusChoices.RETURNED:
+                    # Buyback approval: just change status to available
+                    unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
+            # One UPDATE for every unit on the request instead of a save() per unit
+            InventoryUnit.objects.bulk_update(
+                units,
+                ["quantity", "sale_status", "reserved_by", "reserved_until"],
+                batch_size=500,
             )
 
-            # Create notifications (salesperson returns only; buybacks have no salesperson)
-            if request_obj.requesting_salesperson and request_obj.requesting_salesperson.user:
-                Notification.objects.create(
-                    recipient=request_obj.requesting_salesperson.user,
-                    notification_type=Notification.NotificationType.RETURN_APPROVED,
-                    title="Return Approved",
-                    message=f"Your return request for {units.count()} unit(s) has been approved. Units are now available.",
-                    content_type=ContentType.objects.get_for_model(ReturnRequest),
-                    object_id=request_obj.id,
-                )
+            # Mark any related approved reservation requests as returned: one UPDATE per unit
+            # relation (ManyToMany, then the old single unit) so each can use its own index
+            # instead of an OR across the join
+            unit_ids = [unit.id for unit in units]
+            approved_reservations = ReservationRequest.objects.filter(
+                requesting_salesperson=request_obj.requesting_salesperson,
+                status=ReservationRequest.StatusChoices.APPROVED,
+            )
+            returned_at = timezone.now()
+            approved_reservations.filter(inventory_units__in=unit_ids).update(
+                status=ReservationRequest.StatusChoices.RETURNED, expires_at=returned_at
+            )
+            approved_reservations.filter(inventory_unit_id__in=unit_ids).update(
+                status=ReservationRequest.StatusChoices.RETURNED, expires_at=returned_at
+            )
 
-            # Notify inventory managers and superusers
-            managers = Admin.objects.filter(
-                roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
-            ).select_related("user")
-            for manager in managers:
-                Notification.objects.create(
-                    recipient=manager.user,
-                    notification_type=Notification.NotificationType.RETURN_APPROVED,
-                    title="Return Approved",
-                    message=f"Return request for {units.count()} unit(s) has been approved.",
-                    content_type=ContentType.objects.get_for_model(ReturnRequest),
-                    object_id=request_obj.id,
-                )
+            # Fan the notifications out once the approval has committed, in one INSERT
+            # (salesperson notice only for salesperson returns; buybacks have no salesperson),
+            # then inventory managers and superusers
+            unit_count = len(units)
+
+            def create_approval_notifications():
+                ct = _return_ct()
+                notifs = []
+                if request_obj.requesting_salesperson and request_obj.requesting_salesperson.user:
+                    notifs.append(
+                        Notification(
+                            recipient=request_obj.requesting_salesperson.user,
+                            notification_type=Notification.NotificationType.RETURN_APPROVED,
+                            title="Return Approved",
+                            message=f"Your return request for {unit_count} unit(s) has been approved. Units are now available.",
+                            content_type=ct,
+                            object_id=request_obj.id,
+                        )
+                    )
 
-            superusers = User.objects.filter(is_superuser=True)
-            for superuser in superusers:
-                Notification.objects.create(
-                    recipient=superuser,
-                    notification_type=Notification.NotificationType.RETURN_APPROVED,
-                    title="Return Approved",
-                    message=f"Return request for {units.count()} unit(s) has been approved.",
-                    content_type=ContentType.objects.get_for_model(ReturnRequest),
-                    object_id=request_obj.id,
+                manager_user_ids = Admin.objects.filter(
+                    roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
+                ).values_list("user_id", flat=True)
+                superuser_ids = User.objects.filter(is_superuser=True).values_list("id", flat=True)
+                notifs.extend(
+                    Notification(
+                        recipient_id=user_id,
+                        notification_type=Notification.NotificationType.RETURN_APPROVED,
+                        title="Return Approved",
+                        message=f"Return request for {unit_count} unit(s) has been approved.",
+                        content_type=ct,
+                        object_id=request_obj.id,
+                    )
+                    for user_id in chain(manager_user_ids, superuser_ids)
                 )
 
+                try:
+                    Notification.objects.bulk_create(notifs, batch_size=500)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to create return approval notifications for request {request_obj.id}: {str(e)}"
+                    )
+                    # Don't raise - notification failure shouldn't break approval
+
+            transaction.on_commit(create_approval_notifications)
+
         elif new_status == ReturnRequest.StatusChoices.REJECTED:
-            try:
-                approving_admin = Admin.objects.get(user=self.request.user)
-            except Admin.DoesNotExist:
+            approving_admin = self._get_admin()
+            if approving_admin is None:
                 raise exceptions.PermissionDenied("Admin profile required.")
 
             serializer.save(
                 approved_by=approving_admin, approved_at=timezone.now(), status=new_status
             )
 
-            # Only notify salesperson if this is not a buyback (buybacks have no salesperson)
+            # Only notify salesperson if this is not a buyback (buybacks have no salesperson);
+            # sent once the rejection has committed
             if request_obj.requesting_salesperson:
-                Notification.objects.create(
-                    recipient=request_obj.requesting_salesperson.user,
-                    notification_type=Notification.NotificationType.RETURN_REJECTED,
-                    title="Return Rejected",
-                    message=f"Your return request for {request_obj.inventory_units.count()} unit(s) has been rejected.",
-                    content_type=ContentType.objects.get_for_model(ReturnRequest),
-                    object_id=request_obj.id,
+                unit_count = len(request_obj.inventory_units.all())
+                transaction.on_commit(
+                    lambda: Notification.objects.create(
+                        recipient_id=request_obj.requesting_salesperson.user_id,
+                        notification_type=Notification.NotificationType.RETURN_REJECTED,
+                        title="Return Rejected",
+                        message=f"Your return request for {unit_count} unit(s) has been rejected.",
+                        content_type=_return_ct(),
+                        object_id=request_obj.id,
+                    )
                 )
         else:
             serializer.save()
@@ -4727,38 +4814,47 @@ class ReturnRequestViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         if not request_ids:
             return Response({"error": "request_ids required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            approving_admin = Admin.objects.get(user=request.user)
-        except Admin.DoesNotExist:
+        approving_admin = self._get_admin()
+        if approving_admin is None:
             return Response({"error": "Admin profile required"}, status=status.HTTP_403_FORBIDDEN)
 
         approved_count = 0
-        with transaction.atomic():
-            requests = ReturnRequest.objects.filter(
-                id__in=request_ids, status=ReturnRequest.StatusChoices.PENDING
-            )
+        pending_ids = ReturnRequest.objects.filter(
+            id__in=request_ids, status=ReturnRequest.StatusChoices.PENDING
+        ).values_list("id", flat=True)
+
+        for req_id in pending_ids:
+            # One short transaction per request so its row locks are released before the next
+            with transaction.atomic():
+                req = (
+                    ReturnRequest.objects.select_for_update()
+                    .filter(pk=req_id, status=ReturnRequest.StatusChoices.PENDING)
+                    .first()
+                )
+                if req is None:
+                    # Approved or rejected by someone else in the meantime
+                    continue
 
-            for req in requests:
                 req.status = ReturnRequest.StatusChoices.APPROVED
                 req.approved_by = approving_admin
                 req.approved_at = timezone.now()
-                req.save()
+                req.save(update_fields=["status", "approved_by", "approved_at"])
 
                 # Update units
-                for unit in req.inventory_units.all():
-                    unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                    unit.reserved_by = None
-                    unit.reserved_until = None
-                    unit.save()
+                InventoryUnit.objects.filter(return_requests=req).update(
+                    sale_status=InventoryUnit.SaleStatusChoices.AVAILABLE,
+                    reserved_by=None,
+                    reserved_until=None,
+                )
 
-                approved_count += 1
+            approved_count += 1
 
         return Response(
             {"message": f"{approved_count} return requests approved"}, status=status.HTTP_200_OK
         )
 
 
-class UnitTransferViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
+class UnitTransferViewSet(_RequestAdminMixin, _SilkProfileMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing unit transfers between salespersons.
     - Salespersons can request transfers
@@ -4782,9 +4878,8 @@ class UnitTransferViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 "approved_by__user",
             )
 
-        try:
-            admin = Admin.objects.get(user=user)
-        except Admin.DoesNotExist:
+        admin = self._get_admin()
+        if admin is None:
             return UnitTransfer.objects.none()
 
         if admin.is_inventory_manager:
@@ -4817,120 +4912,159 @@ class UnitTransferViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             return [CanApproveRequests()]
         return [IsAdminUser()]
 
+    @transaction.atomic
     def perform_create(self, serializer):
         """Handle creation of transfer requests and notify Inventory Managers."""
         transfer_obj = serializer.save()
 
-        # Notify all Inventory Managers about the new transfer request
-        managers = Admin.objects.filter(
-            roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
-        ).select_related("user")
-        unit = transfer_obj.inventory_unit
-
-        for manager in managers:
-            Notification.objects.create(
-                recipient=manager.user,
-                notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                title="New Unit Transfer Request",
-                message=f"Unit {unit.product_template.product_name} (#{unit.serial_number or unit.id}) transfer requested from {transfer_obj.from_salesperson.user.username} to {transfer_obj.to_salesperson.user.username}. Review and approve if needed.",
-                content_type=ContentType.objects.get_for_model(UnitTransfer),
-                object_id=transfer_obj.id,
-            )
-
-        # Also notify superusers
-        superusers = User.objects.filter(is_superuser=True)
-        for superuser in superusers:
-            Notification.objects.create(
-                recipient=superuser,
-                notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
-                title="New Unit Transfer Request",
-                message=f"Unit {unit.product_template.product_name} (#{unit.serial_number or unit.id}) transfer requested from {transfer_obj.from_salesperson.user.username} to {transfer_obj.to_salesperson.user.username}.",
-                content_type=ContentType.objects.get_for_model(UnitTransfer),
-                object_id=transfer_obj.id,
+        # Notify all Inventory Managers and superusers in one INSERT once the transfer request
+        # has committed
+        def create_request_notifications():
+            unit = transfer_obj.inventory_unit
+            ct = _transfer_ct()
+            summary = (
+                f"Unit {unit.product_template.product_name} (#{unit.serial_number or unit.id}) transfer "
+                f"requested from {transfer_obj.from_salesperson.user.username} to "
+                f"{transfer_obj.to_salesperson.user.username}."
+            )
+            manager_user_ids = Admin.objects.filter(
+                roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
+            ).values_list("user_id", flat=True)
+            superuser_ids = User.objects.filter(is_superuser=True).values_list("id", flat=True)
+            notifs = [
+                Notification(
+                    recipient_id=user_id,
+                    notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
+                    title="New Unit Transfer Request",
+                    message=f"{summary} Review and approve if needed.",
+                    content_type=ct,
+                    object_id=transfer_obj.id,
+                )
+                for user_id in manager_user_ids
+            ]
+            notifs.extend(
+                Notification(
+                    recipient_id=user_id,
+                    notification_type=Notification.NotificationType.REQUEST_PENDING_APPROVAL,
+                    title="New Unit Transfer Request",
+                    message=summary,
+                    content_type=ct,
+                    object_id=transfer_obj.id,
+                )
+                for user_id in superuser_ids
             )
+            try:
+                Notification.objects.bulk_create(notifs, batch_size=500)
+            except Exception as e:
+                logger.error(
+                    f"Failed to create transfer request notifications for transfer {transfer_obj.id}: {str(e)}"
+                )
 
+        transaction.on_commit(create_request_notifications)
+
+    @transaction.atomic
     def perform_update(self, serializer):
         """Handle approval/rejection of transfer requests."""
         transfer_obj = self.get_object()
         new_status = serializer.validated_data.get("status")
 
         if new_status == UnitTransfer.StatusChoices.APPROVED:
-            try:
-                approving_admin = Admin.objects.get(user=self.request.user)
-            except Admin.DoesNotExist:
+            approving_admin = self._get_admin()
+            if approving_admin is None:
                 raise exceptions.PermissionDenied("Admin profile required.")
 
             serializer.save(
                 approved_by=approving_admin, approved_at=timezone.now(), status=new_status
             )
 
-            # Update inventory unit: change reserved_by
+            # Update inventory unit: change reserved_by (a single-column UPDATE; the unit's
+            # post_save audit only tracks price and status changes)
             unit = transfer_obj.inventory_unit
-            unit.reserved_by = transfer_obj.to_salesperson
-            unit.save()
-
-            # Create notifications
-            Notification.objects.create(
-                recipient=transfer_obj.from_salesperson.user,
-                notification_type=Notification.NotificationType.TRANSFER_APPROVED,
-                title="Transfer Approved",
-                message=f"Unit {unit.product_template.product_name} has been transferred to {transfer_obj.to_salesperson.user.username}.",
-                content_type=ContentType.objects.get_for_model(UnitTransfer),
-                object_id=transfer_obj.id,
-            )
-
-            Notification.objects.create(
-                recipient=transfer_obj.to_salesperson.user,
-                notification_type=Notification.NotificationType.TRANSFER_APPROVED,
-                title="Unit Transferred",
-                message=f"Unit {unit.product_template.product_name} has been transferred to you from {transfer_obj.from_salesperson.user.username}.",
-                content_type=ContentType.objects.get_for_model(UnitTransfer),
-                object_id=transfer_obj.id,
-            )
-
-            # Notify Inventory Managers about completed transfer
-            managers = Admin.objects.filter(
-                roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
-            ).select_related("user")
-            for manager in managers:
-                Notification.objects.create(
-                    recipient=manager.user,
-                    notification_type=Notification.NotificationType.TRANSFER_APPROVED,
-                    title="Unit Transfer Completed",
-                    message=f"Unit {unit.product_template.product_name} (#{unit.serial_number or unit.id}) transferred from {transfer_obj.from_salesperson.user.username} to {transfer_obj.to_salesperson.user.username}. This may affect return requests.",
-                    content_type=ContentType.objects.get_for_model(UnitTransfer),
-                    object_id=transfer_obj.id,
-                )
+            InventoryUnit.objects.filter(pk=transfer_obj.inventory_unit_id).update(
+                reserved_by=transfer_obj.to_salesperson_id
+            )
 
-            # Notify superusers
-            superusers = User.objects.filter(is_superuser=True)
-            for superuser in superusers:
-                Notification.objects.create(
-                    recipient=superuser,
-                    notification_type=Notification.NotificationType.UNIT_RESERVED,
-                    title="Unit Transfer Completed",
-                    message=f"Unit {unit.product_template.product_name} transferred from {transfer_obj.from_salesperson.user.username} to {transfer_obj.to_salesperson.user.username}.",
-                    content_type=ContentType.objects.get_for_model(UnitTransfer),
-                    object_id=transfer_obj.id,
+            # Once the transfer has committed, notify both salespersons, then inventory managers
+            # (completed transfers may affect return requests) and superusers in one INSERT
+            def create_approval_notifications():
+                ct = _transfer_ct()
+                from_username = transfer_obj.from_salesperson.user.username
+                to_username = transfer_obj.to_salesperson.user.username
+                product_name = unit.product_template.product_name
+                notifs = [
+                    Notification(
+                        recipient_id=transfer_obj.from_salesperson.user_id,
+                        notification_type=Notification.NotificationType.TRANSFER_APPROVED,
+                        title="Transfer Approved",
+                        message=f"Unit {product_name} has been transferred to {to_username}.",
+                        content_type=ct,
+                        object_id=transfer_obj.id,
+                    ),
+                    Notification(
+                        recipient_id=transfer_obj.to_salesperson.user_id,
+                        notification_type=Notification.NotificationType.TRANSFER_APPROVED,
+                        title="Unit Transferred",
+                        message=f"Unit {product_name} has been transferred to you from {from_username}.",
+                        content_type=ct,
+                        object_id=transfer_obj.id,
+                    ),
+                ]
+                manager_user_ids = Admin.objects.filter(
+                    roles__name=AdminRole.RoleChoices.INVENTORY_MANAGER
+                ).values_list("user_id", flat=True)
+                notifs.extend(
+                    Notification(
+                        recipient_id=user_id,
+                        notification_type=Notification.NotificationType.TRANSFER_APPROVED,
+                        title="Unit Transfer Completed",
+                        message=f"Unit {product_name} (#{unit.serial_number or unit.id}) transferred from {from_username} to {to_username}. This may affect return requests.",
+                        content_type=ct,
+                        object_id=transfer_obj.id,
+                    )
+                    for user_id in manager_user_ids
+                )
+                superuser_ids = User.objects.filter(is_superuser=True).values_list("id", flat=True)
+                notifs.extend(
+                    Notification(
+                        recipient_id=user_id,
+                        notification_type=Notification.NotificationType.UNIT_RESERVED,
+                        title="Unit Transfer Completed",
+                        message=f"Unit {product_name} transferred from {from_username} to {to_username}.",
+                        content_type=ct,
+                        object_id=transfer_obj.id,
+                    )
+                    for user_id in superuser_ids
                 )
+                try:
+                    Notification.objects.bulk_create(notifs, batch_size=500)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to create transfer approval notifications for transfer {transfer_obj.id}: {str(e)}"
+                    )
+                    # Don't raise - notification failure shouldn't break approval
+
+            transaction.on_commit(create_approval_notifications)
 
         elif new_status == UnitTransfer.StatusChoices.REJECTED:
-            try:
-                approving_admin = Admin.objects.get(user=self.request.user)
-            except Admin.DoesNotExist:
+            approving_admin = self._get_admin()
+            if approving_admin is None:
                 raise exceptions.PermissionDenied("Admin profile required.")
 
             serializer.save(
                 approved_by=approving_admin, approved_at=timezone.now(), status=new_status
             )
 
-            Notification.objects.create(
-                recipient=transfer_obj.from_salesperson.user,
-                notification_type=Notification.NotificationType.TRANSFER_REJECTED,
-                title="Transfer Rejected",
-                message=f"Your transfer request for {transfer_obj.inventory_unit.product_template.product_name} has been rejected.",
-                content_type=ContentType.objects.get_for_model(UnitTransfer),
-                object_id=transfer_obj.id,
+            # Notify the requesting salesperson once the rejection has committed
+            product_name = transfer_obj.inventory_unit.product_template.product_name
+            transaction.on_commit(
+                lambda: Notification.objects.create(
+                    recipient_id=transfer_obj.from_salesperson.user_id,
+                    notification_type=Notification.NotificationType.TRANSFER_REJECTED,
+                    title="Transfer Rejected",
+                    message=f"Your transfer request for {product_name} has been rejected.",
+                    content_type=_transfer_ct(),
+                    object_id=transfer_obj.id,
+                )
             )
         else:
             serializer.save()
@@ -4957,12 +5091,14 @@ class NotificationViewSet(_SilkProfileMixin, viewsets.ReadOnlyModelViewSet):
         """Mark a notification as read."""
         notification = self.get_object()
         notification.is_read = True
-        notification.save()
+        notification.save(update_fields=["is_read"])
         return Response({"status": "marked as read"}, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"])
     def unread_count(self, request):
         """Get count of unread notifications."""
+        # Polled by every open admin tab. Not cached: with a per-process cache the other
+        # workers would keep serving a stale count; the partial unread index keeps it cheap
         count = Notification.objects.filter(recipient=request.user, is_read=False).count()
         return Response({"unread_count": count}, status=status.HTTP_200_OK)
 
@@ -5035,6 +5171,16 @@ class ReportsViewSet(_SilkProfileMixin, viewsets.ViewSet):
         return Response(report_data, status=status.HTTP_200_OK)
 
 
+class AuditLogPagination(CursorPagination):
+    """Keyset pagination over the (ever-growing) audit trail: each page is an index range scan
+    on timestamp instead of an OFFSET that reads and discards every earlier row, and no COUNT.
+    """
+
+    ordering = "-timestamp"
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
 class AuditLogViewSet(_SilkProfileMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for audit logs (Inventory Manager and Superuser only).
@@ -5043,6 +5189,7 @@ class AuditLogViewSet(_SilkProfileMixin, viewsets.ReadOnlyModelViewSet):
 
     serializer_class = AuditLogSerializer
     permission_classes = [CanApproveRequests]  # Inventory Manager or Superuser
+    pagination_class = AuditLogPagination
 
     def get_queryset(self):
         """Return audit logs with optional filtering."""
@@ -5089,73 +5236,38 @@ class StockAlertsViewSet(_SilkProfileMixin, viewsets.ViewSet):
         """Get all stock alerts."""
         alerts = []
 
-        # 1. Low Stock Alerts - Products with fewer than min_stock_threshold units available
+        # Available stock per product, aggregated once for both the low-stock (1) and
+        # out-of-stock (3) alerts; only products that raise either alert are returned
         # For accessories, sum quantities; for phones/laptops/tablets, count units
-        low_stock_products = Product.objects.annotate(
-            available_count=Case(
-                When(
-                    product_type=Product.ProductType.ACCESSORY,
-                    then=Coalesce(
-                        Sum(
-                            "inventory_units__quantity", filter=Q(inventory_units__sale_status="AV")
+        stock_products = list(
+            Product.objects.annotate(
+                available_count=Case(
+                    When(
+                        product_type=Product.ProductType.ACCESSORY,
+                        then=Coalesce(
+                            Sum(
+                                "inventory_units__quantity",
+                                filter=Q(inventory_units__sale_status="AV"),
+                            ),
+                            Value(0),
                         ),
-                        Value(0),
                     ),
-                ),
-                default=Count("inventory_units", filter=Q(inventory_units__sale_status="AV")),
-                output_field=IntegerField(),
+                    default=Count("inventory_units", filter=Q(inventory_units__sale_status="AV")),
+                    output_field=IntegerField(),
+                )
+            ).filter(
+                Q(min_stock_threshold__isnull=False, available_count__lt=F("min_stock_threshold"))
+                | Q(available_count=0, is_discontinued=False)
             )
-        ).filter(
-            Q(min_stock_threshold__isnull=False) & Q(available_count__lt=F("min_stock_threshold"))
         )
 
-        # #region agent log
-        try:
-            import json
-            import time
-
-            accessory_product = low_stock_products.filter(
-                product_type=Product.ProductType.ACCESSORY
-            ).first()
-            if accessory_product:
-                accessory_units = InventoryUnit.objects.filter(
-                    product_template=accessory_product,
-                    sale_status=InventoryUnit.SaleStatusChoices.AVAILABLE,
-                )
-                sum_qty = accessory_units.aggregate(total_qty=Sum("quantity"))["total_qty"] or 0
-                count_units = accessory_units.count()
-                import os
-
-                os.makedirs(
-                    "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor",
-                    exist_ok=True,
-                )
-                with open(
-                    "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log",
-                    "a",
-                ) as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "pre-fix",
-                                "hypothesisId": "H4",
-                                "location": "inventory/views.py:StockAlertsViewSet.list",
-                                "message": "Low stock accessory count vs quantity",
-                                "data": {
-                                    "product_id": accessory_product.id,
-                                    "count_units": count_units,
-                                    "sum_quantity": sum_qty,
-                                    "available_count": accessory_product.available_count,
-                                },
-                                "timestamp": int(time.time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-        except Exception:
-            pass
-        # #endregion
+        # 1. Low Stock Alerts - Products with fewer than min_stock_threshold units available
+        low_stock_products = [
+            product
+            for product in stock_products
+            if product.min_stock_threshold is not None
+            and product.available_count < product.min_stock_threshold
+        ]
 
         for product in low_stock_products:
             alerts.append(
@@ -5175,12 +5287,21 @@ class StockAlertsViewSet(_SilkProfileMixin, viewsets.ViewSet):
 
         # 2. Expiring Reservation Alerts - Reserved units expiring within 24 hours
         expiring_soon = timezone.now() + timedelta(hours=24)
-        expiring_units = InventoryUnit.objects.filter(
-            sale_status="RS",
-            reserved_until__isnull=False,
-            reserved_until__lte=expiring_soon,
-            reserved_until__gt=timezone.now(),
-        ).select_related("product_template", "reserved_by")
+        expiring_units = (
+            InventoryUnit.objects.filter(
+                sale_status="RS",
+                reserved_until__isnull=False,
+                reserved_until__lte=expiring_soon,
+                reserved_until__gt=timezone.now(),
+            )
+            .annotate(
+                # The alert only needs these two names; read them in the same query instead of
+                # building the product and admin/user objects for every unit
+                product_template_name=F("product_template__product_name"),
+                reserved_by_username=F("reserved_by__user__username"),
+            )
+            .only("id", "serial_number", "reserved_until")
+        )
 
         for unit in expiring_units:
             hours_left = (unit.reserved_until - timezone.now()).total_seconds() / 3600
@@ -5201,22 +5322,11 @@ class StockAlertsViewSet(_SilkProfileMixin, viewsets.ViewSet):
             )
 
         # 3. Out of Stock Alerts - Products with no available units
-        # For accessories, sum quantities; for phones/laptops/tablets, count units
-        out_of_stock_products = Product.objects.annotate(
-            available_count=Case(
-                When(
-                    product_type=Product.ProductType.ACCESSORY,
-                    then=Coalesce(
-                        Sum(
-                            "inventory_units__quantity", filter=Q(inventory_units__sale_status="AV")
-                        ),
-                        Value(0),
-                    ),
-                ),
-                default=Count("inventory_units", filter=Q(inventory_units__sale_status="AV")),
-                output_field=IntegerField(),
-            )
-        ).filter(available_count=0, is_discontinued=False)
+        out_of_stock_products = [
+            product
+            for product in stock_products
+            if product.available_count == 0 and not product.is_discontinued
+        ]
 
         for product in out_of_stock_products:
             alerts.append(
@@ -5233,9 +5343,27 @@ class StockAlertsViewSet(_SilkProfileMixin, viewsets.ViewSet):
             )
 
         # 4. Pending Approvals - Requests waiting for approval
-        pending_reservations = ReservationRequest.objects.filter(status="PE").count()
-        pending_returns = ReturnRequest.objects.filter(status="PE").count()
-        pending_transfers = UnitTransfer.objects.filter(status="PE").count()
+        # One UNION ALL round-trip for the three counts instead of three COUNT queries
+        def pending_count(model, kind):
+            return (
+                model.objects.filter(status="PE")
+                .annotate(kind=Value(kind, output_field=CharField()))
+                .values("kind")
+                .annotate(n=Count("id"))
+                .values_list("kind", "n")
+                .order_by()
+            )
+
+        pending_counts = dict(
+            pending_count(ReservationRequest, "reservations").union(
+                pending_count(ReturnRequest, "returns"),
+                pending_count(UnitTransfer, "transfers"),
+                all=True,
+            )
+        )
+        pending_reservations = pending_counts.get("reservations", 0)
+        pending_returns = pending_counts.get("returns", 0)
+        pending_transfers = pending_counts.get("transfers", 0)
 
         if pending_reservations > 0:
             alerts.append(
@@ -5338,12 +5466,26 @@ class BrandViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         parameters=[OpenApiParameter("id", OpenApiTypes.INT, OpenApiParameter.PATH)]
     ),
 )
-class LeadViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
+class LeadViewSet(_RequestAdminMixin, _SilkProfileMixin, viewsets.ModelViewSet):
     """Lead management for salespersons only."""
 
     queryset = Lead.objects.all()
     serializer_class = LeadSerializer
     permission_classes = [IsAdminUser]  # Base permission, refined in get_permissions
+    admin_prefetch_related = ("roles", "brands")
+    # Actions that only read and update the lead's own columns (close releases its units
+    # with a single UPDATE), so they skip the joins and prefetches the serializer needs
+    lean_actions = frozenset(("assign", "contact", "close"))
+    # The columns those actions touch, plus the ones Lead.save() inspects
+    lean_fields = (
+        "brand",
+        "assigned_salesperson",
+        "status",
+        "contacted_at",
+        "salesperson_notes",
+        "lead_reference",
+        "expires_at",
+    )
 
     def get_permissions(self):
         """Restrict all lead actions to salespersons only."""
@@ -5355,11 +5497,15 @@ class LeadViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         user = self.request.user
         brand = getattr(self.request, "brand", None)
 
-        queryset = (
-            Lead.objects.all()
-            .select_related("customer", "brand", "assigned_salesperson__user", "order")
-            .prefetch_related("items__inventory_unit__product_template")
-        )
+        queryset = Lead.objects.all()
+        if self.action in self.lean_actions:
+            queryset = queryset.only(*self.lean_fields)
+        else:
+            # LeadSerializer renders items, brand, customer and salesperson names for every
+            # lead; convert hands the same relations to LeadService
+            queryset = queryset.select_related(
+                "customer__user", "brand", "assigned_salesperson__user", "order"
+            ).prefetch_related("items__inventory_unit__product_template")
 
         # Filter by brand if specified
         if brand:
@@ -5375,368 +5521,169 @@ class LeadViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             return queryset
 
         # Only salespersons can see leads (inventory managers cannot)
-        try:
-            admin = Admin.objects.get(user=user)
-            if admin.is_salesperson:
-                if admin.brands.exists() and not admin.is_global_admin:
-                    queryset = queryset.filter(brand__in=admin.brands.all())
-                elif admin.is_global_admin:
-                    # Global admins see all leads
-                    pass
-            else:
-                # Other roles (including inventory managers) don't see leads
-                return Lead.objects.none()
-        except Admin.DoesNotExist:
+        admin = self._get_admin()
+        if admin is None:
+            return Lead.objects.none()
+        if admin.is_salesperson:
+            brand_ids = self._get_admin_brand_ids()
+            if brand_ids and not admin.is_global_admin:
+                queryset = queryset.filter(brand_id__in=brand_ids)
+            elif admin.is_global_admin:
+                # Global admins see all leads
+                pass
+        else:
+            # Other roles (including inventory managers) don't see leads
             return Lead.objects.none()
 
         return queryset
 
+    def _lead_salesperson_error(self, lead, not_salesperson_error, not_assigned_error):
+        """
+        Error response unless the requester may work this lead, else None.
+        Superusers always may (without needing an Admin profile); everyone else must be a
+        salesperson, and also the lead's assigned salesperson unless they are a global admin.
+        """
+        if self.request.user.is_superuser:
+            return None
+
+        admin = self._get_admin()
+        if admin is None:
+            return Response(
+                {"error": "Admin profile not found"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if not admin.is_salesperson:
+            return Response({"error": not_salesperson_error}, status=status.HTTP_403_FORBIDDEN)
+        if not admin.is_global_admin and lead.assigned_salesperson_id != admin.id:
+            return Response({"error": not_assigned_error}, status=status.HTTP_403_FORBIDDEN)
+        return None
+
     @action(detail=True, methods=["post"])
     def assign(self, request, pk=None):
         """Self-assign lead (salesperson claims lead). Only salespersons can claim leads."""
-        import json
-
-        # Use PESAPAL_LOG_PATH from environment variable, fallback to /tmp/pesapal_debug.log
-        from django.conf import settings
-
-        log_path = getattr(settings, "PESAPAL_LOG_PATH", "/tmp/pesapal_debug.log")
-
-        # region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                            "location": "views.py:2810",
-                            "message": "LeadViewSet.assign() ENTRY",
-                            "data": {
-                                "user_id": request.user.id
-                                if request.user.is_authenticated
-                                else None,
-                                "username": request.user.username
-                                if request.user.is_authenticated
-                                else None,
-                                "is_staff": request.user.is_staff
-                                if request.user.is_authenticated
-                                else False,
-                                "lead_id": pk,
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # endregion
-
         lead = self.get_object()
 
-        # region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "B",
-                            "location": "views.py:2813",
-                            "message": "BEFORE checking admin and salesperson status",
-                            "data": {
-                                "lead_id": lead.id,
-                                "lead_brand_id": lead.brand.id if lead.brand else None,
-                                "lead_brand_name": lead.brand.name if lead.brand else None,
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # endregion
+        admin = self._get_admin()
+        if admin is None:
+            return Response(
+                {"error": "Admin profile not found"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-        try:
-            admin = Admin.objects.get(user=request.user)
+        # Double-check: Only salespersons can assign leads (permission should catch this, but verify)
+        if not admin.is_salesperson and not request.user.is_superuser:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "lead.assign denied: not a salesperson",
+                    extra={"lead_id": lead.id, "admin_id": admin.id},
+                )
+            return Response(
+                {"error": "Only salespersons can assign leads"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "B",
-                                "location": "views.py:2815",
-                                "message": "Admin found - checking salesperson status",
-                                "data": {
-                                    "admin_id": admin.id,
-                                    "admin_code": admin.admin_code,
-                                    "is_salesperson": admin.is_salesperson,
-                                    "is_global_admin": admin.is_global_admin,
-                                    "user_roles": list(admin.roles.values_list("name", flat=True)),
-                                    "admin_brand_ids": list(
-                                        admin.brands.values_list("id", flat=True)
-                                    ),
-                                },
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
+        # Validate salesperson is associated with lead's brand (unless global admin)
+        if not admin.is_global_admin and not request.user.is_superuser:
+            if lead.brand_id not in self._get_admin_brand_ids():
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "lead.assign denied: brand not assigned",
+                        extra={
+                            "lead_id": lead.id,
+                            "lead_brand_id": lead.brand_id,
+                            "admin_id": admin.id,
+                        },
                     )
-            except Exception:
-                pass
-            # endregion
-
-            # Double-check: Only salespersons can assign leads (permission should catch this, but verify)
-            if not admin.is_salesperson and not request.user.is_superuser:
-                # region agent log
-                try:
-                    with open(log_path, "a") as f:
-                        f.write(
-                            json.dumps(
-                                {
-                                    "sessionId": "debug-session",
-                                    "runId": "run1",
-                                    "hypothesisId": "C",
-                                    "location": "views.py:2816",
-                                    "message": "PERMISSION DENIED: User is not a salesperson",
-                                    "data": {
-                                        "admin_id": admin.id,
-                                        "is_salesperson": admin.is_salesperson,
-                                        "roles": list(admin.roles.values_list("name", flat=True)),
-                                    },
-                                    "timestamp": int(__import__("time").time() * 1000),
-                                }
-                            )
-                            + "\n"
-                        )
-                except Exception:
-                    pass
-                # endregion
                 return Response(
-                    {"error": "Only salespersons can assign leads"},
+                    {"error": "You are not associated with this lead's brand"},
                     status=status.HTTP_403_FORBIDDEN,
                 )
 
-            # Validate salesperson is associated with lead's brand (unless global admin)
-            if not admin.is_global_admin and not request.user.is_superuser:
-                if lead.brand not in admin.brands.all():
-                    # region agent log
-                    try:
-                        with open(log_path, "a") as f:
-                            f.write(
-                                json.dumps(
-                                    {
-                                        "sessionId": "debug-session",
-                                        "runId": "run1",
-                                        "hypothesisId": "E",
-                                        "location": "views.py:2820",
-                                        "message": "PERMISSION DENIED: Salesperson not associated with lead brand",
-                                        "data": {
-                                            "lead_brand_id": lead.brand.id,
-                                            "admin_brand_ids": list(
-                                                admin.brands.values_list("id", flat=True)
-                                            ),
-                                            "is_global_admin": admin.is_global_admin,
-                                        },
-                                        "timestamp": int(__import__("time").time() * 1000),
-                                    }
-                                )
-                                + "\n"
-                            )
-                    except Exception:
-                        pass
-                    # endregion
-                    return Response(
-                        {"error": "You are not associated with this lead's brand"},
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
+        # Allow salespersons to claim leads even if already assigned (reassignment)
+        # This allows any salesperson to claim any lead for their brand
+        lead.assigned_salesperson = admin
+        lead.save(update_fields=["assigned_salesperson"])
 
-            # Allow salespersons to claim leads even if already assigned (reassignment)
-            # This allows any salesperson to claim any lead for their brand
-            lead.assigned_salesperson = admin
-            lead.save()
-
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "D",
-                                "location": "views.py:2826",
-                                "message": "SUCCESS: Lead assigned to salesperson",
-                                "data": {
-                                    "lead_id": lead.id,
-                                    "assigned_admin_id": admin.id,
-                                    "assigned_admin_code": admin.admin_code,
-                                },
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-            except Exception:
-                pass
-            # endregion
-
-            return Response({"message": "Lead assigned successfully"})
-        except Admin.DoesNotExist:
-            # region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(
-                        json.dumps(
-                            {
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "F",
-                                "location": "views.py:2828",
-                                "message": "ERROR: Admin profile not found",
-                                "data": {"user_id": request.user.id},
-                                "timestamp": int(__import__("time").time() * 1000),
-                            }
-                        )
-                        + "\n"
-                    )
-            except Exception:
-                pass
-            # endregion
-            return Response(
-                {"error": "Admin profile not found"}, status=status.HTTP_400_BAD_REQUEST
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("lead.assign", extra={"lead_id": lead.id, "admin_id": admin.id})
+        return Response({"message": "Lead assigned successfully"})
 
     @action(detail=True, methods=["post"])
     def contact(self, request, pk=None):
         """Mark lead as contacted. Only salespersons can mark leads as contacted."""
         lead = self.get_object()
-
-        # Verify user is a salesperson
-        try:
-            admin = Admin.objects.get(user=request.user)
-            if not admin.is_salesperson and not request.user.is_superuser:
-                return Response(
-                    {"error": "Only salespersons can mark leads as contacted"},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-
-            # Verify salesperson is assigned to this lead or is global admin
-            if not request.user.is_superuser and not admin.is_global_admin:
-                if lead.assigned_salesperson != admin:
-                    return Response(
-                        {
-                            "error": "You can only mark leads as contacted if you are assigned to them"
-                        },
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
-        except Admin.DoesNotExist:
-            return Response(
-                {"error": "Admin profile not found"}, status=status.HTTP_400_BAD_REQUEST
-            )
+        error = self._lead_salesperson_error(
+            lead,
+            "Only salespersons can mark leads as contacted",
+            "You can only mark leads as contacted if you are assigned to them",
+        )
+        if error is not None:
+            return error
 
         lead.status = Lead.StatusChoices.CONTACTED
         lead.contacted_at = timezone.now()
         lead.salesperson_notes = request.data.get("notes", "")
-        lead.save()
+        lead.save(update_fields=["status", "contacted_at", "salesperson_notes"])
         return Response({"message": "Lead marked as contacted"})
 
     @action(detail=True, methods=["post"])
     def convert(self, request, pk=None):
         """Convert lead to order. Only salespersons can convert leads."""
         lead = self.get_object()
-        try:
-            admin = Admin.objects.get(user=request.user)
-
-            # Verify user is a salesperson
-            if not admin.is_salesperson and not request.user.is_superuser:
-                return Response(
-                    {"error": "Only salespersons can convert leads to orders"},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-
-            # Verify salesperson is assigned to this lead or is global admin
-            if not request.user.is_superuser and not admin.is_global_admin:
-                if lead.assigned_salesperson != admin:
-                    return Response(
-                        {"error": "You can only convert leads that are assigned to you"},
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
-
-            if lead.status != Lead.StatusChoices.CONTACTED:
-                return Response(
-                    {"error": "Lead must be contacted first"}, status=status.HTTP_400_BAD_REQUEST
-                )
+        error = self._lead_salesperson_error(
+            lead,
+            "Only salespersons can convert leads to orders",
+            "You can only convert leads that are assigned to you",
+        )
+        if error is not None:
+            return error
 
-            order = LeadService.convert_lead_to_order(lead, admin)
-            return Response({"message": "Lead converted to order", "order_id": str(order.order_id)})
-        except Admin.DoesNotExist:
+        if lead.status != Lead.StatusChoices.CONTACTED:
             return Response(
-                {"error": "Admin profile not found"}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "Lead must be contacted first"}, status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
+
+        # Only the service's own validation errors become a 400; anything else is a bug
+        # and goes to DRF's exception handling instead of being reported as bad input
+        try:
+            order = LeadService.convert_lead_to_order(
+                lead, None if request.user.is_superuser else self._get_admin()
+            )
+        except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"message": "Lead converted to order", "order_id": str(order.order_id)})
 
     @action(detail=True, methods=["post"])
     def close(self, request, pk=None):
         """Close lead (no sale) and release inventory units back to stock. Only salespersons can close leads."""
-        from django.db import transaction
-
-        from inventory.models import InventoryUnit
-
         lead = self.get_object()
-
-        # Verify user is a salesperson
-        try:
-            admin = Admin.objects.get(user=request.user)
-            if not admin.is_salesperson and not request.user.is_superuser:
-                return Response(
-                    {"error": "Only salespersons can close leads"}, status=status.HTTP_403_FORBIDDEN
-                )
-
-            # Verify salesperson is assigned to this lead or is global admin
-            if not request.user.is_superuser and not admin.is_global_admin:
-                if lead.assigned_salesperson != admin:
-                    return Response(
-                        {"error": "You can only close leads that are assigned to you"},
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
-        except Admin.DoesNotExist:
-            return Response(
-                {"error": "Admin profile not found"}, status=status.HTTP_400_BAD_REQUEST
-            )
+        error = self._lead_salesperson_error(
+            lead,
+            "Only salespersons can close leads",
+            "You can only close leads that are assigned to you",
+        )
+        if error is not None:
+            return error
 
         with transaction.atomic():
             # Update lead status
             lead.status = Lead.StatusChoices.CLOSED
             lead.salesperson_notes = request.data.get("notes", "")
-            lead.save()
-
-            # Free up all inventory units in this lead
-            lead_items = lead.items.all()
-            units_freed = []
+            lead.save(update_fields=["status", "salesperson_notes"])
 
-            for lead_item in lead_items:
-                unit = lead_item.inventory_unit
-                # Only free units that are RESERVED (not already SOLD or AVAILABLE)
-                if unit.sale_status == InventoryUnit.SaleStatusChoices.RESERVED:
-                    unit.sale_status = InventoryUnit.SaleStatusChoices.AVAILABLE
-                    unit.reserved_by = None
-                    unit.reserved_until = None
-                    unit.save()
-                    units_freed.append(unit)
+            # Free up all inventory units in this lead in one UPDATE.
+            # Only free units that are RESERVED (not already SOLD or AVAILABLE)
+            units_freed = InventoryUnit.objects.filter(
+                lead_items__lead=lead,
+                sale_status=InventoryUnit.SaleStatusChoices.RESERVED,
+            ).update(
+                sale_status=InventoryUnit.SaleStatusChoices.AVAILABLE,
+                reserved_by=None,
+                reserved_until=None,
+            )
 
             return Response(
                 {
-                    "message": f"Lead closed. {len(units_freed)} unit(s) released back to stock.",
-                    "units_freed": len(units_freed),
+                    "message": f"Lead closed. {units_freed} unit(s) released back to stock.",
+                    "units_freed": units_freed,
                 }
             )
 
@@ -5760,13 +5707,14 @@ class PromotionTypeViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         return queryset.order_by("display_order", "name")
 
 
-class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
+class PromotionViewSet(_RequestAdminMixin, _SilkProfileMixin, viewsets.ModelViewSet):
     """Promotion management ViewSet (admin, marketing managers, content creators)."""
 
     queryset = Promotion.objects.all()
     serializer_class = PromotionSerializer
     permission_classes = [IsAdminUser | IsMarketingManager | IsContentCreator]
     parser_classes = [MultiPartParser, FormParser, JSONParser]  # Support file uploads
+    admin_prefetch_related = ("roles", "brands")
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -5787,46 +5735,32 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             return queryset
 
         # Filter by admin's assigned brands
-        try:
-            admin = Admin.objects.get(user=user)
-            if admin.is_global_admin:
-                return queryset
-            if admin.brands.exists():
-                queryset = queryset.filter(brand__in=admin.brands.all())
-        except Admin.DoesNotExist:
+        admin = self._get_admin()
+        if admin is None:
             return Promotion.objects.none()
+        if admin.is_global_admin:
+            return queryset
+        brand_ids = self._get_admin_brand_ids()
+        if brand_ids:
+            queryset = queryset.filter(brand_id__in=brand_ids)
 
         return queryset
 
     def perform_create(self, serializer):
         """Set created_by to current admin and validate promotion requirements."""
-        try:
-            admin = Admin.objects.get(user=self.request.user)
-        except Admin.DoesNotExist:
-            admin = None
+        admin = self._get_admin()
+        admin_brand_ids = self._get_admin_brand_ids()
 
         # Validate: require at least one product, featured product, or product_type
         # Handle products from both JSON and FormData
-        if "products" in self.request.data:
-            products = self.request.data.get("products", [])
-            # Handle QueryDict (FormData) format
-            if hasattr(self.request.data, "getlist"):
-                products_list = self.request.data.getlist("products")
-                has_products = len(products_list) > 0 and any(p for p in products_list if p)
-            elif isinstance(products, list):
-                has_products = len(products) > 0
-            else:
-                has_products = bool(products)
-        else:
-            has_products = False
+        product_ids = _promotion_product_ids(self.request.data) or []
+        has_products = bool(product_ids)
 
         featured_product_id = self.request.data.get("featured_product")
         has_featured_product = bool(featured_product_id)
         product_types = self.request.data.get("product_types", "")
 
         if not has_products and not has_featured_product and not product_types:
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError(
                 {
                     "non_field_errors": [
@@ -5840,8 +5774,6 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         discount_amount = self.request.data.get("discount_amount")
 
         if discount_percentage and discount_amount:
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError(
                 {
                     "non_field_errors": [
@@ -5855,61 +5787,34 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         end_date = self.request.data.get("end_date")
 
         if start_date and end_date:
-            from django.utils.dateparse import parse_datetime
-
             start = parse_datetime(start_date)
             end = parse_datetime(end_date)
             if start and end and start >= end:
-                from rest_framework.exceptions import ValidationError
-
                 raise ValidationError({"non_field_errors": ["Start date must be before end date."]})
 
         # Validate: display_locations
         display_locations = self.request.data.get("display_locations", [])
         # Parse JSON string if it comes from FormData
         if isinstance(display_locations, str):
-            import json
-
             try:
-                display_locations = json.loads(display_locations)
-                # Update request.data with parsed value so serializer can use it
-                if hasattr(self.request.data, "_mutable"):
-                    self.request.data._mutable = True
-                self.request.data["display_locations"] = display_locations
-                if hasattr(self.request.data, "_mutable"):
-                    self.request.data._mutable = False
-            except (json.JSONDecodeError, ValueError):
-                from rest_framework.exceptions import ValidationError
-
+                display_locations = orjson.loads(display_locations)
+            except orjson.JSONDecodeError:
                 raise ValidationError(
                     {"display_locations": ["Display locations must be valid JSON."]}
                 )
         if not isinstance(display_locations, list):
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError({"display_locations": ["Display locations must be a list."]})
 
-        # Parse is_active from FormData (handle both string and boolean)
-        if "is_active" in self.request.data:
-            is_active_value = self.request.data["is_active"]
-            if isinstance(is_active_value, str):
-                # Convert string 'true'/'false' to boolean
-                is_active_bool = is_active_value.lower() == "true"
-                if hasattr(self.request.data, "_mutable"):
-                    self.request.data._mutable = True
-                self.request.data["is_active"] = is_active_bool
-                if hasattr(self.request.data, "_mutable"):
-                    self.request.data._mutable = False
-
-        valid_locations = ["stories_carousel", "special_offers", "flash_sales", "homepage_hero"]
-        invalid_locations = [loc for loc in display_locations if loc not in valid_locations]
+        invalid_locations = [
+            str(loc)
+            for loc in display_locations
+            if not isinstance(loc, str) or loc not in _VALID_DISPLAY_LOCATIONS
+        ]
         if invalid_locations:
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError(
                 {
                     "display_locations": [
-                        f"Invalid location(s): {', '.join(invalid_locations)}. Valid options: {', '.join(valid_locations)}."
+                        f"Invalid location(s): {', '.join(invalid_locations)}. Valid options: {', '.join(PROMOTION_DISPLAY_LOCATIONS)}."
                     ]
                 }
             )
@@ -5918,8 +5823,6 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         if "stories_carousel" in display_locations:
             banner_image = self.request.data.get("banner_image")
             if not banner_image and not serializer.instance:
-                from rest_framework.exceptions import ValidationError
-
                 raise ValidationError(
                     {
                         "banner_image": [
@@ -5928,8 +5831,6 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     }
                 )
             elif serializer.instance and not banner_image and not serializer.instance.banner_image:
-                from rest_framework.exceptions import ValidationError
-
                 raise ValidationError(
                     {
                         "banner_image": [
@@ -5938,24 +5839,21 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     }
                 )
 
+        # The serializer has already parsed display_locations and is_active from FormData;
+        # anything resolved here is passed to save() instead of being written into request.data
+        save_kwargs = {"created_by": admin}
+
         # Auto-assign brand if not provided: use admin's single brand, or default to AFFORDABLE_GADGETS when admin has no brands
         brand_id = self.request.data.get("brand")
         default_brand = Brand.objects.filter(code="AFFORDABLE_GADGETS", is_active=True).first()
 
-        if not brand_id and admin and admin.brands.exists() and not admin.is_global_admin:
+        if not brand_id and admin_brand_ids and not admin.is_global_admin:
             # Auto-assign to first brand if admin has only one, or require selection if multiple
-            if admin.brands.count() == 1:
-                brand_id = admin.brands.first().id
-                # Update request.data to include the brand
-                if hasattr(self.request.data, "_mutable"):
-                    self.request.data._mutable = True
-                self.request.data["brand"] = brand_id
-                if hasattr(self.request.data, "_mutable"):
-                    self.request.data._mutable = False
+            if len(admin_brand_ids) == 1:
+                brand_id = admin_brand_ids[0]
+                save_kwargs["brand_id"] = brand_id
             else:
                 # Multiple brands - require explicit selection
-                from rest_framework.exceptions import ValidationError
-
                 raise ValidationError(
                     {
                         "brand": [
@@ -5966,154 +5864,38 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         elif not brand_id and default_brand:
             # Admin has no brands or no admin: default to Affordable Gadgets so the form always has a valid brand
             brand_id = default_brand.id
-            if hasattr(self.request.data, "_mutable"):
-                self.request.data._mutable = True
-            self.request.data["brand"] = brand_id
-            if hasattr(self.request.data, "_mutable"):
-                self.request.data._mutable = False
+            save_kwargs["brand_id"] = brand_id
 
         # Ensure brand is from admin's assigned brands, or the default brand when admin has none (for non-superusers)
         user = self.request.user
         if admin and not admin.is_global_admin and not user.is_superuser:
             if brand_id:
-                if admin.brands.exists():
-                    if not admin.brands.filter(id=brand_id).exists():
-                        from rest_framework.exceptions import PermissionDenied
-
+                if admin_brand_ids:
+                    if int(brand_id) not in admin_brand_ids:
                         raise PermissionDenied(
                             "You can only create promotions for your assigned brands."
                         )
                 else:
                     # Admin with no assigned brands: only allow the default AFFORDABLE_GADGETS brand
                     if not default_brand or int(brand_id) != default_brand.id:
-                        from rest_framework.exceptions import PermissionDenied
-
                         raise PermissionDenied(
                             "You must be assigned to at least one brand to create promotions, or use the default brand."
                         )
 
-        # Promotion code will be auto-generated in model's save() method if not provided
-        # #region agent log
-        import json
-        import os
-
-        from django.core.files.storage import default_storage
-
-        try:
-            with open(
-                "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log",
-                "a",
-            ) as f:
-                storage_type = str(type(default_storage))
-                has_banner = "banner_image" in self.request.data
-                banner_file = self.request.data.get("banner_image")
-                f.write(
-                    json.dumps(
-                        {
-                            "location": "views.py:4200",
-                            "message": "Before promotion save - checking storage and banner_image",
-                            "data": {
-                                "storage_type": storage_type,
-                                "is_cloudinary": "cloudinary" in storage_type.lower(),
-                                "has_banner_image": has_banner,
-                                "banner_image_type": str(type(banner_file))
-                                if banner_file
-                                else None,
-                                "cloudinary_configured": bool(
-                                    os.environ.get("CLOUDINARY_CLOUD_NAME")
-                                ),
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # #endregion
-        promotion_instance = serializer.save(created_by=admin)
-
-        # DEBUG: Log banner image upload status (print to stdout for Render logs)
-        import logging
-
-        logger = logging.getLogger(__name__)
-        if promotion_instance.banner_image:
-            banner_url = promotion_instance.banner_image.url
-            banner_name = promotion_instance.banner_image.name
-            is_cloudinary = "cloudinary.com" in banner_url.lower()
-            storage_type = str(type(default_storage))
-            logger.info(
-                f"DEBUG: Banner image after save - URL: {banner_url}, Name: {banner_name}, IsCloudinary: {is_cloudinary}, Storage: {storage_type}"
-            )
-            print(
-                f"DEBUG: Banner image after save - URL: {banner_url}, Name: {banner_name}, IsCloudinary: {is_cloudinary}, Storage: {storage_type}"
-            )
-        else:
-            logger.info("DEBUG: No banner image after save")
-            print("DEBUG: No banner image after save")
+        # Promotion code will be auto-generated in model's save() method if not provided;
+        # a supplied code is already checked unique by the serializer and goes into the INSERT
+        promotion_instance = serializer.save(**save_kwargs)
 
-        # #region agent log
-        try:
-            with open(
-                "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log",
-                "a",
-            ) as f:
-                banner_url = (
-                    promotion_instance.banner_image.url if promotion_instance.banner_image else None
-                )
-                banner_name = (
-                    promotion_instance.banner_image.name
-                    if promotion_instance.banner_image
-                    else None
-                )
-                f.write(
-                    json.dumps(
-                        {
-                            "location": "views.py:4203",
-                            "message": "After promotion save - banner_image URL",
-                            "data": {
-                                "promotion_id": promotion_instance.id,
-                                "banner_image_url": banner_url,
-                                "banner_image_name": banner_name,
-                                "is_cloudinary_url": "cloudinary.com" in str(banner_url).lower()
-                                if banner_url
-                                else False,
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                        }
-                    )
-                    + "\n"
-                )
-        except Exception:
-            pass
-        # #endregion
+        # Resolving banner_image.url can hit the storage backend, so only the name is logged
+        logger.debug(
+            "Promotion %s saved banner_image=%s storage=%s",
+            promotion_instance.pk,
+            promotion_instance.banner_image.name or None,
+            type(default_storage).__name__,
+        )
 
         # Handle products ManyToMany field (needs to be set after instance is created)
         # Always process products, even if empty (to clear existing associations if needed)
-        product_ids = []
-
-        # Check if products are in request data
-        if "products" in self.request.data:
-            products = self.request.data.get("products", [])
-            # Handle both list and QueryDict (FormData) formats
-            if hasattr(self.request.data, "getlist"):
-                # QueryDict format (from FormData) - getlist returns all values
-                product_ids = [int(p) for p in self.request.data.getlist("products") if p]
-            elif isinstance(products, list):
-                product_ids = [
-                    int(p) if isinstance(p, (int, str)) else (p.id if hasattr(p, "id") else p)
-                    for p in products
-                    if p
-                ]
-            elif products:
-                product_ids = [int(products)] if str(products).isdigit() else []
-
         if featured_product_id and str(featured_product_id).isdigit():
             featured_product_int = int(featured_product_id)
             if featured_product_int not in product_ids:
@@ -6122,119 +5904,69 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         # Set products (empty list clears all products)
         promotion_instance.products.set(product_ids)
 
-        # If promotion_code was provided, ensure it's unique
-        promotion_code = self.request.data.get("promotion_code")
-        if promotion_code:
-            if (
-                Promotion.objects.filter(promotion_code=promotion_code)
-                .exclude(id=promotion_instance.id)
-                .exists()
-            ):
-                from rest_framework.exceptions import ValidationError
-
-                raise ValidationError(
-                    {"promotion_code": ["A promotion with this code already exists."]}
-                )
-            promotion_instance.promotion_code = promotion_code
-            promotion_instance.save()
-
     def perform_update(self, serializer):
         """Allow update for Marketing Managers (full access)."""
         instance = serializer.instance
         user = self.request.user
 
         # #region agent log
-        import json
-        import os
-
-        from django.core.files.storage import default_storage
-
-        try:
-            with open(
-                "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log",
-                "a",
-            ) as f:
+        if _agent_log_enabled():
+            try:
                 storage_type = str(type(default_storage))
-                has_banner = "banner_image" in self.request.data
                 banner_file = self.request.data.get("banner_image")
-                old_banner_url = instance.banner_image.url if instance.banner_image else None
-                f.write(
-                    json.dumps(
-                        {
-                            "location": "views.py:4258",
-                            "message": "Before promotion update - checking storage and banner_image",
-                            "data": {
-                                "promotion_id": instance.id,
-                                "storage_type": storage_type,
-                                "is_cloudinary": "cloudinary" in storage_type.lower(),
-                                "has_banner_image": has_banner,
-                                "banner_image_type": str(type(banner_file))
-                                if banner_file
-                                else None,
-                                "old_banner_url": old_banner_url,
-                                "cloudinary_configured": bool(
-                                    os.environ.get("CLOUDINARY_CLOUD_NAME")
-                                ),
-                            },
-                            "timestamp": int(__import__("time").time() * 1000),
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A",
-                        }
-                    )
-                    + "\n"
+                _write_agent_log(
+                    _AGENT_LOG_PATH,
+                    "views.py:4258",
+                    "Before promotion update - checking storage and banner_image",
+                    {
+                        "promotion_id": instance.id,
+                        "storage_type": storage_type,
+                        "is_cloudinary": "cloudinary" in storage_type.lower(),
+                        "has_banner_image": "banner_image" in self.request.data,
+                        "banner_image_type": str(type(banner_file)) if banner_file else None,
+                        "old_banner_url": instance.banner_image.url
+                        if instance.banner_image
+                        else None,
+                        "cloudinary_configured": bool(os.environ.get("CLOUDINARY_CLOUD_NAME")),
+                    },
                 )
-        except Exception:
-            pass
+            except Exception:
+                pass
         # #endregion
 
         # Superusers and global admins can edit any promotion
         if user.is_superuser:
             promotion_instance = serializer.save()
             # #region agent log
-            try:
-                with open(
-                    "/Users/shwariphones/Desktop/shwari-django/affordable-gadgets-backend/.cursor/debug.log",
-                    "a",
-                ) as f:
+            if _agent_log_enabled():
+                try:
                     banner_url = (
                         promotion_instance.banner_image.url
                         if promotion_instance.banner_image
                         else None
                     )
-                    banner_name = (
-                        promotion_instance.banner_image.name
-                        if promotion_instance.banner_image
-                        else None
-                    )
-                    f.write(
-                        json.dumps(
-                            {
-                                "location": "views.py:4265",
-                                "message": "After promotion update - banner_image URL",
-                                "data": {
-                                    "promotion_id": promotion_instance.id,
-                                    "banner_image_url": banner_url,
-                                    "banner_image_name": banner_name,
-                                    "is_cloudinary_url": "cloudinary.com" in str(banner_url).lower()
-                                    if banner_url
-                                    else False,
-                                },
-                                "timestamp": int(__import__("time").time() * 1000),
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "A",
-                            }
-                        )
-                        + "\n"
+                    _write_agent_log(
+                        _AGENT_LOG_PATH,
+                        "views.py:4265",
+                        "After promotion update - banner_image URL",
+                        {
+                            "promotion_id": promotion_instance.id,
+                            "banner_image_url": banner_url,
+                            "banner_image_name": promotion_instance.banner_image.name
+                            if promotion_instance.banner_image
+                            else None,
+                            "is_cloudinary_url": "cloudinary.com" in str(banner_url).lower()
+                            if banner_url
+                            else False,
+                        },
                     )
-            except Exception:
-                pass
+                except Exception:
+                    pass
             # #endregion
             return
 
-        try:
-            admin = Admin.objects.get(user=user)
+        admin = self._get_admin()
+        if admin is not None:
             if admin.is_global_admin:
                 serializer.save()
                 return
@@ -6243,18 +5975,14 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 # Parse display_locations JSON string if it comes from FormData
                 display_locations = self.request.data.get("display_locations")
                 if display_locations is not None and isinstance(display_locations, str):
-                    import json
-
                     try:
-                        display_locations = json.loads(display_locations)
+                        display_locations = orjson.loads(display_locations)
                         if hasattr(self.request.data, "_mutable"):
                             self.request.data._mutable = True
                         self.request.data["display_locations"] = display_locations
                         if hasattr(self.request.data, "_mutable"):
                             self.request.data._mutable = False
-                    except (json.JSONDecodeError, ValueError):
-                        from rest_framework.exceptions import ValidationError
-
+                    except orjson.JSONDecodeError:
                         raise ValidationError(
                             {"display_locations": ["Display locations must be valid JSON."]}
                         )
@@ -6271,15 +5999,9 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                             self.request.data._mutable = False
 
                 # Validate same requirements as create
-                if "products" in self.request.data:
-                    products = self.request.data.get("products", [])
-                    if hasattr(self.request.data, "getlist"):
-                        products_list = self.request.data.getlist("products")
-                        has_products = len(products_list) > 0 and any(p for p in products_list if p)
-                    elif isinstance(products, list):
-                        has_products = len(products) > 0
-                    else:
-                        has_products = bool(products)
+                product_ids = _promotion_product_ids(self.request.data)
+                if product_ids is not None:
+                    has_products = bool(product_ids)
                 else:
                     has_products = instance.products.exists() if instance else False
 
@@ -6292,8 +6014,6 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 )
 
                 if not has_products and not has_featured_product and not product_types:
-                    from rest_framework.exceptions import ValidationError
-
                     raise ValidationError(
                         {
                             "non_field_errors": [
@@ -6305,23 +6025,7 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                 promotion_instance = serializer.save()
 
                 # Handle products ManyToMany field
-                if "products" in self.request.data:
-                    products = self.request.data.get("products", [])
-                    product_ids = []
-
-                    if hasattr(self.request.data, "getlist"):
-                        product_ids = [int(p) for p in self.request.data.getlist("products") if p]
-                    elif isinstance(products, list):
-                        product_ids = [
-                            int(p)
-                            if isinstance(p, (int, str))
-                            else (p.id if hasattr(p, "id") else p)
-                            for p in products
-                            if p
-                        ]
-                    elif products:
-                        product_ids = [int(products)] if str(products).isdigit() else []
-
+                if product_ids is not None:
                     if featured_product_id and str(featured_product_id).isdigit():
                         featured_product_int = int(featured_product_id)
                         if featured_product_int not in product_ids:
@@ -6330,31 +6034,23 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
                     promotion_instance.products.set(product_ids)
 
                 return
-        except Admin.DoesNotExist:
-            pass
 
         # Fallback for other admin types - check ownership
-        if instance.created_by and instance.created_by.user != user:
-            from rest_framework.exceptions import PermissionDenied
-
+        if instance.created_by_id and instance.created_by_id != getattr(admin, "id", None):
             raise PermissionDenied("You can only edit promotions you created.")
 
         # Parse display_locations JSON string if it comes from FormData (same as in perform_create)
         display_locations = self.request.data.get("display_locations")
         if display_locations is not None and isinstance(display_locations, str):
-            import json
-
             try:
-                display_locations = json.loads(display_locations)
+                display_locations = orjson.loads(display_locations)
                 # Update request.data with parsed value so serializer can use it
                 if hasattr(self.request.data, "_mutable"):
                     self.request.data._mutable = True
                 self.request.data["display_locations"] = display_locations
                 if hasattr(self.request.data, "_mutable"):
                     self.request.data._mutable = False
-            except (json.JSONDecodeError, ValueError):
-                from rest_framework.exceptions import ValidationError
-
+            except orjson.JSONDecodeError:
                 raise ValidationError(
                     {"display_locations": ["Display locations must be valid JSON."]}
                 )
@@ -6373,16 +6069,9 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
 
         # Validate same requirements as create
         # Handle products from both JSON and FormData
-        if "products" in self.request.data:
-            products = self.request.data.get("products", [])
-            # Handle QueryDict (FormData) format
-            if hasattr(self.request.data, "getlist"):
-                products_list = self.request.data.getlist("products")
-                has_products = len(products_list) > 0 and any(p for p in products_list if p)
-            elif isinstance(products, list):
-                has_products = len(products) > 0
-            else:
-                has_products = bool(products)
+        product_ids = _promotion_product_ids(self.request.data)
+        if product_ids is not None:
+            has_products = bool(product_ids)
         else:
             # No products in request, check existing instance
             has_products = instance.products.exists() if instance else False
@@ -6396,8 +6085,6 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
         )
 
         if not has_products and not has_featured_product and not product_types:
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError(
                 {
                     "non_field_errors": [
@@ -6410,23 +6097,7 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
 
         # Handle products ManyToMany field (needs to be set after instance is updated)
         # Always process products if they're in the request
-        if "products" in self.request.data:
-            products = self.request.data.get("products", [])
-            product_ids = []
-
-            # Handle both list and QueryDict (FormData) formats
-            if hasattr(self.request.data, "getlist"):
-                # QueryDict format (from FormData) - getlist returns all values
-                product_ids = [int(p) for p in self.request.data.getlist("products") if p]
-            elif isinstance(products, list):
-                product_ids = [
-                    int(p) if isinstance(p, (int, str)) else (p.id if hasattr(p, "id") else p)
-                    for p in products
-                    if p
-                ]
-            elif products:
-                product_ids = [int(products)] if str(products).isdigit() else []
-
+        if product_ids is not None:
             if featured_product_id and str(featured_product_id).isdigit():
                 featured_product_int = int(featured_product_id)
                 if featured_product_int not in product_ids:
@@ -6444,8 +6115,8 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             instance.delete()
             return
 
-        try:
-            admin = Admin.objects.get(user=user)
+        admin = self._get_admin()
+        if admin is not None:
             if admin.is_global_admin:
                 instance.delete()
                 return
@@ -6453,13 +6124,9 @@ class PromotionViewSet(_SilkProfileMixin, viewsets.ModelViewSet):
             if admin.is_marketing_manager:
                 instance.delete()
                 return
-        except Admin.DoesNotExist:
-            pass
 
         # Fallback for other admin types - check ownership
-        if instance.created_by and instance.created_by.user != user:
-            from rest_framework.exceptions import PermissionDenied
-
+        if instance.created_by_id and instance.created_by_id != getattr(admin, "id", None):
             raise PermissionDenied("You can only delete promotions you created.")
 
         instance.delete()
@@ -6613,15 +6280,11 @@ class PesapalIPNView(APIView):
     def get(self, request):
         print("\n[PESAPAL] ========== VIEW: IPN CALLBACK START ==========")
         print(f"[PESAPAL] Request Method: {request.method}")
-        import json
-
         print(f"[PESAPAL] Request GET Params: {dict(request.GET)}")
         print(f"[PESAPAL] Request IP: {request.META.get('REMOTE_ADDR', 'Unknown')}")
 
         try:
-            from inventory.services.pesapal_payment_service import PesapalPaymentService
-
-            service = PesapalPaymentService()
+            service = _pesapal_service()
 
             order_tracking_id = request.GET.get("OrderTrackingId")
             order_notification_type = request.GET.get("OrderNotificationType")
@@ -6677,8 +6340,6 @@ class PesapalIPNView(APIView):
         except Exception as e:
             print("[PESAPAL] ========== VIEW: IPN CALLBACK EXCEPTION ==========")
             print(f"[PESAPAL] ERROR: {str(e)}")
-            import traceback
-
             print(f"[PESAPAL] Traceback:\n{traceback.format_exc()}")
             print("[PESAPAL] =================================================\n")
             logger.error(f"Error processing Pesapal IPN: {str(e)}", exc_info=True)
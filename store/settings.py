@@ -184,7 +184,7 @@ REST_FRAMEWORK = {
     ],
     # 3. DEFAULT RENDERER:
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "inventory.renderers.ORJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     # 4. PAGINATION:
@@ -192,6 +192,8 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 25,
     # 5. OPENAPI SCHEMA: Use drf-spectacular for automatic schema generation
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # 6. EXCEPTION HANDLER: DRF's default, with an opt-in {"error", "details"} envelope
+    "EXCEPTION_HANDLER": "inventory.exceptions.exception_handler",
 }
 
 # Internationalization
@@ -462,6 +464,9 @@ PESAPAL_API_TIMEOUT = int(os.environ.get("PESAPAL_API_TIMEOUT", "30"))
 PESAPAL_MAX_RETRIES = int(os.environ.get("PESAPAL_MAX_RETRIES", "3"))
 PESAPAL_RETRY_DELAY = int(os.environ.get("PESAPAL_RETRY_DELAY", "2"))
 PESAPAL_LOG_PATH = os.environ.get("PESAPAL_LOG_PATH", "/tmp/pesapal_debug.log")
+# Developer debug-session logs (inventory.views agent log). Always on under DEBUG;
+# set AGENT_DEBUG_LOG=true to collect them with DEBUG off.
+AGENT_DEBUG_LOG = os.environ.get("AGENT_DEBUG_LOG", "false").lower() == "true"
 
 # --- Email Configuration ---
 # Frontend base URL for email verification links